@@ -1,20 +1,30 @@
 import turtle
-import random
 import time
+import argparse
+from maze_engine import MazeGrid, GENERATORS, generate, WALL, PASSAGE, OUTSIDE, OUT, MOVE_DIRECTIONS
+from maze_render import TileRenderer
+from maze_solver import MazeSolver
+from maze_format import MazeFile, save_maze, load_maze
+from maze_profile import timed, phase, count, sample
 
 class Player:
     '''Represents the player going through the maze'''
 
-    def __init__(self, maze):
-        '''Player(maze) -> Player
+    @timed("Player.__init__")
+    def __init__(self, maze, moveSeconds=0.15, frameSeconds=1/60, maxMoves=3):
+        '''Player(maze,[moveSeconds],[frameSeconds],[maxMoves]) -> Player
         creates the player for maze
-        maze: Maze'''
+        maze: Maze
+        moveSeconds: float time each move takes (default 0.15)
+        frameSeconds: float time between frames while moving (default 1/60)
+        maxMoves: int most keys that can wait to be moved (default 3)'''
         # get maze info
         self.blockSize = maze.get_block_size()
         self.width = maze.get_width()
         self.maze = maze
-        self.barriars = maze.get_barriars()
-        self.emptyBlocks = maze.get_empty_blocks() # get empty list
+        self.moveSeconds = moveSeconds
+        self.frameSeconds = frameSeconds
+        self.maxMoves = maxMoves
         
         # set up turtle
         self.t = turtle.Turtle()
@@ -26,9 +36,9 @@ class Player:
         self.t.seth(90)
 
         # put in start position
-        start = self.maze.block_to_coord(
-            self.maze.coord_to_block(-(self.width - 2) * self.blockSize / 2,-(self.width - 2) * self.blockSize / 2))
-        self.t.goto(start)
+        self.cell = self.maze.get_start()
+        self.offsets = self.maze.get_offsets()
+        self.t.goto(self.maze.cell_to_coord(self.cell))
         self.t.pd()
 
         # get screen info
@@ -36,93 +46,146 @@ class Player:
             self.width * self.blockSize + 600)
         self.windowWidth, self.windowHeight = self.t.screen.screensize()
         self.canvas = self.t.screen.getcanvas()
+        self.maze.update_view()
         
         self.moving = False # tells if moving or not
         self.isWon = False # tells if game is won
-        self.t.screen.update()
+
+        # turtle for drawing hints
+        self.hint = turtle.Turtle()
+        self.hint.speed(0)
+        self.hint.ht()
+        self.hint.pu()
+        self.hint.color("yellow")
+        self.hint.pensize(self.blockSize / 5)
+        self.isHintShown = False
+
+        # moves are animated by a timer, one frame each tick
+        self.moves = []       # (direction,key time) of keys waiting to be moved
+        self.move = None      # (direction,key time) of the move being animated
+        self.moveStart = 0    # time the move began
+        self.moveFrom = None  # x,y the move began at
+
+        # names move latency and frame times are sampled under
+        size = "%d wide, %d px blocks" % (self.width,self.blockSize)
+        self.latencyName = "move latency (" + size + ")"
+        self.frameName = "frame time (" + size + ")"
+        with phase("first screen.update"):
+            self.t.screen.update()
 
     def can_move(self):
-        '''Player.can_move() -> list
-        returns a list containing all the directions play can move'''
-        directions = [] # initialize output list
-        blockX,blockY = self.t.pos() # get position
-
-        # get passages
-        up = self.maze.coord_to_block(blockX,blockY + self.blockSize)
-        right = self.maze.coord_to_block(blockX + self.blockSize,blockY)
-        down = self.maze.coord_to_block(blockX,blockY - self.blockSize)
-        left = self.maze.coord_to_block(blockX - self.blockSize,blockY)
-        passageList = [up,right,down,left]
-
-        for index in range(4): # look through passage indexes
-            passage = passageList[index]
-
-            # if passage way in maze or not blocked area out of maze
-            if passage in self.emptyBlocks or \
-                 (maze.is_out(passage) and passage not in self.barriars):
-                directions.append(index)
-            
-        return directions        
+        '''Player.can_move() -> tuple
+        returns a tuple containing all the directions play can move'''
+        return self.maze.get_directions(self.cell)
         
+    def add_move(self,direction):
+        '''Player.add_move(direction)
+        adds a move one block in direction after the moves waiting, and
+        starts animating if the player is still
+        keys pressed while maxMoves moves are waiting are ignored
+        direction: int (up: 0, right: 1, down: 2, left: 3)'''
+        if len(self.moves) == self.maxMoves:
+            count("keys dropped, too many moves waiting")
+            return
+        self.moves.append((direction,time.perf_counter()))
+        if not self.moving:
+            self.moving = True
+            self.moveStart = time.perf_counter()
+            self.start_move()
+            self.tick()
+
+    def start_move(self):
+        '''Player.start_move()
+        takes the next move the player can make off the moves waiting
+        moves into walls are skipped, and if none are left the player
+        stops'''
+        self.move = None
+        while self.move == None and len(self.moves) > 0:
+            direction,keyTime = self.moves.pop(0)
+            if direction in self.can_move():
+                self.move = (direction,keyTime)
+                self.moveFrom = self.t.pos()
+                self.cell += self.offsets[direction]
+
+    def tick(self):
+        '''Player.tick()
+        draws a frame of the move at the point the time has reached, then
+        asks for the next frame a frame budget from when this one began
+        moves are timed by the clock, so their speed doesn't depend on
+        blockSize or on how long each frame takes'''
+        frameTime = time.perf_counter()
+        # finish the moves whose time is up
+        while self.move != None and frameTime - self.moveStart >= self.moveSeconds:
+            self.go_to_move(1)
+            self.check_win()
+            sample(self.latencyName,time.perf_counter() - self.move[1])
+            self.moveStart += self.moveSeconds # the next move carries on from here
+            self.start_move()
+        if self.move != None:
+            self.go_to_move((frameTime - self.moveStart) / self.moveSeconds)
+
+        # move with screen
+        self.canvas.xview_moveto((self.t.xcor() + self.windowWidth/2 - 300) / self.windowWidth)
+        self.canvas.yview_moveto(1 - (self.t.ycor() + self.windowHeight/2 + 300) / self.windowHeight)
+        self.maze.update_view()
+        self.t.screen.update()
+        frameCost = time.perf_counter() - frameTime
+        sample(self.frameName,frameCost)
+
+        if self.move == None: # no moves left
+            self.moving = False
+            return
+        # wait out the rest of the frame budget
+        self.t.screen.ontimer(self.tick,max(int(1000 * (self.frameSeconds - frameCost)),0))
+
+    def go_to_move(self,progress):
+        '''Player.go_to_move(progress)
+        puts the player part of the way through the move
+        progress: float from 0 (the start) to 1 (the next block)'''
+        stepX,stepY = ((0,1),(1,0),(0,-1),(-1,0))[self.move[0]]
+        distance = self.blockSize * progress
+        self.t.goto(self.moveFrom[0] + stepX * distance,self.moveFrom[1] + stepY * distance)
+
+    @timed("Player.go_up")
     def go_up(self):
         '''Player.go_up()
         moves the player up'''
-        if not self.moving and 0 in self.can_move():
-            self.moving = True
-            # move with screen
-            for i in range(self.blockSize):
-                self.t.sety(self.t.ycor() + 1)
-                self.canvas.xview_moveto((self.t.xcor() + self.windowWidth/2 - 300) / self.windowWidth)
-                self.canvas.yview_moveto(1 - (self.t.ycor() + self.windowHeight/2 + 300) / self.windowHeight)
-                self.t.screen.update()
-            self.moving = False
-            self.check_win()
-            self.t.screen.update()
+        self.add_move(0)
 
+    @timed("Player.go_right")
     def go_right(self):
         '''Player.got_right()
         moves the player to the right'''
-        if not self.moving and 1 in self.can_move():
-            self.moving = True
-            # move with screen
-            for i in range(self.blockSize):
-                self.t.setx(self.t.xcor() + 1)
-                self.canvas.xview_moveto((self.t.xcor() + self.windowWidth/2 - 300) / self.windowWidth)
-                self.canvas.yview_moveto(1 - (self.t.ycor() + self.windowHeight/2 + 300) / self.windowHeight)
-                self.t.screen.update()
-            self.moving = False
-            self.check_win()
-            self.t.screen.update()
+        self.add_move(1)
 
+    @timed("Player.go_down")
     def go_down(self):
         '''Player.go_down()
         moves the player down'''
-        if not self.moving and 2 in self.can_move():
-            self.moving = True
-            # move with screen
-            for i in range(self.blockSize):
-                self.t.sety(self.t.ycor() - 1)
-                self.canvas.xview_moveto((self.t.xcor() + self.windowWidth/2 - 300) / self.windowWidth)
-                self.canvas.yview_moveto(1 - (self.t.ycor() + self.windowHeight/2 + 300) / self.windowHeight)
-                self.t.screen.update()
-            self.moving = False
-            self.check_win()
-            self.t.screen.update()
+        self.add_move(2)
 
+    @timed("Player.go_left")
     def go_left(self):
         '''Player.go_left()
         moves the player to the left'''
-        if not self.moving and 3 in self.can_move():
-            self.moving = True
-            # move with screen
-            for i in range(self.blockSize):
-                self.t.setx(self.t.xcor() - 1)
-                self.canvas.xview_moveto((self.t.xcor() + self.windowWidth/2 - 300) / self.windowWidth)
-                self.canvas.yview_moveto(1 - (self.t.ycor() + self.windowHeight/2 + 300) / self.windowHeight)
-                self.t.screen.update()
-            self.moving = False
-            self.check_win()
-            self.t.screen.update()
+        self.add_move(3)
+
+    def show_hint(self,numSteps=10):
+        '''Player.show_hint([numSteps])
+        draws the next numSteps steps of the shortest way out of the maze,
+        or takes the hint away if it is showing
+        numSteps: int (default 10)'''
+        self.hint.clear()
+        self.isHintShown = not self.isHintShown
+        if self.isHintShown:
+            cell = self.cell
+            self.hint.goto(self.maze.cell_to_coord(cell))
+            self.hint.pd()
+            for direction in self.maze.get_solver().get_steps(cell,numSteps):
+                cell += self.offsets[direction]
+                self.hint.goto(self.maze.cell_to_coord(cell))
+            self.hint.pu()
+        self.t.screen.update()
 
     def pen_control(self):
         '''Player.pen_control()
@@ -136,17 +199,16 @@ class Player:
         '''Player.check_win()
         checks if player has won and displays message'''
         x,y = self.t.pos()                                                # record current position
-        if self.maze.is_out(self.maze.coord_to_block(x,y)) and not self.isWon:
+        if self.maze.is_out(self.cell) and not self.isWon:
             self.t.pu()                                                   # lift pen
             size = 2 * self.blockSize                                     # font size
             self.t.color("yellow")
             
-            self.moving = True
-            self.t.goto(self.maze.block_to_coord(self.emptyBlocks[-1]))   # go to place for text
+            # called from tick, so no keys are moved while writing
+            self.t.goto(self.maze.get_end())                              # go to place for text
             self.t.sety(self.t.ycor() + 4 * self.blockSize)               # go up a little
             self.t.write("You win!",False,"center",("Arial",size,"bold")) # write message
             self.t.goto(x,y)
-            self.moving = False
             
             self.t.color("red")
             self.isWon = True                                             # game is won
@@ -154,122 +216,145 @@ class Player:
 class Maze:
     '''Represents the maze the player is going through'''
 
-    def __init__(self, width, blockSize, color):
-        '''Maze(width,blockSize) -> Maze
+    @timed("Maze.__init__")
+    def __init__(self, width, blockSize, color, algorithm="growing-tree", seed=None, mazeFile=None):
+        '''Maze(width,blockSize,color,[algorithm],[seed],[mazeFile]) -> Maze
         creates and randomly generates a maze with dimensions width x width
         and blocks blockSize in width
         width: int telling the num blocks in width. Must be an odd number
         blockSize: int telling the width of each block
-        color: the color of the passage ways'''
+        color: the color of the passage ways
+        algorithm: str name of the algorithm in GENERATORS to generate with
+        seed: int seed so the maze repeats, or None
+        mazeFile: str name of a saved maze to load instead of generating
+            one, or None. It must be made for width'''
         # initialize given info
         self.width = width
         self.blockSize = blockSize
+        self.algorithm = algorithm
+        self.seed = seed
+        self.mazeFile = mazeFile
+        self.color = color
 
-        # initialize turtle for drawing
+        # initialize turtle for writing
         self.t = turtle.Turtle()
         self.t.speed(0)
         self.t.ht()
         self.t.pu()
         self.t.color(color)
-        self.t.shapesize(self.blockSize / 20)
-        self.t.shape("square")
 
-        # set up lists of blocks
-        self.emptyBlocks = [self.coord_to_block(self.width * self.blockSize / 2 - 2 * self.blockSize,
-            self.width * self.blockSize / 2 - self.blockSize)] # blocks player can go through with end blocks
-        self.blocksWithPassages = []                           # blocks to draw from
-        self.barriars = []                                     # blocks player can't go through
+        # set up board of cell states with a wall around the edge
+        self.boardWidth = self.width + 2 * (600 // (2 * self.blockSize)) + 4
+        self.center = self.boardWidth // 2 # row and column of the cell at (0,0)
+        self.board = MazeGrid(self.boardWidth,self.boardWidth)
+        self.board.fill(1,1,self.boardWidth - 2,self.boardWidth - 2,OUTSIDE)
+
+        # rows and columns covered by the maze
+        self.mazeTop = self.center - self.width // 2
+        self.mazeBottom = self.center + self.width // 2
+        self.mazeLeft = self.center - self.width // 2
+        self.mazeRight = self.center + self.width // 2
+        self.board.fill(self.mazeTop,self.mazeLeft,self.mazeRight - self.mazeLeft + 1,
+            self.mazeBottom - self.mazeTop + 1,WALL)
+
+        # start and end cells
+        self.startCell = self.board.index(self.mazeBottom - 1,self.mazeLeft + 1)
+        self.endCell = self.board.index(self.mazeTop,self.mazeRight - 1)
 
         # write end message and create maze
         self.generate_maze()
-        self.t.goto(self.block_to_coord(self.emptyBlocks[-1]))
+        self.draw_board()
+        self.t.goto(self.get_end())
         self.t.sety(self.t.ycor() + self.blockSize)
         self.t.write(" End",False,"center",("Arial",self.blockSize + 4,"normal"))
 
-    def block_to_coord(self,blockNum):
-        '''Maze.block_to_coord(blockNum) -> tuple containing the x and y coordinates
-        returns the corrisponding coordinate of a block
-        if block not in maze, returns None
-        blockNum: int'''
-        width = self.width + 2 * (600 // (2 * self.blockSize)) + 4
-
-        # if out of maze
-        if blockNum == None:
-            return None
-        elif blockNum < -width ** 2 // 2 or blockNum > width ** 2 // 2:
-            return
-
-        blockNum += width ** 2 // 2 # bring up for computation
-        x = (blockNum % width + 0.5 - width / 2) * self.blockSize
-        y = (blockNum // width + 0.5 - width / 2) * self.blockSize
-        return x,y  
-            
-    def coord_to_block(self,x,y):
-        '''maze.coord_to_block(x,y) -> int that is the block number
-        returns the block number that point (x,y) is in
-        if point not in maze, returns None
+    def cell_to_coord(self,cell):
+        '''Maze.cell_to_coord(cell) -> tuple containing the x and y coordinates
+        returns the coordinates of the center of cell
+        cell: int index of a cell on the board'''
+        row,col = divmod(cell,self.boardWidth)
+        return (col - self.center) * self.blockSize,(self.center - row) * self.blockSize
+
+    def coord_to_cell(self,x,y):
+        '''Maze.coord_to_cell(x,y) -> int index of a cell on the board
+        returns the cell that point (x,y) is in
+        if point not on the board, returns None
         x,y: int'''
-        width = self.width + 2 * (600 // (2 * self.blockSize)) + 4
-                        
-        # translate the coords into the first quadrant
-        newX = x + width * self.blockSize / 2
-        newY = y + width * self.blockSize / 2
-
-        # not in maze
-        if newX >= width * self.blockSize or newX < 0 or newY >= width * self.blockSize or newY < 0:
-           return
-
-        # output for in maze
-        output = newX // self.blockSize + (newY // self.blockSize) * width - width ** 2 // 2
-        return output
-
-    def is_out(self,blockNum):
-        '''Maze.is_out(blockNum) -> boolean
-        returns True if blockNum is out of the maze. Else returns False
-        blockNum: int'''
-        if blockNum == None: # out of board
-            return True
-        x,y = self.block_to_coord(blockNum)
-        if x > (self.width) * self.blockSize / 2 or x < -(self.width) * self.blockSize / 2 or \
-              y > (self.width) * self.blockSize / 2 or y < -(self.width) * self.blockSize / 2: # out of maze
+        col = self.center + int((x + self.blockSize / 2) // self.blockSize)
+        row = self.center - int((y + self.blockSize / 2) // self.blockSize)
+        if not self.board.in_grid(row,col): # not on board
+            return None
+        return self.board.index(row,col)
+
+    def get_state(self,cell):
+        '''Maze.get_state(cell) -> int
+        returns the state of cell (WALL, PASSAGE, OUTSIDE or BARRIAR)
+        cells off the board are WALL
+        cell: int'''
+        if cell == None: # off the board
+            return WALL
+        return self.board.get_state(cell)
+
+    def can_enter(self,cell):
+        '''Maze.can_enter(cell) -> boolean
+        returns True if the player can go on cell. Else returns False
+        cell: int'''
+        return self.get_state(cell) in (PASSAGE,OUTSIDE)
+
+    def is_out(self,cell):
+        '''Maze.is_out(cell) -> boolean
+        returns True if cell is out of the maze. Else returns False
+        cell: int'''
+        if cell == None: # out of board
             return True
-        return False # in maze
-
-    def check_passage(self,blockNumList):
-        '''Maze.check_passage(blockNumList) -> boolean
-        returns True if the block numbers in blockNumList make a valid passage. Else returns False
-        blockNumList: list'''
-        for blockNum in blockNumList:
-            if self.is_out(blockNum) or blockNum in self.emptyBlocks:
-                return False
-        return True
-    
-    def check_passages(self,blockNum):
-        '''Maze.check_passages(blockNum) -> list all passages from blockNum
-        blockNum: int'''
-        blockX,blockY = self.block_to_coord(blockNum) # get the coords of blockNum
-        availablePassages = [] # initialize availablePassages
-
-        # get passages
-        up = [self.coord_to_block(blockX,blockY + self.blockSize),
-           self.coord_to_block(blockX,blockY + 2 * self.blockSize)]
-        right = [self.coord_to_block(blockX + self.blockSize,blockY),
-           self.coord_to_block(blockX + 2 * self.blockSize,blockY)]
-        left = [self.coord_to_block(blockX,blockY - self.blockSize),
-           self.coord_to_block(blockX,blockY - 2 * self.blockSize)]
-        down = [self.coord_to_block(blockX - self.blockSize,blockY),
-           self.coord_to_block(blockX - 2 * self.blockSize,blockY)]
-        
-        # loop through passages
-        for passage in [up,right,left,down]:
-            if self.check_passage(passage):
-                availablePassages.append(passage)
-        return availablePassages
-
-    def get_empty_blocks(self):
-        '''Maze.get_empty_blocks() -> list
-        returns a list containing all empty blocks'''
-        return self.emptyBlocks
+        return self.moveTable[cell] & OUT != 0
+
+    def get_grid(self):
+        '''Maze.get_grid() -> MazeGrid
+        returns the maze as it was generated or loaded, without the
+        board around it'''
+        return self.grid
+
+    def update_moves(self):
+        '''Maze.update_moves()
+        works out the directions the player can go from each cell and
+        which cells are out of the maze, so can_move and is_out are one
+        lookup. Called again whenever cells change state'''
+        self.moveTable = self.board.get_moves((PASSAGE,OUTSIDE),
+            (self.mazeTop,self.mazeLeft,self.mazeBottom,self.mazeRight))
+        self.solver = None # its paths are out of date
+
+    def get_solver(self):
+        '''Maze.get_solver() -> MazeSolver
+        returns a solver for the way out of the maze, made the first time
+        it's asked for and kept until the cells change'''
+        if self.solver == None:
+            goals = [cell for cell,cellMoves in enumerate(self.moveTable) if cellMoves & OUT]
+            self.solver = MazeSolver(self.moveTable,self.board.get_offsets(),goals)
+        return self.solver
+
+    def get_moves(self):
+        '''Maze.get_moves() -> bytearray
+        returns the moves table: a byte for each cell of the board with bit
+        1 << direction set if the player can go that way and OUT set if
+        the cell is out of the maze'''
+        return self.moveTable
+
+    def get_directions(self,cell):
+        '''Maze.get_directions(cell) -> tuple
+        returns the directions the player can go from cell
+        cell: int'''
+        return MOVE_DIRECTIONS[self.moveTable[cell]]
+
+    def get_offsets(self):
+        '''Maze.get_offsets() -> tuple
+        returns the cell offsets to go up, right, down and left'''
+        return self.board.get_offsets()
+
+    def get_start(self):
+        '''Maze.get_start() -> int
+        returns the cell the player starts on'''
+        return self.startCell
 
     def get_block_size(self):
         '''Maze.get_block_size() -> int
@@ -281,70 +366,77 @@ class Maze:
         returns an int rperesenting the width of the board'''
         return self.width
 
-    def get_barriars(self):
-        '''Maze.get_width() -> int
-        returns a list containing all the barriar numbers'''
-        return self.barriars
+    def get_end(self):
+        '''Maze.get_end() -> x,y
+        returns the x and y coordinates of the end block'''
+        return self.cell_to_coord(self.endCell)
 
+    @timed("Maze.generate_maze")
     def generate_maze(self):
         '''Maze.generate_maze()
         generates a maze using width'''
         # write message
         self.t.write("Generating Maze",False,"center",("Arial",50,"italic"))
-        # find first block
-        randomX = random.randrange(0,self.width - 2,2) * self.blockSize # get random x-cor
-        randomY = random.randrange(0,self.width - 2,2) * self.blockSize # get random y-cor
-        startBlock = self.coord_to_block(-self.width * self.blockSize / 2 + self.blockSize + randomX,
-             -self.width * self.blockSize / 2 + self.blockSize + randomY)
-        self.emptyBlocks.append(startBlock)
-        self.blocksWithPassages.append(startBlock)
-
-        # loop until maze is done
-        while len(self.blocksWithPassages) != 0:
-            # generate maze
-            randomBlock = random.choice(self.blocksWithPassages)
-            randomPassage = random.choice(self.check_passages(randomBlock))
-            for blockToDraw in randomPassage:
-                self.emptyBlocks.append(blockToDraw)
-
-            # add new position to list
-            self.blocksWithPassages.append(blockToDraw)
-
-            # get block coords
-            blockX,blockY = self.block_to_coord(blockToDraw) 
-            # remove used blocks from list
-            for x in (blockX - 2 * self.blockSize,
-                      blockX, blockX + 2 * self.blockSize):
-                for y in (blockY - 2 * self.blockSize,
-                      blockY, blockY + 2 * self.blockSize):
-                    block = self.coord_to_block(x,y)
-                    if len(self.check_passages(block)) == 0 and block in self.blocksWithPassages:
-                        self.blocksWithPassages.remove(block)
-                    
-        # draw maze
-        self.t.clear()
-        self.emptyBlocks.sort()
-        for block in self.emptyBlocks:
-            self.t.goto(self.block_to_coord(block))
-            self.t.stamp()
-            
-turtle.tracer(0)
-wn = turtle.Screen()
-wn.bgcolor('black')
-wn.title("Maze")
-
-# change this to change the size of the maze
-# the width of the maze must be odd
-maze = Maze(101,40,'white')
-player = Player(maze)
-
-wn.onkeypress(player.go_up,"Up")
-wn.onkeypress(player.go_right,"Right")
-wn.onkeypress(player.go_down,"Down")
-wn.onkeypress(player.go_left,"Left")
-wn.onkeypress(player.pen_control,"space")
-wn.listen()
-
-
-    
 
+        with phase("generate"):
+            if self.mazeFile != None:
+                self.grid = load_maze(self.mazeFile)
+                if self.grid.get_width() != self.width or self.grid.get_height() != self.width:
+                    raise ValueError(self.mazeFile + " is not a maze for this width")
+            else:
+                self.grid = generate(self.algorithm,self.width,self.width,self.seed)
+            self.board.paste(self.grid,self.mazeTop,self.mazeLeft)
+        self.board.set_state(self.endCell,PASSAGE)
+        self.update_moves()
+
+    @timed("Maze.update_view")
+    def update_view(self):
+        '''Maze.update_view()
+        draws the parts of the maze that came into view'''
+        self.renderer.update()
+
+    @timed("Maze.draw_board")
+    def draw_board(self):
+        '''Maze.draw_board()
+        draws the passages of the maze as a few tile images'''
+        self.t.clear()
+        self.renderer = TileRenderer(self.t.screen,self.board,self.blockSize,self.center,
+            {PASSAGE: self.color})
+        self.renderer.update()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Find your way through a maze")
+    parser.add_argument("--algorithm",choices=GENERATORS,default="growing-tree",
+        help="algorithm to generate the maze with")
+    parser.add_argument("--seed",type=int,default=None,
+        help="seed so the same maze comes up again")
+    parser.add_argument("--load",help="saved maze file to play instead of generating one")
+    parser.add_argument("--save",help="file to save the maze to")
+    args = parser.parse_args()
+
+    turtle.tracer(0)
+    wn = turtle.Screen()
+    wn.bgcolor('black')
+    wn.title("Maze")
+
+    # change this to change the size of the maze
+    # the width of the maze must be odd
+    width = 101
+    algorithm,seed = args.algorithm,args.seed
+    if args.load != None: # the saved maze decides the width
+        with MazeFile(args.load) as mazeFile:
+            width = mazeFile.get_width()
+            # kept when it's saved again
+            algorithm,seed = mazeFile.get_algorithm(),mazeFile.get_seed()
+    maze = Maze(width,40,'white',algorithm,seed,args.load)
+    if args.save != None:
+        save_maze(args.save,maze.get_grid(),algorithm,seed)
+    player = Player(maze)
+
+    wn.onkeypress(player.go_up,"Up")
+    wn.onkeypress(player.go_right,"Right")
+    wn.onkeypress(player.go_down,"Down")
+    wn.onkeypress(player.go_left,"Left")
+    wn.onkeypress(player.pen_control,"space")
+    wn.onkeypress(player.show_hint,"h")
+    wn.listen()
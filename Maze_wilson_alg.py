@@ -1,10 +1,16 @@
 import turtle
-import random
 import time
+import argparse
+from maze_engine import MazeGrid, GENERATORS, generate, WALL, PASSAGE, OUTSIDE, OUT, MOVE_DIRECTIONS
+from maze_render import TileRenderer
+from maze_solver import MazeSolver
+from maze_format import MazeFile, save_maze, load_maze
+from maze_profile import timed, phase
 
 class Player:
     '''Represents the player going through the maze'''
 
+    @timed("Player.__init__")
     def __init__(self, maze, penColor):
         '''Player(maze) -> Player
         creates the player for maze
@@ -13,8 +19,6 @@ class Player:
         self.blockSize = maze.get_block_size()
         self.width = maze.get_width()
         self.maze = maze
-        self.barriars = maze.get_barriars()
-        self.emptyBlocks = maze.get_empty_blocks() # get empty list
         
         # set up turtle
         self.color = penColor
@@ -27,78 +31,95 @@ class Player:
         self.t.seth(90)
 
         # put in start position
-        start = self.maze.block_to_coord(
-            self.maze.coord_to_block(-(self.width) * self.blockSize / 2,-(self.width + 2) * self.blockSize / 2))
-        self.t.goto(start)
+        self.cell = self.maze.get_start()
+        self.offsets = self.maze.get_offsets()
+        self.t.goto(self.maze.cell_to_coord(self.cell))
         self.t.pd()
         
         self.moving = False # tells if moving or not
         self.isWon = False # tells if game is won
-        self.t.screen.update()
+
+        # turtle for drawing hints
+        self.hint = turtle.Turtle()
+        self.hint.speed(0)
+        self.hint.ht()
+        self.hint.pu()
+        self.hint.color("yellow")
+        self.hint.pensize(self.blockSize / 5)
+        self.isHintShown = False
+        with phase("first screen.update"):
+            self.t.screen.update()
 
     def can_move(self):
-        '''Player.can_move() -> list
-        returns a list containing all the directions play can move'''
-        directions = [] # initialize output list
-        blockX,blockY = self.t.pos() # get position
-
-        # get passages
-        up = self.maze.coord_to_block(blockX,blockY + self.blockSize)
-        right = self.maze.coord_to_block(blockX + self.blockSize,blockY)
-        down = self.maze.coord_to_block(blockX,blockY - self.blockSize)
-        left = self.maze.coord_to_block(blockX - self.blockSize,blockY)
-        passageList = [up,right,down,left]
-
-        for index in range(4): # look through passage indexes
-            passage = passageList[index]
-
-            # if passage way in maze or not blocked area out of maze
-            if passage in self.emptyBlocks or \
-                 (maze.is_out(passage) and passage not in self.barriars):
-                directions.append(index)
-            
-        return directions        
+        '''Player.can_move() -> tuple
+        returns a tuple containing all the directions play can move'''
+        return self.maze.get_directions(self.cell)
         
+    @timed("Player.go_up")
     def go_up(self):
         '''Player.go_up()
         moves the player up'''
         if not self.moving and 0 in self.can_move():
             self.moving = True
+            self.cell += self.offsets[0]
             self.t.sety(self.t.ycor() + self.blockSize)
             self.moving = False
             self.check_win()
             self.t.screen.update()
 
+    @timed("Player.go_right")
     def go_right(self):
         '''Player.got_right()
         moves the player to the right'''
         if not self.moving and 1 in self.can_move():
             self.moving = True
+            self.cell += self.offsets[1]
             self.t.setx(self.t.xcor() + self.blockSize)
             self.moving = False
             self.check_win()
             self.t.screen.update()
 
+    @timed("Player.go_down")
     def go_down(self):
         '''Player.go_down()
         moves the player down'''
         if not self.moving and 2 in self.can_move():
             self.moving = True
+            self.cell += self.offsets[2]
             self.t.sety(self.t.ycor() - self.blockSize)
             self.moving = False
             self.check_win()
             self.t.screen.update()
 
+    @timed("Player.go_left")
     def go_left(self):
         '''Player.go_left()
         moves the player to the left'''
         if not self.moving and 3 in self.can_move():
             self.moving = True
+            self.cell += self.offsets[3]
             self.t.setx(self.t.xcor() - self.blockSize)
             self.moving = False
             self.check_win()
             self.t.screen.update()
 
+    def show_hint(self,numSteps=10):
+        '''Player.show_hint([numSteps])
+        draws the next numSteps steps of the shortest way out of the maze,
+        or takes the hint away if it is showing
+        numSteps: int (default 10)'''
+        self.hint.clear()
+        self.isHintShown = not self.isHintShown
+        if self.isHintShown:
+            cell = self.cell
+            self.hint.goto(self.maze.cell_to_coord(cell))
+            self.hint.pd()
+            for direction in self.maze.get_solver().get_steps(cell,numSteps):
+                cell += self.offsets[direction]
+                self.hint.goto(self.maze.cell_to_coord(cell))
+            self.hint.pu()
+        self.t.screen.update()
+
     def pen_control(self):
         '''Player.pen_control()
         pen up or pen down according to what is current'''
@@ -111,13 +132,13 @@ class Player:
         '''Player.check_win()
         checks if player has won and displays message'''
         x,y = self.t.pos()                                                # record current position
-        if self.maze.is_out(self.maze.coord_to_block(x,y)) and not self.isWon:
+        if self.maze.is_out(self.cell) and not self.isWon:
             self.t.pu()                                                   # lift pen
             size = 2 * self.blockSize                                     # font size
             self.t.color("yellow")
             
             self.moving = True
-            self.t.goto(self.maze.block_to_coord(self.emptyBlocks[-1]))   # go to place for text
+            self.t.goto(self.maze.get_end())                              # go to place for text
             self.t.sety(self.t.ycor() + 4 * self.blockSize)               # go up a little
             self.t.write("You win!",False,"center",("Arial",size,"bold")) # write message
             self.t.goto(x,y)
@@ -126,240 +147,148 @@ class Player:
             self.t.color(self.color)
             self.isWon = True                                             # game is won
 
-## Begin Section Added by CaptainFlint ##
-            
-class WilsonMazeGenerator:
-    """Maze Generator using Wilson's Loop Erased Random Walk Algorithm"""
-
-    def __init__(self,width,height):
-        """WilsonMazeGenerator(int,int) -> WilsonMazeGenerator
-        Creates a maze generator with specified width and height.
-        width: width of generated mazes
-        height: height of generated mazes"""        
-        self.width = 2*(width//2) + 1   # Make width odd
-        self.height = 2*(height//2) + 1 # Make height odd
-
-        # grid of cells
-        self.grid = [[0 for i in range(self.width)] for j in range(self.height)]
-
-        # declare instance variable
-        self.visited = []    # visited cells
-        self.unvisited = []  # unvisited cells
-        self.path = dict()   # random walk path
-
-        # valid directions in random walk
-        self.directions = [(0,1),(1,0),(0,-1),(-1,0)]
-
-    def __str__(self):
-        """WilsonMazeGenerator.__str__() -> str
-        outputs a string version of the grid"""
-        out = ""
-        for i in range(self.height):
-            for j in range(self.width):
-                out += str(self.grid[i][j])
-                out += " "
-            out += "\n"
-        return out
-
-    def get_grid(self):
-        """WilsonMazeGenerator.get_grid() -> list
-        returns the maze grid"""
-        return self.grid
-
-    def get_next_cell(self,cell,dirNum,fact):
-        """WilsonMazeGenerator.get_next_cell(tuple,int,int) -> tuple
-        Outputs the next cell when moved a distance fact in the the
-        direction specified by dirNum from the initial cell.
-        cell: tuple (y,x) representing position of initial cell
-        dirNum: int with values 0,1,2,3
-        fact: int distance to next cell"""
-        dirTup = self.directions[dirNum]
-        return (cell[0]+fact*dirTup[0],cell[1]+fact*dirTup[1])
-
-    def is_valid_direction(self,cell,dirNum):
-        """WilsonMazeGenerator(tuple,int) -> boolean
-        Checks if the adjacent cell in the direction specified by
-        dirNum is within the grid
-        cell: tuple (y,x) representing position of initial cell
-        dirNum: int with values 0,1,2,3"""
-        newCell = self.get_next_cell(cell,dirNum,2)
-        tooSmall = newCell[0] < 0 or newCell[1] < 0
-        tooBig = newCell[0] >= self.height or newCell[1] >= self.width
-        return not (tooSmall or tooBig)
-
-    def initialize_grid(self):
-        """WilsonMazeGenerator.initialize_grid() -> None
-        Resets the maze grid to blank before generating a maze."""
-        for i in range(self.height):
-            for j in range(self.width):
-                self.grid[i][j] = 0
-                
-        # fill up unvisited cells
-        for r in range(self.height):
-            for c in range(self.width):
-                if r % 2 == 0 and c % 2 == 0:
-                    self.unvisited.append((r,c))
-
-        self.visited = []
-        self.path = dict()
-
-    def cut(self,cell):
-        """WilsonMazeGenerator.cut(tuple) -> None
-        Sets the value of the grid at the location specified by cell
-        to 1
-        cell: tuple (y,x) location of where to cut"""
-        self.grid[cell[0]][cell[1]] = 1
-
-    def generate_maze(self):
-        """WilsonMazeGenerator.generate_maze() -> None
-        Generates the maze according to the Wilson Loop Erased Random
-        Walk Algorithm"""
-        # reset the grid before generation
-        self.initialize_grid()
-
-        # choose the first cell to put in the visited list
-        # see Step 1 of the algorithm.
-        current = self.unvisited.pop(random.randint(0,len(self.unvisited)-1))
-        self.visited.append(current)
-        self.cut(current)
-
-        # loop until all cells have been visited
-        while len(self.unvisited) > 0:
-            # choose a random cell to start the walk (Step 2)
-            first = self.unvisited[random.randint(0,len(self.unvisited)-1)]
-            current = first
-            # loop until the random walk reaches a visited cell
-            while True:
-                # choose direction to walk (Step 3)
-                dirNum = random.randint(0,3)
-                # check if direction is valid. If not, choose new direction
-                while not self.is_valid_direction(current,dirNum):
-                    dirNum = random.randint(0,3)
-                # save the cell and direction in the path
-                self.path[current] = dirNum
-                # get the next cell in that direction
-                current = self.get_next_cell(current,dirNum,2)
-                if (current in self.visited): # visited cell is reached (Step 5)
-                    break
-
-            current = first # go to start of path
-            # loop until the end of path is reached
-            while True:
-                # add cell to visited and cut into the maze
-                self.visited.append(current)
-                self.unvisited.remove(current) # (Step 6.b)
-                self.cut(current)
-
-                # follow the direction to next cell (Step 6.a)
-                dirNum = self.path[current]
-                crossed = self.get_next_cell(current,dirNum,1)
-                self.cut(crossed) # cut crossed edge
-
-                current = self.get_next_cell(current,dirNum,2)
-                if (current in self.visited): # end of path is reached
-                    self.path = dict() # clear the path
-                    break
-
-## End Section Added by CaptainFlint ##
-                
 class Maze:
     '''Represents the maze the player is going through'''
 
-    def __init__(self, width, blockSize, color):
-        '''Maze(width,blockSize) -> Maze
+    @timed("Maze.__init__")
+    def __init__(self, width, blockSize, color, algorithm="wilson", seed=None, mazeFile=None):
+        '''Maze(width,blockSize,color,[algorithm],[seed],[mazeFile]) -> Maze
         creates and randomly generates a maze with dimensions width x width
         and blocks blockSize in width
         width: int telling the num blocks in width. Must be an odd number
         blockSize: int telling the width of each block
-        color: the color of the passage ways'''
+        color: the color of the passage ways
+        algorithm: str name of the algorithm in GENERATORS to generate with
+        seed: int seed so the maze repeats, or None
+        mazeFile: str name of a saved maze to load instead of generating
+            one, or None. It must be made for width'''
         # initialize given info
         self.width = width
         self.blockSize = blockSize
+        self.algorithm = algorithm
+        self.seed = seed
+        self.mazeFile = mazeFile
+        self.color = color
 
-        # coordinate grid
-        self.coordGrid = [[0 for i in range(self.width)] for j in range(self.width)]
-
-        for i in range(self.width):
-            for j in range(self.width):
-                self.coordGrid[i][j] = (self.blockSize*(self.width//2 - i),self.blockSize*(-self.width//2 + j))
-
-        # initialize turtle for drawing
+        # initialize turtle for writing
         self.t = turtle.Turtle()
         self.t.speed(0)
         self.t.ht()
         self.t.pu()
         self.t.color(color)
-        self.t.shapesize(self.blockSize / 20)
-        self.t.shape("square")
 
-        # set up lists of blocks
-        self.emptyBlocks = [self.coord_to_block(self.width * self.blockSize / 2 - self.blockSize,
-            self.width * self.blockSize / 2 - self.blockSize),
-            self.coord_to_block(self.width * self.blockSize / 2 - self.blockSize,
-                self.width * self.blockSize / 2),
-            self.coord_to_block(self.width * self.blockSize / 2 - self.blockSize,
-                self.width * self.blockSize / 2 + self.blockSize)] # blocks player can go through with end blocks
-        self.barriars = []                                     # blocks player can't go through
+        # set up board of cell states with a wall around the edge
+        self.boardWidth = self.width + 2 * (600 // (2 * self.blockSize)) + 4
+        self.center = self.boardWidth // 2 # row and column of the cell at (0,0)
+        self.board = MazeGrid(self.boardWidth,self.boardWidth)
+        self.board.fill(1,1,self.boardWidth - 2,self.boardWidth - 2,OUTSIDE)
+
+        # rows and columns covered by the maze
+        self.mazeTop = self.center - (self.width + 3) // 2
+        self.mazeBottom = self.center + (self.width + 3) // 2
+        self.mazeLeft = self.center - (self.width + 2) // 2
+        self.mazeRight = self.center + (self.width + 2) // 2
+        self.board.fill(self.mazeTop,self.mazeLeft,self.mazeRight - self.mazeLeft + 1,
+            self.mazeBottom - self.mazeTop + 1,WALL)
+
+        # start and end cells
+        self.startCell = self.board.index(self.mazeBottom - 1,self.mazeLeft + 1)
+        self.endCell = self.board.index(self.mazeTop,self.mazeRight - 1)
 
         # write end message and create maze
         self.generate_maze()
-        self.t.goto(self.block_to_coord(self.emptyBlocks[-1]))
+        self.draw_board()
+        self.t.goto(self.get_end())
         self.t.sety(self.t.ycor() + self.blockSize)
         self.t.write(" End",False,"center",("Arial",self.blockSize + 4,"normal"))
 
-    def block_to_coord(self,blockNum):
-        '''Maze.block_to_coord(blockNum) -> tuple containing the x and y coordinates
-        returns the corrisponding coordinate of a block
-        if block not in maze, returns None
-        blockNum: int'''
-        width = self.width + 2 * (600 // (2 * self.blockSize)) + 4
-
-        # if out of maze
-        if blockNum == None:
-            return None
-        elif blockNum < -width ** 2 // 2 or blockNum > width ** 2 // 2:
-            return
-
-        blockNum += width ** 2 // 2 # bring up for computation
-        x = (blockNum % width + 0.5 - width / 2) * self.blockSize
-        y = (blockNum // width + 0.5 - width / 2) * self.blockSize
-        return x,y  
-            
-    def coord_to_block(self,x,y):
-        '''maze.coord_to_block(x,y) -> int that is the block number
-        returns the block number that point (x,y) is in
-        if point not in maze, returns None
+    def cell_to_coord(self,cell):
+        '''Maze.cell_to_coord(cell) -> tuple containing the x and y coordinates
+        returns the coordinates of the center of cell
+        cell: int index of a cell on the board'''
+        row,col = divmod(cell,self.boardWidth)
+        return (col - self.center) * self.blockSize,(self.center - row) * self.blockSize
+
+    def coord_to_cell(self,x,y):
+        '''Maze.coord_to_cell(x,y) -> int index of a cell on the board
+        returns the cell that point (x,y) is in
+        if point not on the board, returns None
         x,y: int'''
-        width = self.width + 2 * (600 // (2 * self.blockSize)) + 4
-                        
-        # translate the coords into the first quadrant
-        newX = x + width * self.blockSize / 2
-        newY = y + width * self.blockSize / 2
-
-        # not in maze
-        if newX >= width * self.blockSize or newX < 0 or newY >= width * self.blockSize or newY < 0:
-           return
-
-        # output for in maze
-        output = newX // self.blockSize + (newY // self.blockSize) * width - width ** 2 // 2
-        return output
-
-    def is_out(self,blockNum):
-        '''Maze.is_out(blockNum,margin) -> boolean
-        returns True if blockNum is out of the maze. Else returns False
-        blockNum: int'''
-        if blockNum == None: # out of board
-            return True
-        x,y = self.block_to_coord(blockNum)
-        if x > (self.width + 2) * self.blockSize / 2 or x < -(self.width + 2) * self.blockSize / 2 or \
-              y > (self.width + 3) * self.blockSize / 2 or y < -(self.width + 3) * self.blockSize / 2: # out of maze
+        col = self.center + int((x + self.blockSize / 2) // self.blockSize)
+        row = self.center - int((y + self.blockSize / 2) // self.blockSize)
+        if not self.board.in_grid(row,col): # not on board
+            return None
+        return self.board.index(row,col)
+
+    def get_state(self,cell):
+        '''Maze.get_state(cell) -> int
+        returns the state of cell (WALL, PASSAGE, OUTSIDE or BARRIAR)
+        cells off the board are WALL
+        cell: int'''
+        if cell == None: # off the board
+            return WALL
+        return self.board.get_state(cell)
+
+    def can_enter(self,cell):
+        '''Maze.can_enter(cell) -> boolean
+        returns True if the player can go on cell. Else returns False
+        cell: int'''
+        return self.get_state(cell) in (PASSAGE,OUTSIDE)
+
+    def is_out(self,cell):
+        '''Maze.is_out(cell) -> boolean
+        returns True if cell is out of the maze. Else returns False
+        cell: int'''
+        if cell == None: # out of board
             return True
-        return False # in maze
+        return self.moveTable[cell] & OUT != 0
 
-    def get_empty_blocks(self):
-        '''Maze.get_empty_blocks() -> list
-        returns a list containing all empty blocks'''
-        return self.emptyBlocks
+    def get_grid(self):
+        '''Maze.get_grid() -> MazeGrid
+        returns the maze as it was generated or loaded, without the
+        board around it'''
+        return self.grid
+
+    def update_moves(self):
+        '''Maze.update_moves()
+        works out the directions the player can go from each cell and
+        which cells are out of the maze, so can_move and is_out are one
+        lookup. Called again whenever cells change state'''
+        self.moveTable = self.board.get_moves((PASSAGE,OUTSIDE),
+            (self.mazeTop,self.mazeLeft,self.mazeBottom,self.mazeRight))
+        self.solver = None # its paths are out of date
+
+    def get_solver(self):
+        '''Maze.get_solver() -> MazeSolver
+        returns a solver for the way out of the maze, made the first time
+        it's asked for and kept until the cells change'''
+        if self.solver == None:
+            goals = [cell for cell,cellMoves in enumerate(self.moveTable) if cellMoves & OUT]
+            self.solver = MazeSolver(self.moveTable,self.board.get_offsets(),goals)
+        return self.solver
+
+    def get_moves(self):
+        '''Maze.get_moves() -> bytearray
+        returns the moves table: a byte for each cell of the board with bit
+        1 << direction set if the player can go that way and OUT set if
+        the cell is out of the maze'''
+        return self.moveTable
+
+    def get_directions(self,cell):
+        '''Maze.get_directions(cell) -> tuple
+        returns the directions the player can go from cell
+        cell: int'''
+        return MOVE_DIRECTIONS[self.moveTable[cell]]
+
+    def get_offsets(self):
+        '''Maze.get_offsets() -> tuple
+        returns the cell offsets to go up, right, down and left'''
+        return self.board.get_offsets()
+
+    def get_start(self):
+        '''Maze.get_start() -> int
+        returns the cell the player starts on'''
+        return self.startCell
 
     def get_block_size(self):
         '''Maze.get_block_size() -> int
@@ -371,55 +300,83 @@ class Maze:
         returns an int rperesenting the width of the board'''
         return self.width
 
-    def get_barriars(self):
-        '''Maze.get_width() -> int
-        returns a list containing all the barriar numbers'''
-        return self.barriars
+    def get_end(self):
+        '''Maze.get_end() -> x,y
+        returns the x and y coordinates of the end block'''
+        return self.cell_to_coord(self.endCell)
 
+    @timed("Maze.generate_maze")
     def generate_maze(self):
         '''Maze.generate_maze()
         generates a maze using width'''
         # write message
         self.t.write("Generating Maze",False,"center",("Arial",50,"italic"))
 
-        mazeGen = WilsonMazeGenerator(self.width,self.width)
-        mazeGen.generate_maze()
-        grid = mazeGen.get_grid()
-
-        for i in range(self.width):
-            for j in range(self.width):
-                if grid[i][j] == 1:
-                    x,y = self.coordGrid[i][j]
-                    self.emptyBlocks.append(self.coord_to_block(x,y))
-                    
-        # draw maze
+        # the maze grid has a wall around it and 2 rows above it for the end
+        with phase("generate"):
+            if self.mazeFile != None:
+                self.grid = load_maze(self.mazeFile)
+                if self.grid.get_width() != self.width + 2 or self.grid.get_height() != self.width + 2:
+                    raise ValueError(self.mazeFile + " is not a maze for this width")
+            else:
+                self.grid = generate(self.algorithm,self.width + 2,self.width + 2,self.seed)
+            self.board.paste(self.grid,self.mazeTop + 2,self.mazeLeft)
+        for row in range(self.mazeTop,self.mazeTop + 3):
+            self.board.set_state(self.board.index(row,self.mazeRight - 1),PASSAGE)
+        self.update_moves()
+
+    @timed("Maze.draw_board")
+    def draw_board(self):
+        '''Maze.draw_board()
+        draws the passages of the maze as a few tile images'''
         self.t.clear()
-        self.emptyBlocks.sort()
-        for block in self.emptyBlocks:
-            self.t.goto(self.block_to_coord(block))
-            self.t.stamp()
-
-
-## COLORS ##
-BKGRD = "black"
-GRID  = "white"
-TRACK = "red"
-
-## SETUP ##
-turtle.tracer(0)
-wn = turtle.Screen()
-wn.bgcolor(BKGRD)
-wn.title("Maze")
-
-# change this to change the size of the maze
-# the width of the maze must be odd
-maze = Maze(75,6,GRID)
-player = Player(maze,TRACK)
-
-wn.onkeypress(player.go_up,"Up")
-wn.onkeypress(player.go_right,"Right")
-wn.onkeypress(player.go_down,"Down")
-wn.onkeypress(player.go_left,"Left")
-wn.onkeypress(player.pen_control,"space")
-wn.listen()
-wn.mainloop()
+        self.renderer = TileRenderer(self.t.screen,self.board,self.blockSize,self.center,
+            {PASSAGE: self.color})
+        self.renderer.update()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Find your way through a maze")
+    # the NumPy one is much quicker, but makes other mazes from a seed
+    parser.add_argument("--algorithm",choices=GENERATORS,
+        default="wilson-numpy" if "wilson-numpy" in GENERATORS else "wilson",
+        help="algorithm to generate the maze with")
+    parser.add_argument("--seed",type=int,default=None,
+        help="seed so the same maze comes up again")
+    parser.add_argument("--load",help="saved maze file to play instead of generating one")
+    parser.add_argument("--save",help="file to save the maze to")
+    args = parser.parse_args()
+
+    ## COLORS ##
+    BKGRD = "black"
+    GRID  = "white"
+    TRACK = "red"
+
+    ## SETUP ##
+    turtle.tracer(0)
+    wn = turtle.Screen()
+    wn.bgcolor(BKGRD)
+    wn.title("Maze")
+
+    # change this to change the size of the maze
+    # the width of the maze must be odd
+    width = 75
+    algorithm,seed = args.algorithm,args.seed
+    if args.load != None: # the saved maze decides the width
+        with MazeFile(args.load) as mazeFile:
+            width = mazeFile.get_width() - 2
+            # kept when it's saved again
+            algorithm,seed = mazeFile.get_algorithm(),mazeFile.get_seed()
+    maze = Maze(width,6,GRID,algorithm,seed,args.load)
+    if args.save != None:
+        save_maze(args.save,maze.get_grid(),algorithm,seed)
+    player = Player(maze,TRACK)
+
+    wn.onkeypress(player.go_up,"Up")
+    wn.onkeypress(player.go_right,"Right")
+    wn.onkeypress(player.go_down,"Down")
+    wn.onkeypress(player.go_left,"Left")
+    wn.onkeypress(player.pen_control,"space")
+    wn.onkeypress(player.show_hint,"h")
+    wn.listen()
+    wn.mainloop()
@@ -2,11 +2,24 @@
 # by G.G.Otto
 
 import turtle
-import random
+import argparse
+import bisect
+import math
+from maze_engine import MazeGrid, GENERATORS, generate, get_random, WALL, PASSAGE, OUTSIDE, BARRIAR, OUT, MOVE_DIRECTIONS
+from maze_render import TileRenderer, ChunkRenderer
+from maze_solver import MazeSolver
+from maze_format import MazeFile, save_maze, load_maze
+from maze_cache import MazeCache
+from maze_chunks import ChunkWorld
+from maze_profile import timed, phase
+from maze_layout import poisson_disk, value_noise
+
+SPAN = 2 ** 32 # cell numbers of an endless maze go up by SPAN a row, far more than can be walked
 
 class Player:
     '''Represents the player going through the maze'''
 
+    @timed("Player.__init__")
     def __init__(self, maze, color):
         '''Player(maze) -> Player
         creates the player for maze
@@ -16,8 +29,6 @@ class Player:
         self.blockSize = maze.get_block_size()
         self.width = maze.get_width()
         self.maze = maze
-        self.barriars = maze.get_barriars()
-        self.emptyBlocks = maze.get_empty_blocks() # get empty list
         
         # set up turtle
         self.color = color
@@ -29,9 +40,9 @@ class Player:
         self.t.seth(90)
         
         # put in start position
-        start = self.maze.block_to_coord(
-            self.maze.coord_to_block(-(self.width - 2) * self.blockSize / 2,-(self.width - 2) * self.blockSize / 2))
-        self.t.goto(start)
+        self.cell = self.maze.get_start()
+        self.offsets = self.maze.get_offsets()
+        self.t.goto(self.maze.cell_to_coord(self.cell))
         self.t.pd()
 
         # get screen info
@@ -62,34 +73,25 @@ class Player:
         self.moving = False # tells if moving or not
         self.isWon = False  # tells if game is won
 
+        # turtle for drawing hints
+        self.hint = turtle.Turtle()
+        self.hint.speed(0)
+        self.hint.ht()
+        self.hint.pu()
+        self.hint.color("yellow")
+        self.hint.pensize(self.blockSize / 5)
+        self.isHintShown = False
+
         # move screen
-        self.t.screen.update()
+        with phase("first screen.update"):
+            self.t.screen.update()
         self.move_screen()
         self.t.screen.update()
         
     def can_move(self):
-        '''Player.can_move() -> list
-        returns a list containing all the directions play can move'''
-        directions = [] # initialize output list
-        blockX,blockY = self.t.pos() # get position
-
-        # get passages
-        up = self.maze.coord_to_block(blockX,blockY + self.blockSize)
-        right = self.maze.coord_to_block(blockX + self.blockSize,blockY)
-        down = self.maze.coord_to_block(blockX,blockY - self.blockSize)
-        left = self.maze.coord_to_block(blockX - self.blockSize,blockY)
-        passageList = [up,right,down,left]
-
-        for index in range(4): # look through passage indexes
-            passage = passageList[index]
-            # if passage out of board
-            if passage == None:
-                continue
-            # if passage way in maze or not blocked area out of maze
-            if passage in self.emptyBlocks or \
-                 (maze.is_out(passage) and passage not in self.barriars):
-                directions.append(index) 
-        return directions
+        '''Player.can_move() -> tuple
+        returns a tuple containing all the directions play can move'''
+        return self.maze.get_directions(self.cell)
 
     def move_screen(self):
         '''Player.move_screen()
@@ -98,51 +100,77 @@ class Player:
             (self.t.xcor() + self.windowWidth/2 - self.viewWidth/2)/self.windowWidth)
         self.canvas.yview_moveto(
             1 - (self.t.ycor() + self.windowWidth/2 + self.viewWidth/2)/self.windowWidth)
+        self.maze.update_view()
         
+    @timed("Player.go_up")
     def go_up(self):
         '''Player.go_up()
         moves the player up with screen'''
         if not self.moving and 0 in self.can_move():
             self.moving = True
+            self.cell += self.offsets[0]
             self.t.sety(self.t.ycor() + self.blockSize)
             self.move_screen()
             self.moving = False
             self.check_win()
             self.t.screen.update()
 
+    @timed("Player.go_right")
     def go_right(self):
         '''Player.got_right()
         moves the player to the right with screen'''
         if not self.moving and 1 in self.can_move():
             self.moving = True
+            self.cell += self.offsets[1]
             self.t.setx(self.t.xcor() + self.blockSize)
             self.move_screen()
             self.moving = False
             self.check_win()
             self.t.screen.update()
 
+    @timed("Player.go_down")
     def go_down(self):
         '''Player.go_down()
         moves the player down with screen'''
         if not self.moving and 2 in self.can_move():
             self.moving = True
+            self.cell += self.offsets[2]
             self.t.sety(self.t.ycor() - self.blockSize)
             self.move_screen()
             self.moving = False
             self.check_win()
             self.t.screen.update()
 
+    @timed("Player.go_left")
     def go_left(self):
         '''Player.go_left()
         moves the player to the left with screen'''
         if not self.moving and 3 in self.can_move():
             self.moving = True
+            self.cell += self.offsets[3]
             self.t.setx(self.t.xcor() - self.blockSize)
             self.move_screen()
             self.moving = False
             self.check_win()
             self.t.screen.update()
 
+    def show_hint(self,numSteps=10):
+        '''Player.show_hint([numSteps])
+        draws the next numSteps steps of the shortest way out of the maze,
+        or takes the hint away if it is showing
+        numSteps: int (default 10)'''
+        self.hint.clear()
+        self.isHintShown = not self.isHintShown
+        if self.isHintShown:
+            cell = self.cell
+            self.hint.goto(self.maze.cell_to_coord(cell))
+            self.hint.pd()
+            for direction in self.maze.get_solver().get_steps(cell,numSteps):
+                cell += self.offsets[direction]
+                self.hint.goto(self.maze.cell_to_coord(cell))
+            self.hint.pu()
+        self.t.screen.update()
+
     def pen_control(self):
         '''Player.pen_control()
         pen up or pen down according to what is current'''
@@ -155,13 +183,13 @@ class Player:
         '''Player.check_win()
         checks if player has won and displays message'''
         x,y = self.t.pos()                                                # record current position
-        if self.maze.is_out(self.maze.coord_to_block(x,y)) and not self.isWon:
+        if self.maze.is_out(self.cell) and not self.isWon:
             self.t.pu()                                                   # lift pen
             size = int(1.5 * self.blockSize)                              # font size
             self.t.color("yellow")
             
             self.moving = True
-            self.t.goto(self.maze.block_to_coord(self.emptyBlocks[-1]))   # go to place for text
+            self.t.goto(self.maze.get_end())                              # go to place for text
             self.t.sety(self.t.ycor() + 2 * self.blockSize)               # go up a little
             self.t.write("You win!",False,"center",("Arial",size,"bold")) # write message
             self.t.goto(x,y)
@@ -173,133 +201,167 @@ class Player:
 class Maze:
     '''Represents the maze the player is going through'''
 
-    def __init__(self, width, blockSize, passageColor, bgColor):
-        '''Maze(width,blockSize) -> Maze
+    @timed("Maze.__init__")
+    def __init__(self, width, blockSize, passageColor, bgColor, algorithm="growing-tree", seed=None, draw=True, mazeFile=None, cache=None):
+        '''Maze(width,blockSize,passageColor,bgColor,[algorithm],[seed],[draw],[mazeFile],[cache]) -> Maze
         creates and randomly generates a maze with dimensions width x width
         and blocks blockSize in width
         width: int telling the num blocks in width. Must be an odd number
         blockSize: int telling the width of each block
-        passageColor,bgColor: color string or tuple'''
+        passageColor,bgColor: color string or tuple
+        algorithm: str name of the algorithm in GENERATORS to generate with
+        seed: int seed so the maze and adventure world repeat, or None
+        draw: False to only generate the board, without turtle. The
+            adventure world is then planned by calling its plan_world
+        mazeFile: str name of a saved maze to load instead of generating
+            one, or None. It must be made for width
+        cache: MazeCache to keep the maze and world in when seed is given,
+            or None'''
         # initialize given info
         self.width = width
         self.blockSize = blockSize
+        self.algorithm = algorithm
+        self.seed = seed
+        self.mazeFile = mazeFile
+        self.cache = cache
 
         # initialize turtle for drawing
-        self.t = turtle.Turtle()
-        self.t.speed(0)
-        self.t.ht()
-        self.t.pu()
-        self.t.shapesize(self.blockSize / 20)
-        self.t.shape("square")
-        self.t.color("white")          # color for text
-        self.t.screen.bgcolor("black") # bgcolor is black for now
+        self.t = None
+        if draw:
+            self.t = turtle.Turtle()
+            self.t.speed(0)
+            self.t.ht()
+            self.t.pu()
+            self.t.color("white")          # color for text
+            self.t.screen.bgcolor("black") # bgcolor is black for now
         # get colors
         self.passageColor = passageColor
         self.bgColor = bgColor
         
-        # set up lists of blocks
-        self.emptyBlocks = [self.coord_to_block(self.width * self.blockSize / 2 - 2 * self.blockSize,
-                self.width * self.blockSize / 2 - self.blockSize),
-            self.coord_to_block(self.width * self.blockSize / 2 - 2 * self.blockSize,
-                self.width * self.blockSize / 2)] # blocks player can go through with end blocks
-        self.blocksWithPassages = []                           # blocks to draw from                                   # blocks player can't go through
-
+        # set up board of cell states with a wall around the edge
+        self.boardWidth = self.width + 2 * (3000 // (2 * self.blockSize)) + 4
+        self.center = self.boardWidth // 2 # row and column of the cell at (0,0)
+        self.board = MazeGrid(self.boardWidth,self.boardWidth)
+        self.board.fill(1,1,self.boardWidth - 2,self.boardWidth - 2,OUTSIDE)
+
+        # rows and columns covered by the maze
+        self.mazeTop = self.center - self.width // 2
+        self.mazeBottom = self.center + self.width // 2
+        self.mazeLeft = self.center - self.width // 2
+        self.mazeRight = self.center + self.width // 2
+        self.board.fill(self.mazeTop,self.mazeLeft,self.mazeRight - self.mazeLeft + 1,
+            self.mazeBottom - self.mazeTop + 1,WALL)
+
+        # start and end cells
+        self.startCell = self.board.index(self.mazeBottom - 1,self.mazeLeft + 1)
+        self.endCell = self.board.index(self.mazeTop - 1,self.mazeRight - 1) # just above the maze
         # get adventure world
-        self.adventureWorld = AdventureWorld(self)
+        self.adventureWorld = AdventureWorld(self,seed,cache)
 
         # write end message and create maze
         self.generate_maze()
+        if not draw:
+            return
         self.draw_board()
-        self.t.goto(self.block_to_coord(self.emptyBlocks[-1]))
+        self.t.goto(self.get_end())
         self.t.sety(self.t.ycor() + self.blockSize)
         self.t.write(" End",False,"center",("Arial",self.blockSize + 4,"normal"))
-        self.barriars = self.adventureWorld.get_barriars()
         self.t.screen.update()
 
-    def block_to_coord(self,blockNum):
-        '''Maze.block_to_coord(blockNum) -> tuple containing the x and y coordinates
-        returns the corrisponding coordinate of a block
-        if block not in maze, returns None
-        blockNum: int'''
-        width = self.width + 2 * (3000 // (2 * self.blockSize)) + 4
-
-        # if out of maze
-        if blockNum == None:
-            return None
-        elif blockNum < -width ** 2 // 2 or blockNum > width ** 2 // 2:
-            return
-
-        blockNum += width ** 2 // 2 # bring up for computation
-        x = (blockNum % width + 0.5 - width / 2) * self.blockSize
-        y = (blockNum // width + 0.5 - width / 2) * self.blockSize
-        return x,y  
-            
-    def coord_to_block(self,x,y):
-        '''maze.coord_to_block(x,y) -> int that is the block number
-        returns the block number that point (x,y) is in
-        if point not in maze, returns None
+    def cell_to_coord(self,cell):
+        '''Maze.cell_to_coord(cell) -> tuple containing the x and y coordinates
+        returns the coordinates of the center of cell
+        cell: int index of a cell on the board'''
+        row,col = divmod(cell,self.boardWidth)
+        return (col - self.center) * self.blockSize,(self.center - row) * self.blockSize
+
+    def coord_to_cell(self,x,y):
+        '''Maze.coord_to_cell(x,y) -> int index of a cell on the board
+        returns the cell that point (x,y) is in
+        if point not on the board, returns None
         x,y: int'''
-        width = self.width + 2 * (3000 // (2 * self.blockSize)) + 4
-                        
-        # translate the coords into the first quadrant
-        newX = x + width * self.blockSize / 2
-        newY = y + width * self.blockSize / 2
-
-        # not in maze
-        if newX >= width * self.blockSize or newX < 0 or newY >= width * self.blockSize or newY < 0:
-           return
-
-        # output for in maze
-        output = newX // self.blockSize + (newY // self.blockSize) * width - width ** 2 // 2
-        return output
-
-    def is_out(self,blockNum):
-        '''Maze.is_out(blockNum) -> boolean
-        returns True if blockNum is out of the maze. Else returns False
-        blockNum: int'''
-        if blockNum == None: # out of board
-            return True
-        x,y = self.block_to_coord(blockNum)
-        if x > (self.width) * self.blockSize / 2 or x < -(self.width) * self.blockSize / 2 or \
-              y > (self.width) * self.blockSize / 2 or y < -(self.width) * self.blockSize / 2: # out of maze
+        col = self.center + int((x + self.blockSize / 2) // self.blockSize)
+        row = self.center - int((y + self.blockSize / 2) // self.blockSize)
+        if not self.board.in_grid(row,col): # not on board
+            return None
+        return self.board.index(row,col)
+
+    def get_state(self,cell):
+        '''Maze.get_state(cell) -> int
+        returns the state of cell (WALL, PASSAGE, OUTSIDE or BARRIAR)
+        cells off the board are WALL
+        cell: int'''
+        if cell == None: # off the board
+            return WALL
+        return self.board.get_state(cell)
+
+    def add_barriar(self,cell):
+        '''Maze.add_barriar(cell)
+        makes cell a barriar if it is open ground outside the maze
+        cell: int'''
+        if self.get_state(cell) == OUTSIDE:
+            self.board.set_state(cell,BARRIAR)
+
+    def can_enter(self,cell):
+        '''Maze.can_enter(cell) -> boolean
+        returns True if the player can go on cell. Else returns False
+        cell: int'''
+        return self.get_state(cell) in (PASSAGE,OUTSIDE)
+
+    def is_out(self,cell):
+        '''Maze.is_out(cell) -> boolean
+        returns True if cell is out of the maze. Else returns False
+        cell: int'''
+        if cell == None: # out of board
             return True
-        return False # in maze
-
-    def check_passage(self,blockNumList):
-        '''Maze.check_passage(blockNumList) -> boolean
-        returns True if the block numbers in blockNumList make a valid passage. Else returns False
-        blockNumList: list'''
-        for blockNum in blockNumList:
-            if self.is_out(blockNum) or blockNum in self.emptyBlocks:
-                return False
-        return True
-    
-    def check_passages(self,blockNum):
-        '''Maze.check_passages(blockNum) -> list all passages from blockNum
-        blockNum: int'''
-        blockX,blockY = self.block_to_coord(blockNum) # get the coords of blockNum
-        availablePassages = [] # initialize availablePassages
-
-        # get passages
-        up = [self.coord_to_block(blockX,blockY + self.blockSize),
-           self.coord_to_block(blockX,blockY + 2 * self.blockSize)]
-        right = [self.coord_to_block(blockX + self.blockSize,blockY),
-           self.coord_to_block(blockX + 2 * self.blockSize,blockY)]
-        left = [self.coord_to_block(blockX,blockY - self.blockSize),
-           self.coord_to_block(blockX,blockY - 2 * self.blockSize)]
-        down = [self.coord_to_block(blockX - self.blockSize,blockY),
-           self.coord_to_block(blockX - 2 * self.blockSize,blockY)]
-        
-        # loop through passages
-        for passage in [up,right,left,down]:
-            if self.check_passage(passage):
-                availablePassages.append(passage)
-        return availablePassages
-
-    def get_empty_blocks(self):
-        '''Maze.get_empty_blocks() -> list
-        returns a list containing all empty blocks'''
-        return self.emptyBlocks
+        return self.moveTable[cell] & OUT != 0
+
+    def get_grid(self):
+        '''Maze.get_grid() -> MazeGrid
+        returns the maze as it was generated or loaded, without the
+        board around it'''
+        return self.grid
+
+    def update_moves(self):
+        '''Maze.update_moves()
+        works out the directions the player can go from each cell and
+        which cells are out of the maze, so can_move and is_out are one
+        lookup. Called again whenever cells change state'''
+        self.moveTable = self.board.get_moves((PASSAGE,OUTSIDE),
+            (self.mazeTop,self.mazeLeft,self.mazeBottom,self.mazeRight))
+        self.solver = None # its paths are out of date
+
+    def get_solver(self):
+        '''Maze.get_solver() -> MazeSolver
+        returns a solver for the way out of the maze, made the first time
+        it's asked for and kept until the cells change'''
+        if self.solver == None:
+            goals = [cell for cell,cellMoves in enumerate(self.moveTable) if cellMoves & OUT]
+            self.solver = MazeSolver(self.moveTable,self.board.get_offsets(),goals)
+        return self.solver
+
+    def get_moves(self):
+        '''Maze.get_moves() -> bytearray
+        returns the moves table: a byte for each cell of the board with bit
+        1 << direction set if the player can go that way and OUT set if
+        the cell is out of the maze'''
+        return self.moveTable
+
+    def get_directions(self,cell):
+        '''Maze.get_directions(cell) -> tuple
+        returns the directions the player can go from cell
+        cell: int'''
+        return MOVE_DIRECTIONS[self.moveTable[cell]]
+
+    def get_offsets(self):
+        '''Maze.get_offsets() -> tuple
+        returns the cell offsets to go up, right, down and left'''
+        return self.board.get_offsets()
+
+    def get_start(self):
+        '''Maze.get_start() -> int
+        returns the cell the player starts on'''
+        return self.startCell
 
     def get_block_size(self):
         '''Maze.get_block_size() -> int
@@ -311,60 +373,59 @@ class Maze:
         returns an int rperesenting the width of the board'''
         return self.width
 
-    def get_barriars(self):
-        '''Maze.get_width() -> int
-        returns a list containing all the barriar numbers'''
-        return self.barriars
+    def get_center(self):
+        '''Maze.get_center() -> int
+        returns the row and column of the cell at (0,0)'''
+        return self.center
 
     def get_end(self):
         '''Maze.get_end() -> x,y
         returns the x and y coordinates of the end block'''
-        return self.block_to_coord(self.emptyBlocks[-1])
+        return self.cell_to_coord(self.endCell)
 
     def get_bg(self):
         '''Maze.get_bg()
         returns the bg color of the maze'''
         return self.bgColor
 
+    @timed("Maze.update_view")
+    def update_view(self):
+        '''Maze.update_view()
+        draws the parts of the maze and adventure world that came into view'''
+        self.adventureWorld.update_view()
+        self.renderer.update()
+
+    @timed("Maze.generate_maze")
     def generate_maze(self):
         '''Maze.generate_maze()
         generates a maze using width'''
         # write message
-        self.t.write("Generating Maze...",False,"center",("Arial",50,"italic"))
-        self.t.screen.update()
-        # find first block
-        randomX = random.randrange(0,self.width - 2,2) * self.blockSize # get random x-cor
-        randomY = random.randrange(0,self.width - 2,2) * self.blockSize # get random y-cor
-        startBlock = self.coord_to_block(-self.width * self.blockSize / 2 + self.blockSize + randomX,
-             -self.width * self.blockSize / 2 + self.blockSize + randomY)
-        self.emptyBlocks.append(startBlock)
-        self.blocksWithPassages.append(startBlock)
-
-        # loop until maze is done
-        while len(self.blocksWithPassages) != 0:
-            # generate maze
-            randomBlock = random.choice(self.blocksWithPassages)
-            randomPassage = random.choice(self.check_passages(randomBlock))
-            for blockToDraw in randomPassage:
-                self.emptyBlocks.append(blockToDraw)
-
-            # add new position to list
-            self.blocksWithPassages.append(blockToDraw)
-
-            # get block coords
-            blockX,blockY = self.block_to_coord(blockToDraw) 
-            # remove used blocks from list
-            for x in (blockX - 2 * self.blockSize,
-                      blockX, blockX + 2 * self.blockSize):
-                for y in (blockY - 2 * self.blockSize,
-                      blockY, blockY + 2 * self.blockSize):
-                    block = self.coord_to_block(x,y)
-                    if len(self.check_passages(block)) == 0 and block in self.blocksWithPassages:
-                        self.blocksWithPassages.remove(block)
+        if self.t != None:
+            self.t.write("Generating Maze...",False,"center",("Arial",50,"italic"))
+            self.t.screen.update()
+
+        with phase("generate"):
+            if self.mazeFile != None:
+                self.grid = load_maze(self.mazeFile)
+                if self.grid.get_width() != self.width or self.grid.get_height() != self.width:
+                    raise ValueError(self.mazeFile + " is not a maze for this width")
+            elif self.cache != None:
+                self.grid = self.cache.generate(self.algorithm,self.width,self.width,self.seed)
+            else:
+                self.grid = generate(self.algorithm,self.width,self.width,self.seed)
+            self.board.paste(self.grid,self.mazeTop,self.mazeLeft)
+        self.board.set_state(self.endCell + self.board.offsets[2],PASSAGE) # opening in the maze wall
+        self.board.set_state(self.endCell,PASSAGE)
+        self.update_moves()
+        if self.t == None: # nothing to draw on
+            return
         self.t.clear() # remove text
         self.t.screen.setup(450,450) # make screen smaller
 
-    def draw_board(self):        
+    @timed("Maze.draw_board")
+    def draw_board(self):
+        '''Maze.draw_board()
+        draws the adventure world and the maze'''
         # draw adventure world
         self.adventureWorld.draw_world()
     
@@ -378,44 +439,78 @@ class Maze:
             self.t.fd(self.width * self.blockSize)
         self.t.end_fill()
         self.t.goto(0,0)
-        self.t.color(self.passageColor)     # get color for passages
-        self.t.fillcolor(self.passageColor) # make each block solid
-        
-        # draw maze
-        self.t.st()
-        self.t.undo()
-        self.emptyBlocks.sort()
-        for block in self.emptyBlocks:
-            self.t.goto(self.block_to_coord(block))
-            self.t.stamp()
-        self.t.ht()
+        self.t.color(self.passageColor) # color for the end message
+
+        # draw maze as a few tile images
+        self.renderer = TileRenderer(self.t.screen,self.board,self.blockSize,self.center,
+            {PASSAGE: self.passageColor})
+        self.renderer.update()
         
 class AdventureWorld:
     '''Generates the outside adventure world'''
 
-    def __init__(self,maze):
-        '''AdventureWorld(maze) -> AdventureWorld
+    def __init__(self,maze,seed=None,cache=None):
+        '''AdventureWorld(maze,[seed],[cache]) -> AdventureWorld
         constructs a adventure world for maze
-        maze: Maze'''
+        maze: Maze
+        seed: int seed so the world repeats, or None
+        cache: MazeCache to keep the layout in when seed is given, or None'''
         # get maze info
         self.blockSize = maze.get_block_size()
         self.width = maze.get_width()
         self.windowWidth = (self.width + 2 * (3000 // (2 * self.blockSize)) + 4) * self.blockSize
         self.maze = maze
-        
-        # set up turtle
-        self.t = turtle.Turtle()
-        self.t.ht()
-        self.t.pu()
-        self.t.shapesize(self.blockSize/20)
-        self.t.shape("square")
-
-        self.barriars = []
-
-    def get_barriars(self):
-        '''AdventureWorld.get_barriars() -> list
-        returns a list of all barriars'''
-        return self.barriars
+        self.screen = None # the turtle screen, once the world is drawn
+        self.random = get_random(seed)
+        self.seed = seed
+        self.cache = cache
+
+        # first and last points in the maze, the same for x and y
+        self.mazeLow = -(self.width//2) * self.blockSize - self.blockSize//2
+        self.mazeHigh = (self.width//2 + 1) * self.blockSize - self.blockSize//2 - 1
+        # nothing is put closer than endRadius to the end
+        self.endX,self.endY = self.maze.get_end()
+        self.endRadius = (self.width // 10) * self.blockSize
+
+        # color number of each cell of ground, 0 is bare ground
+        boardWidth = self.windowWidth // self.blockSize
+        self.ground = MazeGrid(boardWidth,boardWidth,0)
+        self.colorNums = dict() # color number of each color
+        self.colors = dict()    # color of each color number
+
+        self.flowers = dict()   # flowers on each cell that can be seen
+        self.flowerTiles = dict() # cells with flowers in each tile
+        self.flowerView = set() # tiles whose flowers are drawn
+        self.renderer = None
+
+        # rectangles random_coord picks from and the num points before each
+        self.openAreas = self.get_open_areas()
+        self.openStarts = []
+        self.numOpen = 0
+        for left,bottom,width,height in self.openAreas:
+            self.openStarts.append(self.numOpen)
+            self.numOpen += width * height
+
+    def get_color_num(self,color):
+        '''AdventureWorld.get_color_num(color) -> int
+        returns the number the ground grid uses for color
+        color: string or color tuple'''
+        if color not in self.colorNums:
+            if len(self.colors) == 255:
+                raise ValueError("the ground can only have 255 colors")
+            self.colorNums[color] = len(self.colors) + 1
+            self.colors[len(self.colors) + 1] = color
+        return self.colorNums[color]
+
+    def paint(self,color,x,y):
+        '''AdventureWorld.paint(color,x,y)
+        colors the block at (x,y), covering anything painted there before
+        color: string or color tuple'''
+        cell = self.maze.coord_to_cell(x,y)
+        if cell == None:
+            return
+        self.ground.cells[cell] = self.get_color_num(color)
+        self.flowers.pop(cell,None) # flowers under it can't be seen
 
     def get_block_in_direction(self,x,y,direction):
         '''AdventureWorld.get_block_in_direction(x,ydirection) -> x,y
@@ -435,89 +530,66 @@ class AdventureWorld:
         draws a rock at (x,y) and adds it to the barriars
         numBlocks: int representing the number of blocks in the rock
         color: string or color tuple for rock color'''
-        if self.maze.coord_to_block(x,y) == None:
+        if self.maze.coord_to_cell(x,y) == None:
             return
         # first block
-        blocksToDraw = [self.maze.block_to_coord(self.maze.coord_to_block(x,y))]
+        blocksToDraw = [self.maze.cell_to_coord(self.maze.coord_to_cell(x,y))]
+        blocksInRock = set(blocksToDraw) # to check for overlap in constant time
 
         # loop until rock is generated
         while len(blocksToDraw) != numBlocks:
-            randomX,randomY = random.choice(blocksToDraw) # get random coords and unpack
+            randomX,randomY = self.random.choice(blocksToDraw) # get random coords and unpack
             randomCoords = self.get_block_in_direction(randomX,randomY,
-                    random.randint(0,3))
-            if randomCoords not in blocksToDraw:          # if not in use
+                    self.random.randint(0,3))
+            if randomCoords not in blocksInRock:          # if not in use
                 blocksToDraw.append(randomCoords)         # add to rock
+                blocksInRock.add(randomCoords)
         
         # draw rock
-        self.t.color(color)
         for blockPos in blocksToDraw:
             blockX,blockY = blockPos # unpack coords
-            self.t.goto(blockX,blockY)
-            self.t.stamp()
+            self.paint(color,blockX,blockY)
             # add to barriars
-            if self.maze.coord_to_block(blockX,blockY) != None:
-                self.barriars.append(self.maze.coord_to_block(blockX,blockY))
+            self.maze.add_barriar(self.maze.coord_to_cell(blockX,blockY))
 
     def draw_tree(self,diameter,color,x,y):
         '''AdventureWorld.draw_tree(diameter,color,x,y)
         draws a tree at (x,y) with diameter (in blockNums)
         diameter: int
         color: string or color tuple'''
-        # original position and color
-        self.t.color(color)
-
         # get x,y coord
-        if self.maze.coord_to_block(x,y) == None:
+        if self.maze.coord_to_cell(x,y) == None:
             return
-        x,y = self.maze.block_to_coord(self.maze.coord_to_block(x,y))
+        x,y = self.maze.cell_to_coord(self.maze.coord_to_cell(x,y))
 
         # loop through coords
         for i in range(-diameter//2,diameter//2+1):
             for j in range(-diameter//2,diameter//2+1):
                 distance = (i**2 + j**2)**(1/2)
-                if (diameter/2 - 0.5 <= distance <= diameter/2 - 0.1 and random.random() > 0.3) \
+                if (diameter/2 - 0.5 <= distance <= diameter/2 - 0.1 and self.random.random() > 0.3) \
                    or distance < diameter/2 - 0.5:                                # if in radius
                     blockX,blockY = i * self.blockSize + x,j * self.blockSize + y
-                    self.t.goto(blockX,blockY)                                    # get into position
-                    self.t.stamp()
-                    self.barriars.append(self.maze.coord_to_block(blockX,blockY)) # add to barriars
+                    self.paint(color,blockX,blockY)
+                    self.maze.add_barriar(self.maze.coord_to_cell(blockX,blockY)) # add to barriars
 
     def draw_ground_variance(self,diameter,color,x,y):
         '''AdventureWorld.draw_ground_variance(diamter,color,x,y)
         draws a type of circle on the ground at (x,y). Does not add to barriars
         diameter: int
         color: string or color tuple'''
-        # original position and color
-        self.t.color(color)
-
-        if self.maze.coord_to_block(x,y) == None:
+        if self.maze.coord_to_cell(x,y) == None:
             return
-        x,y = self.maze.block_to_coord(self.maze.coord_to_block(x,y))
+        x,y = self.maze.cell_to_coord(self.maze.coord_to_cell(x,y))
 
         # loop through coords
         for i in range(-diameter//2,diameter//2+1):
             for j in range(-diameter//2,diameter//2+1):
                 distance = (i**2 + j**2)**(1/2)
-                if (diameter/2 - diameter//10 <= distance <= diameter/2 - diameter//25 and random.random() > 0.4) \
+                if (diameter/2 - diameter//10 <= distance <= diameter/2 - diameter//25 and self.random.random() > 0.4) \
                    or distance < diameter/2 - diameter//10:                                # if in radius
                     blockX,blockY = i * self.blockSize + x,j * self.blockSize + y
-                    self.t.goto(blockX,blockY)                                    # get into position
-                    self.t.stamp()
-        
-    def draw_hill(self,diameter,height,x,y):
-        '''AdventureWorld.draw_hill(diamter,height,color,x,y)
-        draws a hill with height at (x,y)
-        diameter: int
-        height: int between -1 and 6'''
-        if height < 0 or height > 5:
-            raise ValueError("height must be between -1 and 6")
-        color = 210
-        levelDia = diameter # diameter for each level
-        # loop through heights
-        for i in range(height):
-            self.draw_ground_variance(levelDia,(20,color,20),x,y)
-            color += 10                    # lighter color
-            levelDia -= diameter // height # bring level down
+                    self.paint(color,blockX,blockY)
+
 
     def draw_flower(self,diamter,outColor,inColor,x,y):
         '''AdventureWorld.draw_flower(diamter,outColor,inColor,x,y)
@@ -525,16 +597,11 @@ class AdventureWorld:
         diamter: int represeting the diamter of the flower
         outColor: string or color tuple for the petal color
         inColor: string or color tuple for the inside of the flower'''
-        if self.maze.coord_to_block(x,y) == None:
+        cell = self.maze.coord_to_cell(x,y)
+        if cell == None:
             return
-        # get into position
-        self.t.goto(self.maze.block_to_coord(self.maze.coord_to_block(x,y)))
-        # petals
-        self.t.color(outColor)
-        self.t.dot(self.blockSize * diamter)
-        # inside
-        self.t.color(inColor)
-        self.t.dot(self.blockSize * diamter / 2.5)
+        # flowers are drawn when their tile comes into view
+        self.flowers.setdefault(cell,[]).append((diamter,outColor,inColor))
 
     def draw_sand(self,diameter,x,y):
         '''AdventureWorld.draw_sand(diameter,color,x,y)
@@ -556,87 +623,394 @@ class AdventureWorld:
         self.draw_sand(diameter + sandMargin,x,y) # bank
         self.draw_tree(diameter,"blue",x,y)                # water (using the tree method)
 
+    def get_open_areas(self):
+        '''AdventureWorld.get_open_areas() -> list
+        returns rectangles (left,bottom,width,height) of whole points that
+        don't overlap and together cover every point random_coord can give:
+        the window minus the maze and minus a circle around the end
+        rows of the rectangles that cross the circle are split into the
+        parts left and right of it'''
+        low,high = -self.windowWidth//2,self.windowWidth//2
+        mazeLow,mazeHigh = self.mazeLow,self.mazeHigh
+        endX,endY,radius = self.endX,self.endY,self.endRadius
+
+        areas = []
+        def add_area(left,bottom,right,top):
+            if left <= right and bottom <= top:
+                areas.append((left,bottom,right - left + 1,top - bottom + 1))
+
+        # (left,bottom,right,top) of the rectangles above, below, left and right of the maze
+        for left,bottom,right,top in ((low,mazeHigh + 1,high,high),(low,low,high,mazeLow - 1),
+                (low,mazeLow,mazeLow - 1,mazeHigh),(mazeHigh + 1,mazeLow,high,mazeHigh)):
+            if radius == 0: # no circle
+                add_area(left,bottom,right,top)
+                continue
+            # rows that miss the circle
+            add_area(left,bottom,right,min(top,endY - radius))
+            add_area(left,max(bottom,endY + radius),right,top)
+            # rows that cross it, minus the points closer than radius
+            for y in range(max(bottom,endY - radius + 1),min(top,endY + radius - 1) + 1):
+                halfChord = math.isqrt(radius ** 2 - (y - endY) ** 2 - 1)
+                add_area(left,y,min(right,endX - halfChord - 1),y)
+                add_area(max(left,endX + halfChord + 1),y,right,y)
+        return areas
+
+    def is_open(self,x,y):
+        '''AdventureWorld.is_open(x,y) -> boolean
+        returns True if random_coord could give a point this close to (x,y)
+        x,y: int or float'''
+        low,high = -self.windowWidth//2,self.windowWidth//2
+        if not (low <= x <= high and low <= y <= high):
+            return False
+        if self.mazeLow <= x < self.mazeHigh + 1 and self.mazeLow <= y < self.mazeHigh + 1:
+            return False
+        return (x - self.endX) ** 2 + (y - self.endY) ** 2 >= self.endRadius ** 2
+
     def random_coord(self):
         '''AdventureWorld.random_coord() -> x,y
-        returns random point (x,y)'''
-        # get random coord
-        x = random.randint(-self.windowWidth//2,self.windowWidth//2)
-        y = random.randint(-self.windowWidth//2,self.windowWidth//2)
-        blockNum = self.maze.coord_to_block(x,y)
-
-        # get distance from the end
-        endX,endY = self.maze.get_end()
-        distanceFromEnd = ((x - endX) ** 2 + (y - endY) ** 2) ** (1/2)
-        # loop until coord is correct
-        while not self.maze.is_out(blockNum) or distanceFromEnd < (self.width // 10) * self.blockSize:
-            x = random.randint(-self.windowWidth//2,self.windowWidth//2)
-            y = random.randint(-self.windowWidth//2,self.windowWidth//2)
-            blockNum = self.maze.coord_to_block(x,y)
-
-            # get distance from the end
-            endX,endY = self.maze.get_end()
-            distanceFromEnd = ((x - endX) ** 2 + (y - endY) ** 2) ** (1/2)
-
-        return x,y
-    
-    def draw_world(self):
-        '''AdventureWorld.draw_world()
-        draws the adventure world'''
-        # background
-        self.t.color(0,180,0)
+        returns random point (x,y) out of the maze and not near the end
+        every point is as likely, and it only takes 1 random number'''
+        point = self.random.randrange(self.numOpen)
+        area = bisect.bisect_right(self.openStarts,point) - 1
+        left,bottom,width,height = self.openAreas[area]
+        row,col = divmod(point - self.openStarts[area],width)
+        return left + col,bottom + row
+
+    def random_coords(self,num):
+        '''AdventureWorld.random_coords(num) -> list
+        returns a list of num random points like random_coord
+        num: int'''
+        return [self.random_coord() for i in range(num)]
+
+    def get_spread_coords(self,num):
+        '''AdventureWorld.get_spread_coords(num) -> list
+        returns up to num random points like random_coord, spread out so
+        none are too close together (Poisson disk sampling)
+        num: int'''
+        if num == 0:
+            return []
+        # about 1.5 times as many points fit as are needed, so there's a choice
+        radius = math.sqrt(self.numOpen / num) * 2 / 3
+        points = poisson_disk(self.is_open,self.random_coord(),-self.windowWidth//2,
+            self.windowWidth//2,radius,self.random)
+        self.random.shuffle(points)
+        return points[:num]
+
+    def draw_hills(self):
+        '''AdventureWorld.draw_hills()
+        paints hills onto the ground from a smooth noise field, so each
+        cell is painted once at its height instead of once per level
+        covers about as much ground as width // 7 round hills did'''
+        boardWidth = self.ground.get_width()
+        field = value_noise(boardWidth,boardWidth,20,self.random)
+        # hills are the highest part of the field
+        coverage = 1 - math.exp(-(self.width // 7) * 517 / len(field)) # 517 is the mean hill area
+        bottom = sorted(field)[int(len(field) * (1 - coverage))]
+        top = max(field)
+        if top <= bottom:
+            return
+        levels = [self.get_color_num((20,210 + 10 * level,20)) for level in range(5)]
+        for cell,value in enumerate(field):
+            if value >= bottom and self.maze.is_out(cell):
+                self.ground.cells[cell] = levels[min(int(5 * (value - bottom) / (top - bottom)),4)]
+
+    def draw_flowers(self,tile):
+        '''AdventureWorld.draw_flowers(tile)
+        draws the flowers in tile on top of the ground
+        tile: tuple (row,col) of a tile of the ground'''
+        canvas = self.screen.getcanvas()
+        tag = "flowers %d %d" % tile
+        for cell in self.flowerTiles.get(tile,[]):
+            x,y = self.maze.cell_to_coord(cell)
+            y = -y # canvas y goes down
+            for diamter,outColor,inColor in self.flowers[cell]:
+                # petals, then inside
+                for radius,color in ((self.blockSize * diamter / 2,outColor),
+                        (self.blockSize * diamter / 5,inColor)):
+                    canvas.create_oval(x - radius,y - radius,x + radius,y + radius,
+                        fill=self.renderer.get_hex(color),outline="",tags=tag)
+        canvas.tag_raise(tag,"ground")
+
+    @timed("AdventureWorld.update_view")
+    def update_view(self):
+        '''AdventureWorld.update_view()
+        draws the ground and flowers that came into view and takes away
+        the flowers that went out of view'''
+        self.renderer.update()
+        firstRow,lastRow,firstCol,lastCol = self.renderer.get_view()
+        inView = set((row,col) for row in range(firstRow,lastRow + 1)
+            for col in range(firstCol,lastCol + 1))
+        for tile in self.flowerView - inView:
+            self.screen.getcanvas().delete("flowers %d %d" % tile)
+        for tile in inView - self.flowerView:
+            self.draw_flowers(tile)
+        self.flowerView = inView
+
+    @timed("AdventureWorld.plan_world")
+    def plan_world(self):
+        '''AdventureWorld.plan_world()
+        lays out the whole adventure world on the ground grid and the
+        board without drawing anything'''
         # hills and grass coloring
-        for i in range(self.width // 7):
-            x,y = self.random_coord()
-            self.draw_hill(random.randint(15,35),random.randint(1,5),x,y)
-        for i in range(self.width * 10):
-            x,y = self.random_coord()
-            self.t.goto(self.random_coord())
-            self.t.stamp()
+        with phase("plan hills"):
+            self.draw_hills()
+        for x,y in self.random_coords(self.width * 10):
+            self.paint((0,180,0),x,y)
         # flowers
         for i in range(self.width * 7):
-            outColor = random.choice(["red","blue","pink"])
-            inColor = random.choice(["black","yellow"])
+            outColor = self.random.choice(["red","blue","pink"])
+            inColor = self.random.choice(["black","yellow"])
             x,y = self.random_coord()
-            self.draw_flower(2/random.randint(3,6),outColor,inColor,x,y)
+            self.draw_flower(2/self.random.randint(3,6),outColor,inColor,x,y)
         # sand
         for i in range(self.width // 5):
             x,y = self.random_coord()
-            self.draw_sand(random.randint(5,20),x,y)
-        # trees
-        for i in range(self.width * 3 // 2):
-            x,y = self.random_coord()
-            self.draw_tree(random.randrange(3,6,2),(0,random.randint(80,150),0),x,y)
-        # rocks
-        for i in range(self.width * 4 // 5):
-            x,y = self.random_coord()
-            color = random.randint(50,180)
-            self.draw_rock(random.randint(1,50),(color,color,color),x,y)
+            self.draw_sand(self.random.randint(5,20),x,y)
+        # trees, then rocks, spread out from each other
+        numTrees = self.width * 3 // 2
+        numRocks = self.width * 4 // 5
+        with phase("plan tree and rock spots"):
+            points = self.get_spread_coords(numTrees + numRocks)
+        for x,y in points[:numTrees]:
+            self.draw_tree(self.random.randrange(3,6,2),(0,self.random.randint(80,150),0),x,y)
+        for x,y in points[numTrees:]:
+            color = self.random.randint(50,180)
+            self.draw_rock(self.random.randint(1,50),(color,color,color),x,y)
         # pond
-        for i in range(random.randint(0,self.width // 25)):
+        for i in range(self.random.randint(0,self.width // 25)):
             x,y = self.random_coord()
-            self.draw_pond(random.randint(8,20),random.randint(2,6),x,y)
-        self.t.screen.bgcolor(0,200,0)
+            self.draw_pond(self.random.randint(8,20),self.random.randint(2,6),x,y)
+        self.maze.update_moves() # for the barriars
+
+    def get_layout(self):
+        '''AdventureWorld.get_layout() -> dict
+        returns the planned world as plain data, for the cache'''
+        return {"ground": bytes(self.ground.cells),"colors": self.colors,
+            "flowers": self.flowers,"barriars": self.maze.board.find_cells(BARRIAR)}
+
+    def set_layout(self,layout):
+        '''AdventureWorld.set_layout(layout) -> boolean
+        puts back a world from get_layout instead of planning it
+        returns False, without changing anything, if layout isn't one
+        get_layout could have made for this world
+        layout: dict'''
+        try:
+            ground,colors,flowers,barriars = (layout["ground"],layout["colors"],
+                layout["flowers"],layout["barriars"])
+        except (KeyError,TypeError):
+            return False
+        if not (isinstance(ground,bytes) and len(ground) == len(self.ground.cells)
+                and isinstance(colors,dict) and isinstance(flowers,dict)
+                and isinstance(barriars,list)):
+            return False
+        numCells = len(self.maze.board.cells)
+        if not set(ground) <= set(colors) | {0} or \
+           not all(isinstance(cell,int) and 0 <= cell < numCells for cell in barriars):
+            return False
+        self.ground.cells[:] = ground
+        self.colors = colors
+        self.colorNums = dict((color,colorNum) for colorNum,color in self.colors.items())
+        self.flowers = flowers
+        for cell in barriars:
+            self.maze.add_barriar(cell)
+        self.maze.update_moves()
+        return True
+
+    @timed("AdventureWorld.draw_world")
+    def draw_world(self):
+        '''AdventureWorld.draw_world()
+        plans the adventure world, then draws the part in view
+        the rest of it is only drawn when it comes into view'''
+        # the layout only depends on these, not on the maze in the middle
+        layoutParts = ("adventure",self.width,self.blockSize,self.seed)
+        layout = None
+        if self.cache != None and self.seed != None:
+            layout = self.cache.load_world(*layoutParts)
+        if layout == None or not self.set_layout(layout): # not kept, or not usable
+            self.plan_world()
+            if self.cache != None and self.seed != None:
+                self.cache.save_world(self.get_layout(),*layoutParts)
+        self.screen = turtle.Screen()
+        self.screen.bgcolor(0,200,0)
+
+        # draw the ground as tiles under everything else
+        self.renderer = TileRenderer(self.screen,self.ground,self.blockSize,
+            self.maze.get_center(),self.colors,tag="ground")
+        for cell in self.flowers:
+            self.flowerTiles.setdefault(self.renderer.get_tile(cell),[]).append(cell)
+        self.update_view()
+
+class EndlessPlayer(Player):
+    '''Represents the player going through an EndlessMaze'''
+
+    def move_screen(self):
+        '''EndlessPlayer.move_screen()
+        moves the screen to the position of the player
+        the canvas has no edge, so its scroll region is moved to be
+        around the player first'''
+        x,y = self.t.pos()
+        half = self.windowWidth / 2
+        self.canvas.config(scrollregion=(x - half,-y - half,x + half,-y + half))
+        self.canvas.xview_moveto((half - self.viewWidth/2)/self.windowWidth)
+        self.canvas.yview_moveto((half - self.viewWidth/2)/self.windowWidth)
+        self.maze.update_view()
+
+class EndlessMaze:
+    '''Represents a maze with no end, made of chunks that are generated
+    as they come into view'''
+
+    @timed("EndlessMaze.__init__")
+    def __init__(self, blockSize, passageColor, bgColor, algorithm="growing-tree", seed=None, chunkSize=16, maxChunks=64):
+        '''EndlessMaze(blockSize,passageColor,bgColor,[algorithm],[seed],[chunkSize],[maxChunks]) -> EndlessMaze
+        creates an endless maze. Only the chunks in view are generated
+        blockSize: int telling the width of each block
+        passageColor,bgColor: color string or tuple
+        algorithm: str name of the algorithm in GENERATORS for the chunks
+        seed: int seed so the maze repeats, or None
+        chunkSize: int even num blocks in the width of each chunk
+        maxChunks: int most chunks kept, others are made again if they
+            come back into view'''
+        self.blockSize = blockSize
+        self.chunkSize = chunkSize
+        self.bgColor = bgColor
+        if seed == None:
+            seed = get_random().randrange(2 ** 63)
+        self.seed = seed
+        self.world = ChunkWorld(seed,chunkSize,algorithm,maxChunks)
+        self.offsets = (-SPAN,1,SPAN,-1)
+
+        # start in the middle of the first chunk, which is always open
+        middle = chunkSize // 2 | 1
+        self.startCell = self.get_cell(middle,middle)
+
+        screen = turtle.Screen()
+        screen.setup(450,450)
+        screen.bgcolor(bgColor) # walls are left see through
+        self.renderer = ChunkRenderer(screen,self.world,blockSize,
+            {PASSAGE: passageColor,OUTSIDE: (0,180,0),BARRIAR: (120,120,120)})
+
+    def get_cell(self,row,col):
+        '''EndlessMaze.get_cell(row,col) -> int
+        returns the number of the cell at (row,col)
+        row,col: int'''
+        return row * SPAN + col
+
+    def row_col(self,cell):
+        '''EndlessMaze.row_col(cell) -> row,col
+        returns the row and column of cell
+        cell: int'''
+        row,col = divmod(cell + SPAN // 2,SPAN)
+        return row,col - SPAN // 2
+
+    def cell_to_coord(self,cell):
+        '''EndlessMaze.cell_to_coord(cell) -> tuple containing the x and y coordinates
+        returns the coordinates of the center of cell
+        cell: int'''
+        row,col = self.row_col(cell)
+        return col * self.blockSize,-row * self.blockSize
+
+    def get_directions(self,cell):
+        '''EndlessMaze.get_directions(cell) -> tuple
+        returns the directions the player can go from cell
+        cell: int'''
+        return self.world.get_directions(*self.row_col(cell))
+
+    def is_out(self,cell):
+        '''EndlessMaze.is_out(cell) -> boolean
+        there is no way out of an endless maze, so returns False
+        cell: int'''
+        return False
+
+    def get_offsets(self):
+        '''EndlessMaze.get_offsets() -> tuple
+        returns the cell offsets to go up, right, down and left'''
+        return self.offsets
+
+    def get_start(self):
+        '''EndlessMaze.get_start() -> int
+        returns the cell the player starts on'''
+        return self.startCell
+
+    def get_block_size(self):
+        '''EndlessMaze.get_block_size() -> int
+        returns an int representing the size of the blocks'''
+        return self.blockSize
+
+    def get_width(self):
+        '''EndlessMaze.get_width() -> int
+        returns the num blocks in the width of a chunk'''
+        return self.chunkSize
+
+    def get_seed(self):
+        '''EndlessMaze.get_seed() -> int
+        returns the seed of the maze'''
+        return self.seed
+
+    def get_bg(self):
+        '''EndlessMaze.get_bg()
+        returns the bg color of the maze'''
+        return self.bgColor
+
+    @timed("EndlessMaze.update_view")
+    def update_view(self):
+        '''EndlessMaze.update_view()
+        draws the chunks that came into view, generating them if they
+        aren't kept'''
+        self.renderer.update()
             
-turtle.tracer(0)
-turtle.colormode(255)
-wn = turtle.Screen()
-wn.title("Maze")
-
-# get difficulty
-userInput = int(wn.numinput("Difficulty","Hard (1), Medium (2), or Easy (3)?",2,1,3))
-if userInput == 1:
-    maze = Maze(101,50,(229,223,215),(75,57,34))
-elif userInput == 2:
-    maze = Maze(51,50,(229,223,215),(75,57,34))
-else:
-    maze = Maze(25,50,(229,223,215),(75,57,34))
-player = Player(maze,'red')
-
-wn.onkeypress(player.go_up,"Up")
-wn.onkeypress(player.go_right,"Right")
-wn.onkeypress(player.go_down,"Down")
-wn.onkeypress(player.go_left,"Left")
-wn.onkeypress(player.pen_control,"space")
-wn.listen()
-
-wn.mainloop()
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Find your way through a maze in the woods")
+    parser.add_argument("--algorithm",choices=GENERATORS,default="growing-tree",
+        help="algorithm to generate the maze with")
+    parser.add_argument("--load",help="saved maze file to play instead of generating one")
+    parser.add_argument("--save",help="file to save the maze to")
+    parser.add_argument("--seed",type=int,default=None,
+        help="seed so the same maze and world come up again")
+    parser.add_argument("--no-cache",action="store_true",
+        help="don't keep seeded mazes and worlds on disk")
+    parser.add_argument("--endless",action="store_true",
+        help="play a maze with no end, generated as you go")
+    args = parser.parse_args()
+    if args.endless and (args.load != None or args.save != None):
+        parser.error("--load and --save can't be used with --endless")
+
+    turtle.tracer(0)
+    turtle.colormode(255)
+    wn = turtle.Screen()
+    wn.title("Maze")
+
+    if args.endless:
+        maze = EndlessMaze(50,(229,223,215),(75,57,34),args.algorithm,args.seed)
+        player = EndlessPlayer(maze,'red')
+    else:
+        algorithm,seed = args.algorithm,args.seed
+        if args.load != None: # the saved maze decides the width
+            with MazeFile(args.load) as mazeFile:
+                width = mazeFile.get_width()
+                # kept when it's saved again
+                algorithm,seed = mazeFile.get_algorithm(),mazeFile.get_seed()
+                if args.seed == None: # same world too
+                    args.seed = seed
+        else: # get difficulty
+            userInput = int(wn.numinput("Difficulty","Hard (1), Medium (2), or Easy (3)?",2,1,3))
+            width = (101,51,25)[userInput - 1]
+        cache = None
+        if not args.no_cache:
+            try:
+                cache = MazeCache()
+            except OSError: # can't make the folder, play without it
+                pass
+        maze = Maze(width,50,(229,223,215),(75,57,34),algorithm,args.seed,True,args.load,cache)
+        if args.save != None:
+            save_maze(args.save,maze.get_grid(),algorithm,seed)
+        player = Player(maze,'red')
+        wn.onkeypress(player.show_hint,"h") # an endless maze has no way out to show
+
+    wn.onkeypress(player.go_up,"Up")
+    wn.onkeypress(player.go_right,"Right")
+    wn.onkeypress(player.go_down,"Down")
+    wn.onkeypress(player.go_left,"Left")
+    wn.onkeypress(player.pen_control,"space")
+    wn.listen()
+
+    wn.mainloop()
@@ -0,0 +1,154 @@
+# Maze Batch
+# generates lots of mazes at once across processes and saves each one
+# as a maze file (see maze_format), with a manifest listing them
+
+import os
+import sys
+import json
+import time
+import random
+import hashlib
+import itertools
+import argparse
+import multiprocessing
+from maze_engine import GENERATORS, EllerMazeGenerator, check_size, generate
+from maze_format import save_maze, save_rows
+
+def get_seed(masterSeed,index):
+    '''get_seed(masterSeed,index) -> int
+    returns the seed of maze index in a batch, worked out from the
+    master seed so the batch is the same however many processes make it
+    masterSeed: int
+    index: int'''
+    digest = hashlib.sha256(b"%d:%d" % (masterSeed,index)).digest()
+    return int.from_bytes(digest[:8],"little") >> 1 # fits the signed seed in a maze file
+
+def get_filename(directory,index):
+    '''get_filename(directory,index) -> str
+    returns the file maze index is saved in
+    directory: str
+    index: int'''
+    return os.path.join(directory,"maze_%06d.maze" % index)
+
+def make_maze(job):
+    '''make_maze(job) -> dict
+    generates and saves one maze and returns its manifest entry
+    runs in the worker processes, so only this small entry goes back
+    job: tuple (index,seed,algorithm,width,height,directory)'''
+    index,seed,algorithm,width,height,directory = job
+    start = time.perf_counter()
+    filename = get_filename(directory,index)
+    if algorithm == "eller": # rows go straight to the file, for very tall mazes
+        check_size(width,height)
+        mazeGen = EllerMazeGenerator(width,height,seed)
+        width,height = mazeGen.width,mazeGen.height
+        save_rows(filename,mazeGen.generate_rows(),width,height,algorithm,seed)
+    else:
+        grid = generate(algorithm,width,height,seed)
+        width,height = grid.get_width(),grid.get_height()
+        save_maze(filename,grid,algorithm,seed)
+    return {"index": index,"seed": seed,"file": os.path.basename(filename),
+        "width": width,"height": height,"seconds": time.perf_counter() - start}
+
+def get_jobs(count,masterSeed,algorithm,width,height,directory):
+    '''get_jobs(count,masterSeed,algorithm,width,height,directory) -> generator
+    gives the job of each maze as it's needed, so a big batch doesn't
+    sit in memory'''
+    for index in range(count):
+        yield (index,get_seed(masterSeed,index),algorithm,width,height,directory)
+
+def make_mazes(pool,jobs,chunkSize,windowSize):
+    '''make_mazes(pool,jobs,chunkSize,windowSize) -> generator
+    gives the manifest entries of jobs as the pool finishes them, in any
+    order. Jobs are handed to the pool windowSize at a time, since it
+    would otherwise queue every job at once
+    pool: multiprocessing.Pool
+    jobs: iterator of jobs for make_maze
+    chunkSize: int num jobs sent to a worker at a time
+    windowSize: int most jobs given to the pool at once'''
+    while True:
+        window = list(itertools.islice(jobs,windowSize))
+        if len(window) == 0:
+            return
+        for entry in pool.imap_unordered(make_maze,window,chunkSize):
+            yield entry
+
+def run_batch(count,algorithm,width,height,masterSeed,directory,processes=None,log=None):
+    '''run_batch(count,algorithm,width,height,masterSeed,directory,[processes],[log]) -> dict
+    generates count mazes into directory and writes manifest.jsonl there,
+    a line for each maze as it's finished. Returns a summary
+    count: int num mazes
+    algorithm: str name of an algorithm in GENERATORS
+    width,height: int size of each maze
+    masterSeed: int seed the seed of each maze comes from
+    directory: str folder to save in, made if it isn't there
+    processes: int num worker processes, None for one per CPU. 1 runs
+        without a pool
+    log: file to write progress to, or None'''
+    if processes == None:
+        processes = os.cpu_count() or 1
+    os.makedirs(directory,exist_ok=True)
+    jobs = get_jobs(count,masterSeed,algorithm,width,height,directory)
+
+    pool = None
+    if processes > 1:
+        pool = multiprocessing.Pool(processes)
+        # a few jobs per trip to a worker, and enough trips in a window
+        # that the wait for the last ones at its end is short
+        chunkSize = max(1,min(16,count // (4 * processes)))
+        entries = make_mazes(pool,jobs,chunkSize,16 * chunkSize * processes)
+    else:
+        entries = map(make_maze,jobs)
+
+    start = time.perf_counter()
+    lastLog = start
+    done = 0
+    cells = 0
+    try:
+        with open(os.path.join(directory,"manifest.jsonl"),"w") as manifest:
+            manifest.write(json.dumps({"algorithm": algorithm,"width": width,"height": height,
+                "count": count,"masterSeed": masterSeed}) + "\n")
+            for entry in entries:
+                manifest.write(json.dumps(entry) + "\n")
+                done += 1
+                cells += entry["width"] * entry["height"]
+                now = time.perf_counter()
+                if log != None and (now - lastLog >= 1 or done == count):
+                    lastLog = now
+                    log.write("%d/%d mazes, %.1f mazes/s, %.0f cells/s\n" % (done,count,
+                        done / (now - start),cells / (now - start)))
+    finally:
+        if pool != None:
+            pool.close()
+            pool.join()
+
+    seconds = time.perf_counter() - start
+    return {"count": done,"seconds": seconds,"processes": processes,
+        "mazesPerSecond": done / seconds if seconds > 0 else None,
+        "cellsPerSecond": cells / seconds if seconds > 0 else None}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a batch of mazes into a folder")
+    parser.add_argument("count",type=int,help="num mazes to generate")
+    parser.add_argument("--algorithm",choices=GENERATORS,default="growing-tree",
+        help="algorithm to generate the mazes with")
+    parser.add_argument("--width",type=int,default=25,help="width of each maze")
+    parser.add_argument("--height",type=int,default=None,help="height of each maze (default width)")
+    parser.add_argument("--seed",type=int,default=None,
+        help="master seed the seed of each maze comes from (default random)")
+    parser.add_argument("--output",default="mazes",help="folder to save the mazes in")
+    parser.add_argument("--processes",type=int,default=None,
+        help="num worker processes (default one per CPU)")
+    args = parser.parse_args()
+
+    if args.height == None:
+        args.height = args.width
+    try: # before the folder is made
+        check_size(args.width,args.height)
+    except ValueError as error:
+        parser.error(str(error))
+    if args.seed == None: # still written in the manifest so the batch can be made again
+        args.seed = random.randrange(2 ** 63)
+    summary = run_batch(args.count,args.algorithm,args.width,args.height,args.seed,
+        args.output,args.processes,sys.stderr)
+    print(json.dumps(summary))
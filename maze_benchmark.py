@@ -0,0 +1,212 @@
+# Maze Benchmark
+# times the maze generators and the adventure world without drawing
+# anything and prints the results as JSON
+
+import sys
+import gc
+import time
+import json
+import platform
+import argparse
+import tracemalloc
+from maze_engine import GENERATORS, generate
+from maze_chunks import ChunkWorld
+
+try:
+    import numpy
+except ImportError: # no wilson-numpy, and the adventure world's noise is plain Python
+    numpy = None
+
+def setup_generator(algorithm):
+    '''setup_generator(algorithm) -> function
+    returns a setup function for generating a maze with algorithm
+    this is what Maze.py and Maze_wilson_alg.py call in generate_maze
+    algorithm: str name of an algorithm in GENERATORS'''
+    def setup(size,seed):
+        def run():
+            return generate(algorithm,size,size,seed)
+        return run,size * size
+    return setup
+
+def setup_adventure_world(size,seed):
+    '''setup_adventure_world(size,seed) -> function,int
+    returns a function planning the adventure world around a size x size
+    maze and the num cells of ground it plans
+    the maze itself is generated here, so it isn't timed'''
+    # imported here, since it needs turtle and Tk which servers may not have
+    from maze_adventure_world import Maze as AdventureMaze
+    maze = AdventureMaze(size,50,(229,223,215),(75,57,34),"growing-tree",seed,False)
+    world = maze.adventureWorld
+    return world.plan_world,world.ground.get_width() * world.ground.get_height()
+
+def setup_endless_chunk(size,seed):
+    '''setup_endless_chunk(size,seed) -> function,int
+    returns a function generating one maze chunk of an endless maze,
+    which is all the endless mode makes to start, and the num cells in it
+    size: width of the chunk, made even'''
+    world = ChunkWorld(seed,max(4,2 * (size // 2)),"growing-tree",64,0) # no clearings, they're quicker
+    return lambda: world.make_chunk(0,0),world.get_chunk_size() ** 2
+
+# setup functions by benchmark name. Each takes the size and seed and
+# returns the function to time and the num cells it makes
+BENCHMARKS = dict((algorithm,setup_generator(algorithm)) for algorithm in GENERATORS)
+BENCHMARKS["adventure-world"] = setup_adventure_world
+BENCHMARKS["endless-chunk"] = setup_endless_chunk
+
+def get_collections():
+    '''get_collections() -> int
+    returns the num garbage collections so far, in all generations'''
+    return sum(stats["collections"] for stats in gc.get_stats())
+
+def measure(setup,size,seed,minSeconds=0.2):
+    '''measure(setup,size,seed,[minSeconds]) -> dict
+    runs a benchmark for time, then once more for memory since
+    tracemalloc slows everything down
+    short runs are repeated until they take minSeconds in all and the
+    fastest is kept, so noise doesn't swamp them
+    seconds: wall time
+    peakBytes: most memory allocated at once, from tracemalloc
+    blocks: num memory blocks still used by what was made
+    gcCollections: num garbage collections. Python runs one about every
+        700 new objects, so this counts allocations
+    setup: function from BENCHMARKS
+    size: int width of the maze
+    seed: int
+    minSeconds: float (default 0.2)'''
+    run,cells = setup(size,seed)
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    collections = get_collections()
+    start = time.perf_counter()
+    result = run()
+    seconds = time.perf_counter() - start
+    collections = get_collections() - collections
+    blocks = sys.getallocatedblocks() - blocks
+    del result
+
+    totalSeconds = seconds
+    while totalSeconds < minSeconds:
+        run,cells = setup(size,seed) # the same seed makes the same thing again
+        start = time.perf_counter()
+        run()
+        repeatSeconds = time.perf_counter() - start
+        seconds = min(seconds,repeatSeconds)
+        totalSeconds += repeatSeconds
+
+    run,cells = setup(size,seed)
+    gc.collect()
+    tracemalloc.start()
+    result = run()
+    peakBytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+
+    return {"seconds": seconds,"cells": cells,"peakBytes": peakBytes,
+        "blocks": blocks,"gcCollections": collections}
+
+def median(values):
+    '''median(values) -> number
+    returns the middle of values
+    values: list of numbers'''
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2 == 1:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2
+
+def run_benchmarks(names,sizes,seeds,log=None):
+    '''run_benchmarks(names,sizes,seeds,[log]) -> list
+    returns a result for each benchmark and size, with the median over
+    the seeds (the largest for peakBytes)
+    names: list of names in BENCHMARKS
+    sizes: list of int maze widths
+    seeds: list of int seeds
+    log: file to write progress to, or None'''
+    results = []
+    for name in names:
+        for size in sizes:
+            runs = []
+            for seed in seeds:
+                runs.append(measure(BENCHMARKS[name],size,seed))
+            seconds = median([run["seconds"] for run in runs])
+            cells = runs[0]["cells"]
+            results.append({"benchmark": name,"size": size,"seeds": list(seeds),
+                "seconds": seconds,"cells": cells,
+                "cellsPerSecond": cells / seconds if seconds > 0 else None,
+                "peakBytes": max(run["peakBytes"] for run in runs),
+                "blocks": median([run["blocks"] for run in runs]),
+                "gcCollections": median([run["gcCollections"] for run in runs])})
+            if log != None:
+                log.write("%s %d: %.4fs\n" % (name,size,seconds))
+    return results
+
+def check_baseline(report,baseline):
+    '''check_baseline(report,baseline)
+    raises ValueError if baseline was run with another Python or with
+    NumPy where report wasn't, or the other way around, since the times
+    can't be compared then
+    report,baseline: dict reports'''
+    for key in ("python","numpy"):
+        if report[key] != baseline.get(key):
+            raise ValueError("the baseline was run with %s %s, not %s" % (key,baseline.get(key),report[key]))
+
+def compare(results,baseline,tolerance):
+    '''compare(results,baseline,tolerance) -> list
+    adds the ratio to the baseline to each result that is in it and
+    returns the regressions, where time or peak memory went up by more
+    than tolerance
+    results: list from run_benchmarks
+    baseline: dict of an earlier report
+    tolerance: float fraction, 0.3 allows 30% slower'''
+    before = dict(((result["benchmark"],result["size"]),result) for result in baseline["results"])
+    regressions = []
+    for result in results:
+        old = before.get((result["benchmark"],result["size"]))
+        if old == None:
+            continue
+        for key,ratio in (("seconds","secondsRatio"),("peakBytes","peakBytesRatio")):
+            if old[key] <= 0:
+                continue
+            result[ratio] = result[key] / old[key]
+            if result[ratio] > 1 + tolerance:
+                regressions.append({"benchmark": result["benchmark"],"size": result["size"],
+                    "measure": key,"ratio": result[ratio]})
+    return regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time the maze generators and the adventure world")
+    parser.add_argument("--benchmarks",nargs="+",choices=BENCHMARKS,default=list(BENCHMARKS),
+        help="benchmarks to run (default all)")
+    parser.add_argument("--sizes",nargs="+",type=int,default=[25,51,101,201,501,1001],
+        help="maze widths to run each benchmark at")
+    parser.add_argument("--seeds",type=int,default=3,
+        help="num seeds to run each size with, starting at 0")
+    parser.add_argument("--output",help="file to write the JSON report to instead of printing it")
+    parser.add_argument("--baseline",help="earlier JSON report to compare against")
+    parser.add_argument("--tolerance",type=float,default=0.3,
+        help="fraction slower or bigger than the baseline that counts as a regression")
+    args = parser.parse_args()
+
+    report = {"python": platform.python_version(),"numpy": numpy != None}
+    baseline = None
+    if args.baseline != None: # checked first so the benchmarks aren't run for nothing
+        with open(args.baseline) as baselineFile:
+            baseline = json.load(baselineFile)
+        try:
+            check_baseline(report,baseline)
+        except ValueError as error:
+            parser.error(str(error))
+
+    report["results"] = run_benchmarks(args.benchmarks,args.sizes,range(args.seeds),sys.stderr)
+    if baseline != None:
+        report["regressions"] = compare(report["results"],baseline,args.tolerance)
+
+    if args.output != None:
+        with open(args.output,"w") as outputFile:
+            json.dump(report,outputFile,indent=2)
+    else:
+        print(json.dumps(report,indent=2))
+
+    # fail so regressions stop scripts
+    if len(report.get("regressions",[])) > 0:
+        sys.exit(1)
@@ -0,0 +1,147 @@
+# Maze Cache
+# keeps seeded mazes and adventure world layouts on disk so the same seed
+# doesn't have to be generated twice
+# files are named by a hash of everything that decides what they hold,
+# and the least recently used ones are removed when the cache gets too big
+
+import os
+import pickle
+import hashlib
+from maze_engine import ENGINE_VERSION, generate
+from maze_layout import LAYOUT_VERSION
+from maze_format import save_maze, load_maze
+
+def get_cache_directory():
+    '''get_cache_directory() -> str
+    returns the default folder for the cache'''
+    cacheHome = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"),".cache")
+    return os.path.join(cacheHome,"mazes")
+
+class MazeCache:
+    '''Keeps generated mazes and world layouts in a folder'''
+
+    def __init__(self,directory=None,maxBytes=64 * 1024 * 1024):
+        '''MazeCache([directory],[maxBytes]) -> MazeCache
+        creates a cache in directory, which is made if it isn't there
+        directory: str folder, None for get_cache_directory()
+        maxBytes: int most bytes of files to keep (default 64 MB)'''
+        if directory == None:
+            directory = get_cache_directory()
+        self.directory = directory
+        self.maxBytes = maxBytes
+        os.makedirs(self.directory,exist_ok=True)
+
+    def get_path(self,kind,*parts):
+        '''MazeCache.get_path(kind,*parts) -> str
+        returns the file for the thing made from parts
+        kind: str file extension, "maze" or "world"
+        parts: everything that decides what is in the file'''
+        key = hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.directory,key + "." + kind)
+
+    def use(self,path):
+        '''MazeCache.use(path) -> boolean
+        marks path as just used, so it is removed last
+        returns False if it isn't in the cache
+        path: str file in the cache'''
+        try:
+            os.utime(path)
+        except OSError: # not there, or just removed
+            return False
+        return True
+
+    def generate(self,algorithm,width,height,seed):
+        '''MazeCache.generate(algorithm,width,height,seed) -> MazeGrid
+        returns the maze generate would give, from the cache if it's
+        there, else generates it and keeps it
+        algorithm: str name of an algorithm in GENERATORS
+        width,height: int
+        seed: int seed, None isn't cached since each maze is different'''
+        if seed == None:
+            return generate(algorithm,width,height)
+        path = self.get_path("maze",algorithm,width,height,seed,ENGINE_VERSION)
+        if self.use(path):
+            try:
+                return load_maze(path)
+            except (OSError,ValueError): # broken file, make it again
+                pass
+        grid = generate(algorithm,width,height,seed)
+        self.save(path,lambda tempPath: save_maze(tempPath,grid,algorithm,seed))
+        return grid
+
+    def load_world(self,*parts):
+        '''MazeCache.load_world(*parts) -> dict
+        returns the world layout kept for parts, or None if there isn't one
+        parts: everything that decides the world layout'''
+        path = self.get_path("world",LAYOUT_VERSION,ENGINE_VERSION,*parts)
+        if not self.use(path):
+            return None
+        try:
+            with open(path,"rb") as worldFile:
+                data = worldFile.read()
+        except OSError: # just removed
+            return None
+        # the file starts with a hash of the rest, so a broken file is
+        # found before unpickling it
+        if hashlib.sha256(data[32:]).digest() != data[:32]:
+            return None
+        try:
+            layout = pickle.loads(data[32:])
+        except Exception: # made by another version of Python, or anything else
+            return None
+        if not isinstance(layout,dict):
+            return None
+        return layout
+
+    def save_world(self,layout,*parts):
+        '''MazeCache.save_world(layout,*parts)
+        keeps a world layout for parts
+        layout: dict of plain data
+        parts: everything that decides the world layout'''
+        path = self.get_path("world",LAYOUT_VERSION,ENGINE_VERSION,*parts)
+        data = pickle.dumps(layout,pickle.HIGHEST_PROTOCOL)
+        def write(tempPath):
+            with open(tempPath,"wb") as worldFile:
+                worldFile.write(hashlib.sha256(data).digest() + data)
+        self.save(path,write)
+
+    def save(self,path,write):
+        '''MazeCache.save(path,write)
+        writes a file through a temporary file, so a half written file is
+        never read, then makes room. If it can't be written, nothing is kept
+        path: str file in the cache
+        write: function(tempPath) that writes the file'''
+        tempPath = path + ".%d.tmp" % os.getpid()
+        try:
+            write(tempPath)
+            os.replace(tempPath,path)
+        except Exception: # a full disk, or a seed too big for a maze file, only means no caching
+            return
+        finally:
+            try:
+                os.remove(tempPath) # only still there if something went wrong
+            except OSError:
+                pass
+        self.evict()
+
+    def evict(self):
+        '''MazeCache.evict()
+        removes the least recently used files until the cache fits in
+        maxBytes'''
+        files = []
+        totalBytes = 0
+        for entry in os.scandir(self.directory):
+            # temporary files too, in case a game was stopped part way through writing
+            if entry.name.endswith((".maze",".world",".tmp")):
+                stat = entry.stat()
+                files.append((stat.st_mtime,stat.st_size,entry.path))
+                totalBytes += stat.st_size
+        files.sort()
+        for usedTime,size,path in files:
+            if totalBytes <= self.maxBytes:
+                break
+            try:
+                os.remove(path)
+            except OSError: # another game removed it
+                pass
+            totalBytes -= size
@@ -0,0 +1,115 @@
+# Maze Chunks
+# an endless maze split into square chunks. Each chunk is generated from
+# the world seed and its own position when it's first needed, so it comes
+# out the same whichever order the chunks are visited in, and chunks that
+# haven't been used for a while can be thrown away and made again later
+#
+# a chunk is chunkSize x chunkSize cells, chunkSize even. Its top row and
+# left column are the walls it shares with the chunks above and to the
+# left, each with one door in it, so every chunk is joined to the four
+# around it and the whole world is connected
+
+import hashlib
+from collections import OrderedDict
+from maze_engine import MazeGrid, generate, get_random, PASSAGE, OUTSIDE, BARRIAR
+
+def get_chunk_seed(seed,kind,chunkRow,chunkCol):
+    '''get_chunk_seed(seed,kind,chunkRow,chunkCol) -> int
+    returns the seed of one thing about a chunk, worked out from the world
+    seed so it doesn't depend on any other chunk
+    seed: int world seed
+    kind: str what the seed is for
+    chunkRow,chunkCol: int position of the chunk'''
+    digest = hashlib.sha256(b"%d:%s:%d:%d" % (seed,kind.encode("ascii"),chunkRow,chunkCol)).digest()
+    return int.from_bytes(digest[:8],"little")
+
+class ChunkWorld:
+    '''Endless maze made of chunks that are generated as they're needed'''
+
+    def __init__(self,seed,chunkSize=16,algorithm="growing-tree",maxChunks=64,clearings=0.2):
+        '''ChunkWorld(seed,[chunkSize],[algorithm],[maxChunks],[clearings]) -> ChunkWorld
+        creates a world. No chunk is made until it's asked for
+        seed: int world seed
+        chunkSize: int even num cells in the width of each chunk (default 16)
+        algorithm: str name of the algorithm in GENERATORS for maze chunks
+        maxChunks: int most chunks kept at once (default 64)
+        clearings: float part of the chunks that are open ground instead
+            of maze (default 0.2)'''
+        if chunkSize < 4 or chunkSize % 2 != 0:
+            raise ValueError("chunkSize must be even and at least 4")
+        self.seed = seed
+        self.chunkSize = chunkSize
+        self.algorithm = algorithm
+        self.maxChunks = maxChunks
+        self.clearings = clearings
+        self.chunks = OrderedDict() # chunk at each (chunkRow,chunkCol), last used last
+        self.numMade = 0 # num chunks generated, counting ones made again
+
+    def get_chunk_size(self):
+        '''ChunkWorld.get_chunk_size() -> int
+        returns the num cells in the width of each chunk'''
+        return self.chunkSize
+
+    def get_chunk(self,chunkRow,chunkCol):
+        '''ChunkWorld.get_chunk(chunkRow,chunkCol) -> MazeGrid
+        returns the chunk at (chunkRow,chunkCol), generating it if it isn't
+        kept, and throws away the least recently used chunks if there are
+        too many
+        chunkRow,chunkCol: int'''
+        key = (chunkRow,chunkCol)
+        if key in self.chunks:
+            self.chunks.move_to_end(key)
+            return self.chunks[key]
+        chunk = self.make_chunk(chunkRow,chunkCol)
+        self.chunks[key] = chunk
+        while len(self.chunks) > self.maxChunks:
+            self.chunks.popitem(last=False)
+        return chunk
+
+    def make_chunk(self,chunkRow,chunkCol):
+        '''ChunkWorld.make_chunk(chunkRow,chunkCol) -> MazeGrid
+        generates the chunk at (chunkRow,chunkCol)
+        chunkRow,chunkCol: int'''
+        self.numMade += 1
+        size = self.chunkSize
+        rand = get_random(get_chunk_seed(self.seed,"chunk",chunkRow,chunkCol))
+        chunk = MazeGrid(size,size)
+        if rand.random() < self.clearings:
+            # open ground with rocks dotted where no two can touch, so
+            # they can't cut any of it off
+            chunk.fill(1,1,size - 1,size - 1,OUTSIDE)
+            for row in range(2,size - 1,2):
+                for col in range(2,size - 1,2):
+                    if rand.random() < 0.3:
+                        chunk.cells[row * size + col] = BARRIAR
+        else:
+            # a maze one bigger, without its bottom and right walls since
+            # those are the top and left walls of the next chunks
+            maze = generate(self.algorithm,size + 1,size + 1,rand.randrange(2 ** 63))
+            for row in range(size):
+                chunk.cells[row * size:(row + 1) * size] = maze.cells[row * (size + 1):row * (size + 1) + size]
+
+        # doors through the top and left walls
+        chunk.cut(0,2 * rand.randrange(size // 2) + 1)
+        chunk.cut(2 * rand.randrange(size // 2) + 1,0)
+        return chunk
+
+    def get_state(self,row,col):
+        '''ChunkWorld.get_state(row,col) -> int
+        returns the state of the cell at (row,col) of the world, which
+        can be any int
+        row,col: int'''
+        chunkRow,row = divmod(row,self.chunkSize)
+        chunkCol,col = divmod(col,self.chunkSize)
+        return self.get_chunk(chunkRow,chunkCol).get_cell(row,col)
+
+    def get_directions(self,row,col):
+        '''ChunkWorld.get_directions(row,col) -> tuple
+        returns the directions (up: 0, right: 1, down: 2, left: 3) that can
+        be moved in from the cell at (row,col)
+        row,col: int'''
+        directions = []
+        for direction,(rowStep,colStep) in enumerate(((-1,0),(0,1),(1,0),(0,-1))):
+            if self.get_state(row + rowStep,col + colStep) in (PASSAGE,OUTSIDE):
+                directions.append(direction)
+        return tuple(directions)
@@ -0,0 +1,931 @@
+# Maze Engine
+# generates mazes as plain data so no turtle window is needed
+
+import random
+
+try:
+    import numpy
+except ImportError: # NumPy is optional, only NumpyWilsonMazeGenerator needs it
+    numpy = None
+
+# change when the same seed would make a different maze, so cached
+# mazes aren't used
+ENGINE_VERSION = 2
+
+## CELL STATES ##
+WALL    = 0 # cell the player can't go through
+PASSAGE = 1 # cell that is part of the maze
+OUTSIDE = 2 # open ground around the maze
+BARRIAR = 3 # ground around the maze the player can't go through
+
+## MOVES ##
+# a moves table has a byte for each cell with bit 1 << direction set if
+# the player can go up (0), right (1), down (2) or left (3) from it
+OUT = 16 # bit set on cells out of the maze
+# directions that can be moved in for each byte of a moves table
+MOVE_DIRECTIONS = tuple(tuple(direction for direction in range(4) if moves & 1 << direction)
+    for moves in range(256))
+
+# ways GrowingTreeGenerator can pick the next cell
+GROWING_TREE_POLICIES = ("newest","random","oldest")
+
+def get_random(seed=None):
+    '''get_random([seed]) -> random.Random
+    returns a random number generator for seed, or the random module
+    itself if seed is None so random.seed still repeats mazes
+    seed: int seed or None'''
+    if seed == None:
+        return random
+    return random.Random(seed)
+
+class MazeGrid:
+    '''Represents a generated maze as a grid of cell states'''
+
+    def __init__(self,width,height,state=WALL):
+        '''MazeGrid(width,height,[state]) -> MazeGrid
+        creates a grid with dimensions width x height where every cell is state
+        row 0 is the top of the maze and column 0 is the left side
+        cells are stored one byte each, row by row, so cell (row,col) is at
+        index row * width + col
+        width: int telling the num cells in width
+        height: int telling the num cells in height
+        state: int cell state (default WALL)'''
+        self.width = width
+        self.height = height
+
+        # grid of cells
+        self.cells = bytearray([state]) * (self.width * self.height)
+
+        # index offsets to the next cell up, right, down and left
+        self.offsets = (-self.width,1,self.width,-1)
+
+    def __str__(self):
+        '''MazeGrid.__str__() -> str
+        outputs a string version of the grid'''
+        out = ""
+        for row in range(self.height):
+            rowCells = self.cells[row * self.width:(row + 1) * self.width]
+            out += " ".join(str(cell) for cell in rowCells)
+            out += "\n"
+        return out
+
+    def get_width(self):
+        '''MazeGrid.get_width() -> int
+        returns the num cells in width'''
+        return self.width
+
+    def get_height(self):
+        '''MazeGrid.get_height() -> int
+        returns the num cells in height'''
+        return self.height
+
+    def get_offsets(self):
+        '''MazeGrid.get_offsets() -> tuple
+        returns the index offsets to the next cell up, right, down and left'''
+        return self.offsets
+
+    def index(self,row,col):
+        '''MazeGrid.index(row,col) -> int
+        returns the index of the cell at (row,col)
+        row,col: int'''
+        return row * self.width + col
+
+    def row_col(self,index):
+        '''MazeGrid.row_col(index) -> row,col
+        returns the row and column of the cell at index
+        index: int'''
+        return divmod(index,self.width)
+
+    def in_grid(self,row,col):
+        '''MazeGrid.in_grid(row,col) -> boolean
+        returns True if (row,col) is inside the grid. Else returns False
+        row,col: int'''
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def get_cell(self,row,col):
+        '''MazeGrid.get_cell(row,col) -> int
+        returns the state of the cell at (row,col)
+        row,col: int'''
+        return self.cells[row * self.width + col]
+
+    def is_passage(self,row,col):
+        '''MazeGrid.is_passage(row,col) -> boolean
+        returns True if the cell at (row,col) is a passage. Else returns False
+        row,col: int'''
+        return self.cells[row * self.width + col] == PASSAGE
+
+    def cut(self,row,col):
+        '''MazeGrid.cut(row,col)
+        makes the cell at (row,col) a passage
+        row,col: int'''
+        self.cells[row * self.width + col] = PASSAGE
+
+    def get_state(self,index):
+        '''MazeGrid.get_state(index) -> int
+        returns the state of the cell at index
+        index: int'''
+        return self.cells[index]
+
+    def set_state(self,index,state):
+        '''MazeGrid.set_state(index,state)
+        sets the state of the cell at index
+        index: int
+        state: int cell state'''
+        self.cells[index] = state
+
+    def fill(self,row,col,width,height,state):
+        '''MazeGrid.fill(row,col,width,height,state)
+        sets every cell in the rectangle with top left corner (row,col) to state
+        row,col: int
+        width,height: int size of the rectangle
+        state: int cell state'''
+        for r in range(row,row + height):
+            start = r * self.width + col
+            self.cells[start:start + width] = bytes([state]) * width
+
+    def paste(self,grid,row,col):
+        '''MazeGrid.paste(grid,row,col)
+        copies every cell of grid into this grid with its top left corner at (row,col)
+        grid: MazeGrid that fits inside this grid
+        row,col: int'''
+        for r in range(grid.height):
+            start = (row + r) * self.width + col
+            self.cells[start:start + grid.width] = grid.cells[r * grid.width:(r + 1) * grid.width]
+
+    def get_moves(self,openStates,inside=None):
+        '''MazeGrid.get_moves(openStates,[inside]) -> bytearray
+        returns a moves table for the grid: a byte for each cell with bit
+        1 << direction set if the next cell that way has a state in openStates
+        each direction is worked out for the whole grid at once by lining
+        the cells up with their neighbors as one big int
+        openStates: collection of int cell states the player can go on
+        inside: (top,left,bottom,right) rows and columns of the maze. Cells
+            outside it get the OUT bit. None leaves OUT off (default)'''
+        size = len(self.cells)
+        allBits = (1 << 8 * size) - 1
+        moves = 0
+        for direction,offset in enumerate(self.offsets):
+            # 1 << direction on each open cell
+            table = bytes(1 << direction if state in openStates else 0 for state in range(256))
+            openBits = int.from_bytes(self.cells.translate(table),"little")
+            # move each cell's neighbor onto it
+            if offset > 0:
+                openBits >>= 8 * offset
+            else:
+                openBits = (openBits << -8 * offset) & allBits
+            # keep rows from wrapping into each other
+            if direction == 1:   # nothing right of the last column
+                openBits &= int.from_bytes((b"\xff" * (self.width - 1) + b"\x00") * self.height,"little")
+            elif direction == 3: # nothing left of the first column
+                openBits &= int.from_bytes((b"\x00" + b"\xff" * (self.width - 1)) * self.height,"little")
+            moves |= openBits
+        moves = bytearray(moves.to_bytes(size,"little"))
+
+        if inside != None:
+            top,left,bottom,right = inside
+            outTable = bytes(cellMoves | OUT for cellMoves in range(256))
+            for row in range(self.height):
+                start = row * self.width
+                end = start + self.width
+                if top <= row <= bottom: # just the sides are out
+                    moves[start:start + left] = moves[start:start + left].translate(outTable)
+                    moves[start + right + 1:end] = moves[start + right + 1:end].translate(outTable)
+                else:
+                    moves[start:end] = moves[start:end].translate(outTable)
+        return moves
+
+    def find_cells(self,state):
+        '''MazeGrid.find_cells(state) -> list
+        returns the indexes of every cell with state in increasing order
+        state: int cell state'''
+        return [index for index,cellState in enumerate(self.cells) if cellState == state]
+
+    def get_passages(self):
+        '''MazeGrid.get_passages() -> list
+        returns a list of (row,col) tuples for every passage cell'''
+        return [divmod(index,self.width) for index in self.find_cells(PASSAGE)]
+
+class GrowingTreeGenerator:
+    '''Maze Generator that grows the maze from cells that still have passages'''
+
+    def __init__(self,width,height,policy="random",seed=None):
+        '''GrowingTreeGenerator(int,int,[str],[int]) -> GrowingTreeGenerator
+        Creates a maze generator with specified width and height.
+        The outside of the grid is always wall.
+        width: width of generated mazes
+        height: height of generated mazes
+        policy: which cell to grow from next, one of GROWING_TREE_POLICIES
+            "newest": long winding passages, the fastest
+            "random": lots of short dead ends (default)
+            "oldest": long straight passages from the start cell
+        seed: seed for the mazes, None uses the random module'''
+        if policy not in GROWING_TREE_POLICIES:
+            raise ValueError("policy must be one of " + ", ".join(GROWING_TREE_POLICIES))
+        self.width = 2*(width//2) + 1   # Make width odd
+        self.height = 2*(height//2) + 1 # Make height odd
+        self.policy = policy
+        self.random = get_random(seed)
+
+        self.grid = MazeGrid(self.width,self.height)
+        self.frontier = []       # cells to draw from
+        self.frontierStart = 0   # position of the oldest cell in the frontier
+
+    def get_grid(self):
+        '''GrowingTreeGenerator.get_grid() -> MazeGrid
+        returns the maze grid'''
+        return self.grid
+
+    def get_directions(self,cell):
+        '''GrowingTreeGenerator.get_directions(cell) -> list
+        returns the directions (0: up, 1: right, 2: down, 3: left) cell can
+        cut a passage in
+        cell: int index of a cell in the grid'''
+        row,col = divmod(cell,self.width)
+        # tells if the cell 2 away is still inside the outside wall
+        inside = (row > 1,col < self.width - 2,row < self.height - 2,col > 1)
+        cells = self.grid.cells
+        offsets = self.grid.offsets
+
+        directions = []
+        for dirNum in range(4):
+            if inside[dirNum] and cells[cell + 2 * offsets[dirNum]] != PASSAGE:
+                directions.append(dirNum)
+        return directions
+
+    def select_cell(self):
+        '''GrowingTreeGenerator.select_cell() -> int
+        returns the position in the frontier of the cell to grow from next'''
+        if self.policy == "newest":
+            return len(self.frontier) - 1
+        elif self.policy == "oldest":
+            return self.frontierStart
+        return self.random.randrange(len(self.frontier))
+
+    def remove_cell(self,position):
+        '''GrowingTreeGenerator.remove_cell(position)
+        removes the cell at position from the frontier in constant time
+        position: int position given by select_cell'''
+        if self.policy == "oldest":
+            # the oldest cell is always first, so just move past it
+            self.frontierStart += 1
+        else:
+            # swap with the last cell and pop
+            self.frontier[position] = self.frontier[-1]
+            self.frontier.pop()
+
+    def generate_maze(self):
+        '''GrowingTreeGenerator.generate_maze() -> None
+        generates the maze, starting from a random cell
+        a cell only leaves the frontier when it is picked and has no
+        passages left, so each step only looks at the picked cell'''
+        self.grid = MazeGrid(self.width,self.height)
+
+        # find first cell
+        startCell = self.grid.index(self.random.randrange(1,self.height - 1,2),
+            self.random.randrange(1,self.width - 1,2))
+        self.grid.set_state(startCell,PASSAGE)
+        self.frontier = [startCell]
+        self.frontierStart = 0
+        cells = self.grid.cells
+        offsets = self.grid.offsets
+
+        # loop until maze is done
+        while len(self.frontier) > self.frontierStart:
+            position = self.select_cell()
+            cell = self.frontier[position]
+            directions = self.get_directions(cell)
+            if len(directions) == 0: # dead cell
+                self.remove_cell(position)
+                continue
+
+            # generate maze
+            offset = offsets[self.random.choice(directions)]
+            cells[cell + offset] = PASSAGE
+            cells[cell + 2 * offset] = PASSAGE
+
+            # add new position to list
+            self.frontier.append(cell + 2 * offset)
+
+class KruskalMazeGenerator:
+    '''Maze Generator that knocks down walls in a random order, as long as
+    the cells on each side are not joined yet (Kruskal's Algorithm)'''
+
+    def __init__(self,width,height,seed=None):
+        '''KruskalMazeGenerator(int,int,[int]) -> KruskalMazeGenerator
+        Creates a maze generator with specified width and height.
+        The outside of the grid is always wall.
+        width: width of generated mazes
+        height: height of generated mazes
+        seed: seed for the mazes, None uses the random module'''
+        self.width = 2*(width//2) + 1   # Make width odd
+        self.height = 2*(height//2) + 1 # Make height odd
+        self.random = get_random(seed)
+
+        self.grid = MazeGrid(self.width,self.height)
+        self.parent = []  # cell each cell points to in its set
+
+    def get_grid(self):
+        '''KruskalMazeGenerator.get_grid() -> MazeGrid
+        returns the maze grid'''
+        return self.grid
+
+    def find(self,cell):
+        '''KruskalMazeGenerator.find(cell) -> int
+        returns the cell at the root of the set cell is in
+        every cell on the way is pointed at its grandparent, so the sets
+        stay flat and later finds are quick
+        cell: int index of a cell in the grid'''
+        parent = self.parent
+        while parent[cell] != cell:
+            parent[cell] = parent[parent[cell]]
+            cell = parent[cell]
+        return cell
+
+    def generate_maze(self):
+        '''KruskalMazeGenerator.generate_maze() -> None
+        generates the maze by going through the walls in a random order'''
+        self.grid = MazeGrid(self.width,self.height)
+        cells = self.grid.cells
+        width,height = self.width,self.height
+
+        # every cell is its own set to start with
+        for row in range(1,height - 1,2):
+            cells[row * width + 1:(row + 1) * width - 1:2] = bytes([PASSAGE]) * (width//2)
+        self.parent = list(range(width * height))
+        parent = self.parent
+        find = self.find
+
+        # walls between cells on the same row, then on the same column
+        walls = [row * width + col for row in range(1,height - 1,2) for col in range(2,width - 1,2)]
+        walls += [row * width + col for row in range(2,height - 1,2) for col in range(1,width - 1,2)]
+        self.random.shuffle(walls)
+
+        joinsLeft = (width//2) * (height//2) - 1 # a tree has 1 less edge than cells
+        for wall in walls:
+            # cells are left and right of walls on odd rows, above and below on even
+            if (wall // width) % 2 == 1:
+                offset = 1
+            else:
+                offset = width
+            first = find(wall - offset)
+            second = find(wall + offset)
+            if first != second: # not joined yet
+                parent[first] = second
+                cells[wall] = PASSAGE
+                joinsLeft -= 1
+                if joinsLeft == 0:
+                    break
+
+class PrimMazeGenerator:
+    '''Maze Generator that joins a random cell next to the maze on each
+    step (Prim's Algorithm)'''
+
+    def __init__(self,width,height,seed=None):
+        '''PrimMazeGenerator(int,int,[int]) -> PrimMazeGenerator
+        Creates a maze generator with specified width and height.
+        The outside of the grid is always wall.
+        width: width of generated mazes
+        height: height of generated mazes
+        seed: seed for the mazes, None uses the random module'''
+        self.width = 2*(width//2) + 1   # Make width odd
+        self.height = 2*(height//2) + 1 # Make height odd
+        self.random = get_random(seed)
+
+        self.grid = MazeGrid(self.width,self.height)
+        self.frontier = []                # cells next to the maze
+        self.inFrontier = bytearray(0)    # 1 for each cell in the frontier
+
+    def get_grid(self):
+        '''PrimMazeGenerator.get_grid() -> MazeGrid
+        returns the maze grid'''
+        return self.grid
+
+    def get_neighbors(self,cell):
+        '''PrimMazeGenerator.get_neighbors(cell) -> list
+        returns the offsets to the cells 2 away from cell that are still
+        inside the outside wall
+        cell: int index of a cell in the grid'''
+        row,col = divmod(cell,self.width)
+        inside = (row > 1,col < self.width - 2,row < self.height - 2,col > 1)
+        return [offset for dirNum,offset in enumerate(self.grid.offsets) if inside[dirNum]]
+
+    def add_cell(self,cell):
+        '''PrimMazeGenerator.add_cell(cell) -> None
+        makes cell part of the maze and puts the cells next to it that
+        aren't in the maze or frontier into the frontier
+        cell: int index of a cell in the grid'''
+        cells = self.grid.cells
+        cells[cell] = PASSAGE
+        for offset in self.get_neighbors(cell):
+            nextCell = cell + 2 * offset
+            if cells[nextCell] != PASSAGE and not self.inFrontier[nextCell]:
+                self.inFrontier[nextCell] = 1
+                self.frontier.append(nextCell)
+
+    def generate_maze(self):
+        '''PrimMazeGenerator.generate_maze() -> None
+        generates the maze, starting from a random cell
+        the frontier is a plain list, a random cell is swapped with the
+        last one and popped so each step takes constant time'''
+        self.grid = MazeGrid(self.width,self.height)
+        self.frontier = []
+        self.inFrontier = bytearray(self.width * self.height)
+        cells = self.grid.cells
+        frontier = self.frontier
+
+        # find first cell
+        self.add_cell(self.grid.index(self.random.randrange(1,self.height - 1,2),
+            self.random.randrange(1,self.width - 1,2)))
+
+        # loop until maze is done
+        while len(frontier) > 0:
+            # take a random cell out of the frontier
+            position = self.random.randrange(len(frontier))
+            cell = frontier[position]
+            frontier[position] = frontier[-1]
+            frontier.pop()
+
+            # join it to a random cell next to it that is in the maze
+            offset = self.random.choice([offset for offset in self.get_neighbors(cell)
+                if cells[cell + 2 * offset] == PASSAGE])
+            cells[cell + offset] = PASSAGE
+            self.add_cell(cell)
+
+## Begin Section Added by CaptainFlint ##
+
+class WilsonMazeGenerator:
+    """Maze Generator using Wilson's Loop Erased Random Walk Algorithm"""
+
+    def __init__(self,width,height,seed=None):
+        """WilsonMazeGenerator(int,int,[int]) -> WilsonMazeGenerator
+        Creates a maze generator with specified width and height.
+        width: width of generated mazes
+        height: height of generated mazes
+        seed: seed for the mazes, None uses the random module"""
+        self.width = 2*(width//2) + 1   # Make width odd
+        self.height = 2*(height//2) + 1 # Make height odd
+        self.random = get_random(seed)
+
+        # grid of cells
+        self.grid = [[0 for i in range(self.width)] for j in range(self.height)]
+
+        # declare instance variable
+        self.visited = set()      # visited cells
+        self.unvisited = []       # unvisited cells
+        self.unvisitedPos = dict() # position of each cell in unvisited
+        self.path = dict()        # random walk path
+
+        # valid directions in random walk
+        self.directions = [(0,1),(1,0),(0,-1),(-1,0)]
+
+        # (dirNum,next cell) pairs for every valid direction from each cell
+        self.moves = dict()
+        for r in range(0,self.height,2):
+            for c in range(0,self.width,2):
+                self.moves[(r,c)] = tuple((dirNum,self.get_next_cell((r,c),dirNum,2))
+                    for dirNum in range(4) if self.is_valid_direction((r,c),dirNum))
+
+    def __str__(self):
+        """WilsonMazeGenerator.__str__() -> str
+        outputs a string version of the grid"""
+        out = ""
+        for i in range(self.height):
+            for j in range(self.width):
+                out += str(self.grid[i][j])
+                out += " "
+            out += "\n"
+        return out
+
+    def get_grid(self):
+        """WilsonMazeGenerator.get_grid() -> list
+        returns the maze grid"""
+        return self.grid
+
+    def get_next_cell(self,cell,dirNum,fact):
+        """WilsonMazeGenerator.get_next_cell(tuple,int,int) -> tuple
+        Outputs the next cell when moved a distance fact in the the
+        direction specified by dirNum from the initial cell.
+        cell: tuple (y,x) representing position of initial cell
+        dirNum: int with values 0,1,2,3
+        fact: int distance to next cell"""
+        dirTup = self.directions[dirNum]
+        return (cell[0]+fact*dirTup[0],cell[1]+fact*dirTup[1])
+
+    def is_valid_direction(self,cell,dirNum):
+        """WilsonMazeGenerator(tuple,int) -> boolean
+        Checks if the adjacent cell in the direction specified by
+        dirNum is within the grid
+        cell: tuple (y,x) representing position of initial cell
+        dirNum: int with values 0,1,2,3"""
+        newCell = self.get_next_cell(cell,dirNum,2)
+        tooSmall = newCell[0] < 0 or newCell[1] < 0
+        tooBig = newCell[0] >= self.height or newCell[1] >= self.width
+        return not (tooSmall or tooBig)
+
+    def initialize_grid(self):
+        """WilsonMazeGenerator.initialize_grid() -> None
+        Resets the maze grid to blank before generating a maze."""
+        for i in range(self.height):
+            for j in range(self.width):
+                self.grid[i][j] = 0
+
+        # fill up unvisited cells
+        self.unvisited = []
+        for r in range(self.height):
+            for c in range(self.width):
+                if r % 2 == 0 and c % 2 == 0:
+                    self.unvisited.append((r,c))
+        self.unvisitedPos = {cell: i for i,cell in enumerate(self.unvisited)}
+
+        self.visited = set()
+        self.path = dict()
+
+    def visit(self,cell):
+        """WilsonMazeGenerator.visit(tuple) -> None
+        Moves cell from the unvisited cells to the visited cells in
+        constant time by swapping it with the last unvisited cell
+        cell: tuple (y,x) location of an unvisited cell"""
+        self.visited.add(cell)
+        position = self.unvisitedPos.pop(cell)
+        last = self.unvisited.pop()
+        if last != cell: # fill the gap with the last cell
+            self.unvisited[position] = last
+            self.unvisitedPos[last] = position
+
+    def cut(self,cell):
+        """WilsonMazeGenerator.cut(tuple) -> None
+        Sets the value of the grid at the location specified by cell
+        to 1
+        cell: tuple (y,x) location of where to cut"""
+        self.grid[cell[0]][cell[1]] = 1
+
+    def generate_maze(self):
+        """WilsonMazeGenerator.generate_maze() -> None
+        Generates the maze according to the Wilson Loop Erased Random
+        Walk Algorithm"""
+        # reset the grid before generation
+        self.initialize_grid()
+
+        # put the middle cell in the visited list (Step 1). Any cell
+        # gives a uniform maze, but the first walks find the middle one
+        # soonest, so the whole maze takes fewer steps.
+        current = (2*(self.height//4),2*(self.width//4))
+        self.visit(current)
+        self.cut(current)
+
+        moves = self.moves
+        visited = self.visited
+        path = self.path
+
+        # loop until all cells have been visited
+        while len(self.unvisited) > 0:
+            # choose a random cell to start the walk (Step 2)
+            first = self.unvisited[self.random.randint(0,len(self.unvisited)-1)]
+            current = first
+            # loop until the random walk reaches a visited cell
+            while True:
+                # choose direction to walk from the valid ones (Step 3)
+                dirNum,nextCell = self.random.choice(moves[current])
+                # save the cell and direction in the path
+                path[current] = dirNum
+                # get the next cell in that direction
+                current = nextCell
+                if (current in visited): # visited cell is reached (Step 5)
+                    break
+
+            current = first # go to start of path
+            # loop until the end of path is reached
+            while True:
+                # add cell to visited and cut into the maze
+                self.visit(current) # (Step 6.b)
+                self.cut(current)
+
+                # follow the direction to next cell (Step 6.a)
+                dirNum = path[current]
+                crossed = self.get_next_cell(current,dirNum,1)
+                self.cut(crossed) # cut crossed edge
+
+                current = self.get_next_cell(current,dirNum,2)
+                if (current in visited): # end of path is reached
+                    path.clear() # clear the path
+                    break
+
+## End Section Added by CaptainFlint ##
+
+    def get_maze_grid(self):
+        """WilsonMazeGenerator.get_maze_grid() -> MazeGrid
+        returns the maze as a MazeGrid with a wall all the way around it,
+        so it is 2 cells wider and taller than the generator"""
+        mazeGrid = MazeGrid(self.width + 2,self.height + 2)
+        for i in range(self.height):
+            for j in range(self.width):
+                if self.grid[i][j] == 1:
+                    mazeGrid.cut(i + 1,j + 1)
+        return mazeGrid
+
+class NumpyWilsonMazeGenerator:
+    """Maze Generator using Wilson's Loop Erased Random Walk Algorithm
+    with the grid and the walk kept in NumPy arrays"""
+
+    # num random numbers drawn at a time
+    blockSize = 4096
+
+    # valid directions for each mask of right (1), down (2), left (4) and up (8)
+    maskDirections = tuple(tuple(dirNum for dirNum in range(4) if mask & (1 << dirNum))
+        for mask in range(16))
+
+    def __init__(self,width,height,seed=None):
+        """NumpyWilsonMazeGenerator(int,int,[int]) -> NumpyWilsonMazeGenerator
+        Creates a maze generator with specified width and height.
+        Needs NumPy.
+        width: width of generated mazes
+        height: height of generated mazes
+        seed: seed for the mazes, None uses the random module"""
+        if numpy == None:
+            raise ImportError("NumpyWilsonMazeGenerator needs NumPy")
+        self.width = 2*(width//2) + 1   # Make width odd
+        self.height = 2*(height//2) + 1 # Make height odd
+
+        # the cells the walks go between are every other row and column
+        self.rows = self.height//2 + 1
+        self.cols = self.width//2 + 1
+
+        # grid of cells, visited cells and the direction the walk left each cell
+        self.grid = numpy.zeros((self.height,self.width),numpy.int8)
+        self.visited = numpy.zeros(self.rows * self.cols,numpy.int8)
+        self.walk = numpy.full(self.rows * self.cols,-1,numpy.int8)
+
+        # directions are right, down, left, up like WilsonMazeGenerator
+        self.walkOffsets = (1,self.cols,-1,-self.cols) # to the next walk cell
+        self.gridOffsets = (1,self.width,-1,-self.width) # to the crossed grid cell
+
+        # mask of the directions the walk can go from each cell
+        rowNums,colNums = numpy.divmod(numpy.arange(self.rows * self.cols),self.cols)
+        self.masks = ((colNums < self.cols - 1) * 1 + (rowNums < self.rows - 1) * 2 +
+            (colNums > 0) * 4 + (rowNums > 0) * 8).astype(numpy.int8)
+
+        # seeded from random or the seed so mazes can be repeated
+        self.rng = numpy.random.default_rng(get_random(seed).getrandbits(64))
+
+    def __str__(self):
+        """NumpyWilsonMazeGenerator.__str__() -> str
+        outputs a string version of the grid"""
+        out = ""
+        for row in self.grid:
+            out += " ".join(str(cell) for cell in row)
+            out += " \n"
+        return out
+
+    def get_grid(self):
+        """NumpyWilsonMazeGenerator.get_grid() -> numpy.ndarray
+        returns the maze grid"""
+        return self.grid
+
+    def get_maze_grid(self):
+        """NumpyWilsonMazeGenerator.get_maze_grid() -> MazeGrid
+        returns the maze as a MazeGrid with a wall all the way around it,
+        so it is 2 cells wider and taller than the generator"""
+        bordered = numpy.zeros((self.height + 2,self.width + 2),numpy.int8)
+        bordered[1:-1,1:-1] = self.grid
+        mazeGrid = MazeGrid(self.width + 2,self.height + 2)
+        mazeGrid.cells[:] = bordered.tobytes()
+        return mazeGrid
+
+    def draw_randoms(self):
+        """NumpyWilsonMazeGenerator.draw_randoms() -> list
+        returns the next block of random numbers in [0,1)"""
+        return self.rng.random(self.blockSize).tolist()
+
+    def generate_maze(self):
+        """NumpyWilsonMazeGenerator.generate_maze() -> None
+        Generates the maze according to the Wilson Loop Erased Random
+        Walk Algorithm. Each walk writes the direction it leaves a cell
+        into the walk array, so going back over a cell overwrites the
+        loop instead of erasing it."""
+        self.grid[:] = 0
+        self.visited[:] = 0
+        self.walk[:] = -1
+
+        # memoryviews index the arrays without making NumPy scalars
+        grid = memoryview(self.grid.reshape(-1))
+        visited = memoryview(self.visited)
+        walk = memoryview(self.walk)
+        masks = memoryview(self.masks)
+        maskDirections = self.maskDirections
+        walkOffsets = self.walkOffsets
+        gridOffsets = self.gridOffsets
+        cols,width = self.cols,self.width
+
+        randoms = self.draw_randoms()
+        randomIndex = 0
+
+        # walks start from the cells in a random order (Step 2)
+        order = self.rng.permutation(self.rows * cols).tolist()
+
+        # the middle cell is visited (Step 1)
+        first = (self.rows//2) * cols + cols//2
+        visited[first] = 1
+        grid[2 * (first // cols) * width + 2 * (first % cols)] = 1
+
+        for first in order:
+            if visited[first]:
+                continue
+
+            # loop until the random walk reaches a visited cell
+            current = first
+            while not visited[current]:
+                if randomIndex == len(randoms):
+                    randoms = self.draw_randoms()
+                    randomIndex = 0
+                # choose direction to walk from the valid ones (Step 3)
+                validDirections = maskDirections[masks[current]]
+                dirNum = validDirections[int(randoms[randomIndex] * len(validDirections))]
+                randomIndex += 1
+                # save the direction, writing over any loop (Step 4)
+                walk[current] = dirNum
+                current += walkOffsets[dirNum]
+
+            # follow the loop erased walk and cut it into the maze (Step 6)
+            current = first
+            while not visited[current]:
+                visited[current] = 1
+                dirNum = walk[current]
+                gridCell = 2 * (current // cols) * width + 2 * (current % cols)
+                grid[gridCell] = 1
+                grid[gridCell + gridOffsets[dirNum]] = 1
+                current += walkOffsets[dirNum]
+
+class EllerMazeGenerator:
+    '''Maze Generator that makes the maze a row at a time, only keeping
+    which cells of the last row are joined (Eller's Algorithm)'''
+
+    def __init__(self,width,height,seed=None):
+        '''EllerMazeGenerator(int,int,[int]) -> EllerMazeGenerator
+        Creates a maze generator with specified width and height.
+        The outside of the grid is always wall.
+        width: width of generated mazes
+        height: height of generated mazes
+        seed: seed for the mazes, None uses the random module'''
+        self.width = 2*(width//2) + 1   # Make width odd
+        self.height = 2*(height//2) + 1 # Make height odd
+        self.random = get_random(seed)
+
+        self.grid = None # only made by generate_maze, rows can be used without it
+
+    def get_grid(self):
+        '''EllerMazeGenerator.get_grid() -> MazeGrid
+        returns the maze grid, or None if generate_maze hasn't been called'''
+        return self.grid
+
+    def generate_rows(self):
+        '''EllerMazeGenerator.generate_rows() -> generator
+        gives the rows of the maze from top to bottom, each one bytes of
+        width cell states, so they can be written out as they are made
+        only the sets of one row of cells are kept, so a maze of any
+        height takes the same memory'''
+        width = self.width
+        cols = width // 2
+        numRows = self.height // 2
+        rand = self.random.random
+        wallRow = bytes([WALL]) * width
+        yield wallRow
+        if numRows == 0:
+            return
+
+        sets = list(range(cols)) # set each cell of the row is in
+        members = {col: [col] for col in range(cols)} # cells of the row in each set
+        nextSet = cols # name for the next new set
+        for row in range(numRows):
+            lastRow = row == numRows - 1
+            cellRow = bytearray(wallRow)
+            cellRow[1:width - 1:2] = bytes([PASSAGE]) * cols
+
+            # join cells to the right in other sets at random, or all of
+            # them on the last row so the whole maze is joined
+            for col in range(cols - 1):
+                first,second = sets[col],sets[col + 1]
+                if first != second and (lastRow or rand() < 0.5):
+                    cellRow[2 * col + 2] = PASSAGE
+                    # move the smaller set into the bigger one
+                    if len(members[first]) < len(members[second]):
+                        first,second = second,first
+                    for member in members[second]:
+                        sets[member] = first
+                    members[first] += members.pop(second)
+            yield bytes(cellRow)
+            if lastRow:
+                break
+
+            # join cells down at random, at least once for each set so
+            # no set is cut off
+            belowRow = bytearray(wallRow)
+            nextMembers = dict()
+            for setName,setCells in members.items():
+                down = [col for col in setCells if rand() < 0.5]
+                if len(down) == 0:
+                    down = [self.random.choice(setCells)]
+                for col in down:
+                    belowRow[2 * col + 1] = PASSAGE
+                nextMembers[setName] = down
+            # cells with nothing above them start a set of their own
+            for col in range(cols):
+                if belowRow[2 * col + 1] == WALL:
+                    sets[col] = nextSet
+                    nextMembers[nextSet] = [col]
+                    nextSet += 1
+            members = nextMembers
+            yield bytes(belowRow)
+        yield wallRow
+
+    def generate_maze(self):
+        '''EllerMazeGenerator.generate_maze() -> None
+        generates the whole maze into the grid'''
+        self.grid = MazeGrid(self.width,self.height)
+        self.grid.cells = bytearray(b"".join(self.generate_rows()))
+
+## GENERATORS ##
+
+def generate_growing_tree(width,height,seed=None):
+    '''generate_growing_tree(int,int,[int]) -> MazeGrid
+    generates a maze with GrowingTreeGenerator growing from random cells'''
+    mazeGen = GrowingTreeGenerator(width,height,"random",seed)
+    mazeGen.generate_maze()
+    return mazeGen.get_grid()
+
+def generate_backtracker(width,height,seed=None):
+    '''generate_backtracker(int,int,[int]) -> MazeGrid
+    generates a maze with GrowingTreeGenerator growing from the newest cell'''
+    mazeGen = GrowingTreeGenerator(width,height,"newest",seed)
+    mazeGen.generate_maze()
+    return mazeGen.get_grid()
+
+def generate_wilson(width,height,seed=None):
+    '''generate_wilson(int,int,[int]) -> MazeGrid
+    generates a maze with WilsonMazeGenerator'''
+    # the Wilson generators leave out the outside wall
+    mazeGen = WilsonMazeGenerator(width - 2,height - 2,seed)
+    mazeGen.generate_maze()
+    return mazeGen.get_maze_grid()
+
+def generate_wilson_numpy(width,height,seed=None):
+    '''generate_wilson_numpy(int,int,[int]) -> MazeGrid
+    generates a maze with NumpyWilsonMazeGenerator. It takes its random
+    numbers in a different order, so a seed gives another maze than
+    generate_wilson'''
+    mazeGen = NumpyWilsonMazeGenerator(width - 2,height - 2,seed)
+    mazeGen.generate_maze()
+    return mazeGen.get_maze_grid()
+
+def generate_kruskal(width,height,seed=None):
+    '''generate_kruskal(int,int,[int]) -> MazeGrid
+    generates a maze with KruskalMazeGenerator'''
+    mazeGen = KruskalMazeGenerator(width,height,seed)
+    mazeGen.generate_maze()
+    return mazeGen.get_grid()
+
+def generate_prim(width,height,seed=None):
+    '''generate_prim(int,int,[int]) -> MazeGrid
+    generates a maze with PrimMazeGenerator'''
+    mazeGen = PrimMazeGenerator(width,height,seed)
+    mazeGen.generate_maze()
+    return mazeGen.get_grid()
+
+def generate_eller(width,height,seed=None):
+    '''generate_eller(int,int,[int]) -> MazeGrid
+    generates a maze with EllerMazeGenerator'''
+    mazeGen = EllerMazeGenerator(width,height,seed)
+    mazeGen.generate_maze()
+    return mazeGen.get_grid()
+
+# generate functions by the name of their algorithm
+GENERATORS = {
+    "growing-tree": generate_growing_tree, # lots of short dead ends
+    "backtracker": generate_backtracker,   # long winding passages
+    "wilson": generate_wilson,             # uniform, no bias to any shape
+    "kruskal": generate_kruskal,           # lots of short dead ends
+    "prim": generate_prim,                 # short passages from a middle
+    "eller": generate_eller                # made a row at a time, for very tall mazes
+}
+if numpy != None: # only offered where it can run, so a name always means one maze for a seed
+    GENERATORS["wilson-numpy"] = generate_wilson_numpy # same as wilson, but much quicker
+
+def check_size(width,height):
+    '''check_size(width,height)
+    raises ValueError if a maze can't be width x height
+    width,height: int'''
+    if width < 3 or height < 3:
+        raise ValueError("mazes must be at least 3 x 3, not %d x %d" % (width,height))
+
+def generate(algorithm,width,height,seed=None):
+    '''generate(algorithm,width,height,[seed]) -> MazeGrid
+    generates a maze with one of the algorithms in GENERATORS
+    every algorithm gives the same kind of grid: width and height are made
+    odd, the outside is wall and cells with odd row and column are passages
+    algorithm: str name of the algorithm
+    width: int width of the maze, at least 3
+    height: int height of the maze, at least 3
+    seed: int seed for the maze, None uses the random module'''
+    if algorithm not in GENERATORS:
+        raise ValueError("algorithm must be one of " + ", ".join(GENERATORS))
+    check_size(width,height)
+    return GENERATORS[algorithm](width,height,seed)
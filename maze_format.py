@@ -0,0 +1,171 @@
+# Maze Format
+# saves generated mazes in a small binary file and loads them back
+#
+# the file is a header followed by the cells, 1 bit each (1 for a passage),
+# row by row. Each row starts on a new byte, so one cell can be read by
+# itself without reading the rest of the file
+#
+# header, little endian:
+#   4 bytes   b"MAZE"
+#   2 bytes   version
+#   16 bytes  algorithm name, padded with zero bytes
+#   4 bytes   width
+#   4 bytes   height
+#   1 byte    1 if there is a seed, else 0
+#   8 bytes   seed
+
+import os
+import mmap
+import struct
+from maze_engine import MazeGrid, WALL, PASSAGE
+
+MAGIC = b"MAZE"
+VERSION = 1
+HEADER = struct.Struct("<4sH16sIIBq")
+
+# turns cell states into "0" and "1" and back
+TO_BITS = bytes.maketrans(bytes([WALL,PASSAGE]),b"01")
+FROM_BITS = bytes.maketrans(b"01",bytes([WALL,PASSAGE]))
+
+def get_row_bytes(width):
+    '''get_row_bytes(width) -> int
+    returns the num bytes each row of width cells takes
+    width: int'''
+    return (width + 7) // 8
+
+def save_maze(filename,grid,algorithm="",seed=None):
+    '''save_maze(filename,grid,[algorithm],[seed])
+    saves grid to filename
+    filename: str
+    grid: MazeGrid with only WALL and PASSAGE cells
+    algorithm: str name of the algorithm that made it, up to 16 letters
+    seed: int seed it was made with, or None'''
+    width = grid.get_width()
+    rows = (grid.cells[row * width:(row + 1) * width] for row in range(grid.get_height()))
+    save_rows(filename,rows,width,grid.get_height(),algorithm,seed)
+
+def save_rows(filename,rows,width,height,algorithm="",seed=None):
+    '''save_rows(filename,rows,width,height,[algorithm],[seed])
+    saves a maze given a row at a time to filename, writing each row as
+    it comes, so the whole maze is never in memory
+    it is written to a temporary file first, so nothing is left at
+    filename if a row can't be saved
+    e.g. save_rows(filename,EllerMazeGenerator(width,height).generate_rows(),...)
+    filename: str
+    rows: iterable of height bytes rows of width WALL and PASSAGE cells
+    width,height: int size of the maze
+    algorithm: str name of the algorithm that made it, up to 16 letters
+    seed: int seed it was made with, from -2 ** 63 to 2 ** 63 - 1, or None'''
+    try:
+        algorithmBytes = algorithm.encode("ascii")
+    except UnicodeEncodeError:
+        raise ValueError("the algorithm name must be ASCII")
+    if len(algorithmBytes) > 16:
+        raise ValueError("the algorithm name can be up to 16 letters, not %d" % len(algorithmBytes))
+    if seed != None and not -2 ** 63 <= seed < 2 ** 63:
+        raise ValueError("the seed must fit in 64 bits to be saved")
+    header = HEADER.pack(MAGIC,VERSION,algorithmBytes,width,height,seed != None,seed if seed != None else 0)
+
+    rowBytes = get_row_bytes(width)
+    numRows = 0
+    tempPath = filename + ".%d.tmp" % os.getpid()
+    try:
+        with open(tempPath,"wb") as mazeFile:
+            mazeFile.write(header)
+            for rowCells in rows:
+                if len(rowCells) != width or len(rowCells.translate(None,bytes([WALL,PASSAGE]))) > 0:
+                    raise ValueError("only rows of %d walls and passages can be saved" % width)
+                # the first cell goes in the lowest bit
+                bits = rowCells.translate(TO_BITS)[::-1]
+                mazeFile.write(int(bits or b"0",2).to_bytes(rowBytes,"little"))
+                numRows += 1
+        if numRows != height:
+            raise ValueError("%d rows were given for a maze %d rows tall" % (numRows,height))
+        os.replace(tempPath,filename)
+    finally:
+        if os.path.exists(tempPath): # something went wrong
+            os.remove(tempPath)
+
+def load_maze(filename):
+    '''load_maze(filename) -> MazeGrid
+    returns the maze saved in filename
+    filename: str'''
+    with MazeFile(filename) as mazeFile:
+        return mazeFile.get_grid()
+
+class MazeFile:
+    '''Reads a saved maze through mmap, so single cells can be read
+    without loading the whole file'''
+
+    def __init__(self,filename):
+        '''MazeFile(filename) -> MazeFile
+        opens a saved maze and reads its header
+        filename: str'''
+        with open(filename,"rb") as mazeFile:
+            self.data = mmap.mmap(mazeFile.fileno(),0,access=mmap.ACCESS_READ)
+        if len(self.data) < HEADER.size:
+            self.close()
+            raise ValueError(filename + " is not a maze file")
+        magic,version,algorithm,self.width,self.height,hasSeed,seed = HEADER.unpack_from(self.data)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(filename + " is not a version %d maze file" % VERSION)
+        self.algorithm = algorithm.rstrip(b"\0").decode("ascii")
+        self.seed = seed if hasSeed else None
+        self.rowBytes = get_row_bytes(self.width)
+        if len(self.data) < HEADER.size + self.rowBytes * self.height:
+            self.close()
+            raise ValueError(filename + " is cut short")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*exception):
+        self.close()
+
+    def close(self):
+        '''MazeFile.close()
+        closes the file'''
+        self.data.close()
+
+    def get_width(self):
+        '''MazeFile.get_width() -> int
+        returns the num cells in width'''
+        return self.width
+
+    def get_height(self):
+        '''MazeFile.get_height() -> int
+        returns the num cells in height'''
+        return self.height
+
+    def get_algorithm(self):
+        '''MazeFile.get_algorithm() -> str
+        returns the name of the algorithm that made the maze'''
+        return self.algorithm
+
+    def get_seed(self):
+        '''MazeFile.get_seed() -> int
+        returns the seed the maze was made with, or None'''
+        return self.seed
+
+    def get_cell(self,row,col):
+        '''MazeFile.get_cell(row,col) -> int
+        returns the state of the cell at (row,col), reading just its byte
+        row,col: int'''
+        byte = self.data[HEADER.size + row * self.rowBytes + col // 8]
+        if byte >> col % 8 & 1:
+            return PASSAGE
+        return WALL
+
+    def get_grid(self):
+        '''MazeFile.get_grid() -> MazeGrid
+        returns the whole maze as a grid'''
+        grid = MazeGrid(self.width,self.height)
+        numBits = 8 * self.rowBytes
+        for row in range(self.height):
+            start = HEADER.size + row * self.rowBytes
+            value = int.from_bytes(self.data[start:start + self.rowBytes],"little")
+            # lowest bit first, then cut off the padding
+            bits = format(value,"0%db" % numBits)[::-1][:self.width]
+            grid.cells[row * self.width:(row + 1) * self.width] = bits.encode("ascii").translate(FROM_BITS)
+        return grid
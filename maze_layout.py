@@ -0,0 +1,109 @@
+# Maze Layout
+# places things in the adventure world as plain data, before anything is drawn
+
+import math
+
+# change when the same seed would lay out a different world, so cached
+# layouts aren't used
+LAYOUT_VERSION = 1
+
+try:
+    import numpy
+except ImportError: # NumPy is optional, value_noise is just slower without it
+    numpy = None
+
+def poisson_disk(isOpen,start,low,high,radius,rand,tries=30):
+    '''poisson_disk(isOpen,start,low,high,radius,rand,[tries]) -> list
+    returns points (x,y) in the square from low to high both ways where no
+    2 points are closer than radius, added until no more fit (Bridson's
+    Algorithm). A grid holding at most 1 point per square means only the
+    squares around a new point need checking
+    isOpen: function(x,y) -> bool telling if a point can be used
+    start: (x,y) of the first point, must be open
+    low,high: the smallest and biggest x and y
+    radius: the closest 2 points can be
+    rand: random.Random or the random module
+    tries: int num points tried around each point before giving up on it'''
+    squareWidth = radius / math.sqrt(2) # the diagonal of each square is radius
+    gridWidth = int((high - low) / squareWidth) + 1
+    grid = [None] * (gridWidth * gridWidth)
+    radiusSquared = radius ** 2
+
+    def get_square(x,y):
+        return int((y - low) / squareWidth) * gridWidth + int((x - low) / squareWidth)
+
+    def is_far(x,y):
+        # a point closer than radius can only be in the 5x5 squares around
+        row,col = divmod(get_square(x,y),gridWidth)
+        for nearRow in range(max(row - 2,0),min(row + 3,gridWidth)):
+            for nearCol in range(max(col - 2,0),min(col + 3,gridWidth)):
+                point = grid[nearRow * gridWidth + nearCol]
+                if point != None and (point[0] - x) ** 2 + (point[1] - y) ** 2 < radiusSquared:
+                    return False
+        return True
+
+    points = [start]
+    grid[get_square(*start)] = start
+    active = [start] # points that may still have room around them
+    while len(active) > 0:
+        position = rand.randrange(len(active))
+        x,y = active[position]
+        for i in range(tries):
+            # try a point between radius and 2 * radius away
+            angle = rand.random() * 2 * math.pi
+            distance = radius * (1 + rand.random())
+            newX = x + distance * math.cos(angle)
+            newY = y + distance * math.sin(angle)
+            if low <= newX <= high and low <= newY <= high and isOpen(newX,newY) and is_far(newX,newY):
+                points.append((newX,newY))
+                active.append((newX,newY))
+                grid[get_square(newX,newY)] = (newX,newY)
+                break
+        else: # no room left around it, swap with the last point and pop
+            active[position] = active[-1]
+            active.pop()
+    return points
+
+def value_noise(width,height,scale,rand):
+    '''value_noise(width,height,scale,rand) -> list
+    returns a smooth random field of width x height values from 0 to 1,
+    row by row, by blending between random values scale cells apart
+    the random values come from rand either way, so the field is the
+    same with or without NumPy
+    width,height: int size of the field
+    scale: int num cells between random values
+    rand: random.Random or the random module'''
+    latticeWidth = width // scale + 2
+    latticeHeight = height // scale + 2
+    lattice = [rand.random() for i in range(latticeWidth * latticeHeight)]
+
+    if numpy != None:
+        lattice = numpy.array(lattice).reshape(latticeHeight,latticeWidth)
+        cols = numpy.arange(width) / scale
+        rows = numpy.arange(height) / scale
+        left = cols.astype(int)
+        top = rows.astype(int)
+        # smoothstep so the blend has no creases at the random values
+        across = cols - left
+        across = across * across * (3 - 2 * across)
+        down = (rows - top)[:,None]
+        down = down * down * (3 - 2 * down)
+        upper = lattice[top][:,left] * (1 - across) + lattice[top][:,left + 1] * across
+        lower = lattice[top + 1][:,left] * (1 - across) + lattice[top + 1][:,left + 1] * across
+        return (upper * (1 - down) + lower * down).ravel().tolist()
+
+    field = []
+    for row in range(height):
+        top,down = divmod(row / scale,1)
+        top = int(top)
+        down = down * down * (3 - 2 * down)
+        for col in range(width):
+            left,across = divmod(col / scale,1)
+            left = int(left)
+            across = across * across * (3 - 2 * across)
+            corner = top * latticeWidth + left
+            upper = lattice[corner] * (1 - across) + lattice[corner + 1] * across
+            corner += latticeWidth
+            lower = lattice[corner] * (1 - across) + lattice[corner + 1] * across
+            field.append(upper * (1 - down) + lower * down)
+    return field
@@ -0,0 +1,153 @@
+# Maze Parallel
+# generates one giant maze across processes: the grid is split into tiles,
+# each tile is generated as a maze of its own in a worker, straight into a
+# shared array, then the tiles are joined with one door for each edge of
+# a random spanning tree over the tiles, so it is still a perfect maze
+#
+# the tiles show as long walls with few doors through them, since only
+# one door joins two tiles
+
+import os
+import json
+import time
+import argparse
+import multiprocessing
+from maze_engine import MazeGrid, GENERATORS, check_size, generate, get_random
+from maze_chunks import get_chunk_seed
+from maze_format import save_maze
+
+sharedCells = None # cells of the whole maze, shared by the worker processes
+
+def set_shared_cells(cells):
+    '''set_shared_cells(cells)
+    keeps the shared cells for make_tile. Runs when each worker starts
+    cells: multiprocessing.RawArray of the cells of the whole maze'''
+    global sharedCells
+    sharedCells = memoryview(cells).cast("B")
+
+def get_tiles(numRows,numCols,tileCells):
+    '''get_tiles(numRows,numCols,tileCells) -> list
+    returns (tileRow,tileCol,firstRow,firstCol,rows,cols) of each tile, in
+    rows and columns of maze cells (grid cells with odd row and column)
+    numRows,numCols: int num maze cells in height and width
+    tileCells: int num maze cells in the width of a tile'''
+    tiles = []
+    for tileRow,firstRow in enumerate(range(0,numRows,tileCells)):
+        for tileCol,firstCol in enumerate(range(0,numCols,tileCells)):
+            tiles.append((tileRow,tileCol,firstRow,firstCol,
+                min(tileCells,numRows - firstRow),min(tileCells,numCols - firstCol)))
+    return tiles
+
+def make_tile(job):
+    '''make_tile(job) -> tuple
+    generates the maze of one tile into the shared cells and returns its
+    tile row and column. Runs in the worker processes
+    job: tuple (algorithm,width,seed,tile) with width the width of the
+        whole grid and tile from get_tiles'''
+    algorithm,width,seed,tile = job
+    tileRow,tileCol,firstRow,firstCol,rows,cols = tile
+    tileGrid = generate(algorithm,2 * cols + 1,2 * rows + 1,seed)
+    tileWidth = tileGrid.get_width()
+    # leave out the walls around the tile, they're already wall
+    for row in range(1,2 * rows):
+        start = (2 * firstRow + row) * width + 2 * firstCol + 1
+        sharedCells[start:start + tileWidth - 2] = tileGrid.cells[row * tileWidth + 1:(row + 1) * tileWidth - 1]
+    return tileRow,tileCol
+
+def join_tiles(grid,tiles,rand):
+    '''join_tiles(grid,tiles,rand)
+    opens one door between each pair of tiles joined by a random spanning
+    tree over the tiles (Kruskal's Algorithm), so every cell can be
+    reached in exactly one way
+    grid: MazeGrid with the tiles generated in it
+    tiles: list from get_tiles
+    rand: random number generator'''
+    tileAt = dict(((tile[0],tile[1]),tile) for tile in tiles)
+    parent = dict((key,key) for key in tileAt) # tile each tile points to in its set
+    def find(key):
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    # edges between each tile and the ones right of and below it
+    edges = [(key,(key[0],key[1] + 1)) for key in tileAt if (key[0],key[1] + 1) in tileAt]
+    edges += [(key,(key[0] + 1,key[1])) for key in tileAt if (key[0] + 1,key[1]) in tileAt]
+    rand.shuffle(edges)
+    for first,second in edges:
+        firstRoot,secondRoot = find(first),find(second)
+        if firstRoot == secondRoot: # already joined
+            continue
+        parent[firstRoot] = secondRoot
+        tileRow,tileCol,firstRow,firstCol,rows,cols = tileAt[first]
+        if second[1] != first[1]: # door through the wall on the right
+            grid.cut(2 * (firstRow + rand.randrange(rows)) + 1,2 * (firstCol + cols))
+        else: # door through the wall below
+            grid.cut(2 * (firstRow + rows),2 * (firstCol + rand.randrange(cols)) + 1)
+
+def generate_parallel(algorithm,width,height,seed=None,tileSize=501,processes=None):
+    '''generate_parallel(algorithm,width,height,[seed],[tileSize],[processes]) -> MazeGrid
+    generates a maze like generate, but tile by tile in a pool of processes
+    the same seed and tileSize make the same maze however many processes
+    there are, but not the same maze as generate
+    algorithm: str name of the algorithm in GENERATORS for the tiles
+    width,height: int size of the maze, at least 3, made odd
+    seed: int seed for the maze, None uses the random module
+    tileSize: int width of each tile, like the width of a maze (default 501)
+    processes: int num worker processes, None for one per CPU. 1 runs
+        without a pool'''
+    if algorithm not in GENERATORS:
+        raise ValueError("algorithm must be one of " + ", ".join(GENERATORS))
+    check_size(width,height)
+    width = 2*(width//2) + 1   # Make width odd
+    height = 2*(height//2) + 1 # Make height odd
+    if seed == None:
+        seed = get_random().randrange(2 ** 63)
+    if processes == None:
+        processes = os.cpu_count() or 1
+    tileCells = max(1,tileSize // 2)
+    tiles = get_tiles(height // 2,width // 2,tileCells)
+    jobs = [(algorithm,width,get_chunk_seed(seed,"tile",tile[0],tile[1]),tile) for tile in tiles]
+
+    cells = multiprocessing.RawArray("B",width * height) # all WALL
+    if processes > 1 and len(tiles) > 1:
+        # the workers get the array when they start, not with every job
+        with multiprocessing.Pool(processes,set_shared_cells,(cells,)) as pool:
+            for done in pool.imap_unordered(make_tile,jobs):
+                pass
+    else:
+        set_shared_cells(cells)
+        for job in jobs:
+            make_tile(job)
+
+    grid = MazeGrid(width,height)
+    grid.cells[:] = memoryview(cells).cast("B")
+    join_tiles(grid,tiles,get_random(get_chunk_seed(seed,"join",0,0)))
+    return grid
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate one giant maze across processes")
+    parser.add_argument("width",type=int,help="width of the maze")
+    parser.add_argument("--height",type=int,default=None,help="height of the maze (default width)")
+    parser.add_argument("--algorithm",choices=GENERATORS,default="growing-tree",
+        help="algorithm to generate each tile with")
+    parser.add_argument("--seed",type=int,default=None,help="seed for the maze (default random)")
+    parser.add_argument("--tile-size",type=int,default=501,help="width of each tile")
+    parser.add_argument("--processes",type=int,default=None,
+        help="num worker processes (default one per CPU)")
+    parser.add_argument("--output",default=None,help="file to save the maze to")
+    args = parser.parse_args()
+
+    if args.height == None:
+        args.height = args.width
+    if args.seed == None: # printed so the maze can be made again
+        args.seed = get_random().randrange(2 ** 63)
+    start = time.perf_counter()
+    grid = generate_parallel(args.algorithm,args.width,args.height,args.seed,args.tile_size,args.processes)
+    seconds = time.perf_counter() - start
+    if args.output != None:
+        # generate wouldn't make this maze from the seed, so it isn't saved
+        save_maze(args.output,grid,args.algorithm)
+    print(json.dumps({"width": grid.get_width(),"height": grid.get_height(),"seed": args.seed,
+        "tileSize": args.tile_size,"processes": args.processes or os.cpu_count() or 1,
+        "seconds": seconds,"cellsPerSecond": grid.get_width() * grid.get_height() / seconds}))
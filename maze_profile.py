@@ -0,0 +1,139 @@
+# Maze Profile
+# timers and counters around the phases of the maze programs
+# set MAZE_PROFILE=1 to print how long each phase took and percentiles of
+# each sampled time when the program exits, and MAZE_PROFILE_STATS to a
+# file name to save cProfile stats of the whole run. Either can be set
+# without the other
+# without MAZE_PROFILE, timed gives back the function itself and phase,
+# count and sample do next to nothing
+
+import os
+import sys
+import time
+import atexit
+import functools
+
+ENABLED = os.environ.get("MAZE_PROFILE","") not in ("","0")
+STATS_FILE = os.environ.get("MAZE_PROFILE_STATS") or None
+
+phases = dict()   # [num calls,total seconds,longest seconds] of each phase
+counters = dict() # total of each counter
+samples = dict()  # list of seconds of each sampled time
+profiler = None   # cProfile.Profile when saving stats
+
+class Phase:
+    '''Times one run of a phase'''
+
+    def __init__(self,name):
+        '''Phase(name) -> Phase
+        name: str name of the phase'''
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self,*exception):
+        seconds = time.perf_counter() - self.start
+        if self.name not in phases:
+            phases[self.name] = [0,0.0,0.0]
+        stats = phases[self.name]
+        stats[0] += 1
+        stats[1] += seconds
+        stats[2] = max(stats[2],seconds)
+
+class NoPhase:
+    '''Stands in for Phase when profiling is off'''
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self,*exception):
+        pass
+
+NO_PHASE = NoPhase()
+
+def phase(name):
+    '''phase(name) -> Phase
+    returns a context manager that times the code in its with block
+    name: str name of the phase'''
+    if not ENABLED:
+        return NO_PHASE
+    return Phase(name)
+
+def timed(name):
+    '''timed(name) -> function
+    returns a decorator that times each call of a function as a phase
+    when profiling is off the function is left as it is
+    name: str name of the phase'''
+    def decorate(function):
+        if not ENABLED:
+            return function
+        @functools.wraps(function)
+        def timed_function(*args,**kwargs):
+            with Phase(name):
+                return function(*args,**kwargs)
+        return timed_function
+    return decorate
+
+def count(name,amount=1):
+    '''count(name,[amount])
+    adds amount to a counter
+    name: str name of the counter
+    amount: int (default 1)'''
+    if ENABLED:
+        counters[name] = counters.get(name,0) + amount
+
+def sample(name,seconds):
+    '''sample(name,seconds)
+    records one time, to be summed up as percentiles
+    name: str name of what was timed
+    seconds: float'''
+    if ENABLED:
+        if name not in samples:
+            samples[name] = []
+        samples[name].append(seconds)
+
+def get_percentile(values,percent):
+    '''get_percentile(values,percent) -> float
+    returns the smallest of values that percent of values are at or under
+    values: sorted list of numbers
+    percent: number from 0 to 100'''
+    rank = max(int(-(-percent * len(values) // 100)),1) # rounded up
+    return values[rank - 1]
+
+def get_summary():
+    '''get_summary() -> str
+    returns a table of the phases, in the order they first ended, the
+    counters and the percentiles of the samples'''
+    lines = ["%-32s %8s %10s %10s %10s" % ("phase","calls","total ms","mean ms","max ms")]
+    for name,(calls,total,longest) in phases.items():
+        lines.append("%-32s %8d %10.1f %10.2f %10.2f" % (name,calls,1000 * total,
+            1000 * total / calls,1000 * longest))
+    for name,amount in counters.items():
+        lines.append("%-32s %8d" % (name,amount))
+    if len(samples) > 0:
+        lines.append("%-44s %8s %8s %8s %8s %8s" % ("sampled","count","p50 ms","p95 ms","p99 ms","max ms"))
+    for name,values in samples.items():
+        values = sorted(values)
+        lines.append("%-44s %8d %8.2f %8.2f %8.2f %8.2f" % ((name,len(values)) +
+            tuple(1000 * get_percentile(values,percent) for percent in (50,95,99,100))))
+    return "\n".join(lines)
+
+def report():
+    '''report()
+    writes the summary to stderr if profiling is on and saves the cProfile
+    stats if asked'''
+    if profiler != None:
+        profiler.disable()
+        profiler.dump_stats(STATS_FILE)
+    if ENABLED:
+        sys.stderr.write(get_summary() + "\n")
+    if profiler != None:
+        sys.stderr.write("cProfile stats saved to " + STATS_FILE + "\n")
+
+if ENABLED or STATS_FILE != None:
+    atexit.register(report)
+if STATS_FILE != None:
+    import cProfile
+    profiler = cProfile.Profile()
+    profiler.enable()
@@ -0,0 +1,202 @@
+# Maze Render
+# draws a board of cell states on the turtle canvas as a few tile images
+# instead of one stamp per cell
+
+import tkinter
+from maze_engine import MazeGrid
+from maze_profile import timed, count
+
+class TileRenderer:
+    '''Draws the cells of a board with a fixed pool of tile images that
+    follow the view around the canvas'''
+
+    def __init__(self,screen,board,blockSize,center,colors,tileSize=256,tag="maze"):
+        '''TileRenderer(screen,board,blockSize,center,colors,[tileSize],[tag]) -> TileRenderer
+        creates the tile images for board on screen. Nothing is drawn until
+        update is called
+        the number of tiles only depends on the window size, not the board
+        screen: turtle screen to draw on
+        board: MazeGrid of cell states
+        blockSize: int width of each cell in pixels
+        center: int row and column of the cell at (0,0)
+        colors: dict of cell state to color string or tuple. States that
+            aren't in it are left see through
+        tileSize: int rough width of each tile in pixels (default 256)
+        tag: str canvas tag of the tile images (default "maze")'''
+        self.screen = screen
+        self.canvas = screen.getcanvas()
+        self.board = board
+        self.blockSize = blockSize
+        self.center = center
+        self.tag = tag
+
+        # Tk wants "#rrggbb" colors when filling an image
+        self.colors = dict()
+        for state,color in colors.items():
+            self.colors[state] = self.get_hex(color)
+
+        # each tile is a square of whole cells
+        self.tileCells = max(1,tileSize // self.blockSize)
+        self.tileWidth = self.tileCells * self.blockSize
+        self.numTileRows = (self.board.get_height() - 1) // self.tileCells + 1
+        self.numTileCols = (self.board.get_width() - 1) // self.tileCells + 1
+
+        self.images = []      # tile image of each slot
+        self.items = []       # canvas item of each slot
+        self.tiles = []       # (row,col) of the tile each slot shows
+        self.slots = dict()   # slot showing each tile
+        self.view = None      # tiles in view when last updated
+
+    def get_hex(self,color):
+        '''TileRenderer.get_hex(color) -> str
+        returns color as a "#rrggbb" string
+        color: turtle color string or tuple'''
+        if isinstance(color,tuple): # turtle color tuple
+            if self.screen.colormode() == 1.0:
+                color = tuple(round(255 * value) for value in color)
+            return "#%02x%02x%02x" % tuple(color)
+        red,green,blue = self.canvas.winfo_rgb(color) # 16 bit values
+        return "#%02x%02x%02x" % (red // 256,green // 256,blue // 256)
+
+    def get_tile_coord(self,tile):
+        '''TileRenderer.get_tile_coord(tile) -> x,y
+        returns the canvas coordinates of the top left corner of tile
+        tile: tuple (row,col) of a tile'''
+        x = (tile[1] * self.tileCells - self.center - 0.5) * self.blockSize
+        y = (tile[0] * self.tileCells - self.center - 0.5) * self.blockSize
+        return x,y
+
+    def get_tile(self,cell):
+        '''TileRenderer.get_tile(cell) -> tuple
+        returns the (row,col) of the tile cell is in
+        cell: int index of a cell on the board'''
+        row,col = divmod(cell,self.board.get_width())
+        return row // self.tileCells,col // self.tileCells
+
+    def get_view(self):
+        '''TileRenderer.get_view() -> tuple
+        returns the first tile row, last tile row, first tile column and
+        last tile column in the part of the canvas that can be seen'''
+        left = self.canvas.canvasx(0)
+        top = self.canvas.canvasy(0)
+        right = left + self.screen.window_width()
+        bottom = top + self.screen.window_height()
+
+        # canvas coordinate to tile row or column, kept on the board
+        def to_tile(coord,numTiles):
+            tile = int((coord / self.blockSize + self.center + 0.5) // self.tileCells)
+            if numTiles == None: # board with no edge
+                return tile
+            return min(max(tile,0),numTiles - 1)
+
+        return (to_tile(top,self.numTileRows),to_tile(bottom,self.numTileRows),
+            to_tile(left,self.numTileCols),to_tile(right,self.numTileCols))
+
+    def add_slot(self):
+        '''TileRenderer.add_slot() -> int
+        adds an empty tile image to the canvas and returns its slot
+        it goes under the other tiles, so things drawn since the first
+        tile stay on top'''
+        image = tkinter.PhotoImage(master=self.canvas,width=self.tileWidth,height=self.tileWidth)
+        item = self.canvas.create_image(0,0,image=image,anchor="nw",tags=self.tag)
+        if len(self.items) > 0:
+            self.canvas.tag_lower(item,self.items[0])
+        self.images.append(image)
+        self.items.append(item)
+        self.tiles.append(None)
+        return len(self.tiles) - 1
+
+    def get_rows(self,tile):
+        '''TileRenderer.get_rows(tile) -> list
+        returns the cells of tile, a bytes for each row
+        tile: tuple (row,col) of a tile'''
+        cells = self.board.cells
+        boardWidth = self.board.get_width()
+        firstRow = tile[0] * self.tileCells
+        firstCol = tile[1] * self.tileCells
+        lastRow = min(firstRow + self.tileCells,self.board.get_height())
+        lastCol = min(firstCol + self.tileCells,boardWidth)
+        return [cells[row * boardWidth + firstCol:row * boardWidth + lastCol] for row in range(firstRow,lastRow)]
+
+    def draw_tile(self,slot,tile):
+        '''TileRenderer.draw_tile(slot,tile)
+        draws tile into the image of slot and moves it into place
+        each run of cells with the same color is one fill
+        slot: int slot to draw in
+        tile: tuple (row,col) of the tile to draw'''
+        # the slot doesn't show its old tile anymore
+        if self.tiles[slot] != None:
+            del self.slots[self.tiles[slot]]
+        self.tiles[slot] = tile
+        self.slots[tile] = slot
+
+        count("tiles drawn")
+        image = self.images[slot]
+        image.blank()
+        blockSize = self.blockSize
+
+        for row,rowCells in enumerate(self.get_rows(tile)):
+            y = row * blockSize
+            runStart = 0
+            for col in range(1,len(rowCells) + 1):
+                # fill the run when it ends
+                if col == len(rowCells) or rowCells[col] != rowCells[runStart]:
+                    color = self.colors.get(rowCells[runStart])
+                    if color != None:
+                        image.put(color,to=(runStart * blockSize,y,col * blockSize,y + blockSize))
+                    runStart = col
+
+        self.canvas.coords(self.items[slot],*self.get_tile_coord(tile))
+
+    @timed("TileRenderer.update")
+    def update(self):
+        '''TileRenderer.update()
+        draws the tiles that came into view in the slots of tiles that
+        went out of view. Does nothing if the same tiles are in view'''
+        view = self.get_view()
+        if view == self.view:
+            return
+        self.view = view
+        firstRow,lastRow,firstCol,lastCol = view
+        inView = set((row,col) for row in range(firstRow,lastRow + 1)
+            for col in range(firstCol,lastCol + 1))
+
+        # slots that can be drawn over
+        free = [slot for slot,tile in enumerate(self.tiles) if tile not in inView]
+        for tile in inView:
+            if tile not in self.slots:
+                if len(free) > 0:
+                    slot = free.pop()
+                else: # the view got bigger
+                    slot = self.add_slot()
+                self.draw_tile(slot,tile)
+
+class ChunkRenderer(TileRenderer):
+    '''Draws an endless ChunkWorld (see maze_chunks) with a tile for
+    each chunk. Chunks are only generated when their tile comes into view'''
+
+    def __init__(self,screen,world,blockSize,colors,tag="maze"):
+        '''ChunkRenderer(screen,world,blockSize,colors,[tag]) -> ChunkRenderer
+        creates the tile images for world on screen. Nothing is drawn
+        until update is called
+        the cell at row 0 and column 0 of the world is at (0,0)
+        screen: turtle screen to draw on
+        world: ChunkWorld
+        blockSize: int width of each cell in pixels
+        colors: dict of cell state to color string or tuple
+        tag: str canvas tag of the tile images (default "maze")'''
+        self.world = world
+        chunkSize = world.get_chunk_size()
+        TileRenderer.__init__(self,screen,MazeGrid(chunkSize,chunkSize),blockSize,0,colors,
+            chunkSize * blockSize,tag)
+        # the world has no edge
+        self.numTileRows = None
+        self.numTileCols = None
+
+    def get_rows(self,tile):
+        '''ChunkRenderer.get_rows(tile) -> list
+        returns the cells of the chunk tile shows, a bytes for each row
+        tile: tuple (row,col) of a chunk'''
+        chunk = self.world.get_chunk(*tile)
+        width = chunk.get_width()
+        return [chunk.cells[row * width:(row + 1) * width] for row in range(chunk.get_height())]
@@ -0,0 +1,177 @@
+# Maze Solver
+# finds paths through a board using its moves table (see MazeGrid.get_moves)
+# so hints, difficulty scores and auto play don't search again and again
+
+import heapq
+from array import array
+
+NO_STEP = 255 # next step of cells that can't reach a goal, or are goals
+
+class MazeSolver:
+    '''Finds paths through a board from its moves table'''
+
+    def __init__(self,moves,offsets,goals):
+        '''MazeSolver(moves,offsets,goals) -> MazeSolver
+        creates a solver for the board with the moves table moves
+        the distance field to the goals is only worked out the first time
+        it's needed, then kept
+        moves: bytearray moves table of the board
+        offsets: tuple index offsets to the next cell up, right, down and left
+        goals: list of int cells to find the way to'''
+        self.moves = moves
+        self.offsets = offsets
+        self.width = offsets[2] # num cells in a row
+        self.goals = goals
+        self.distances = None # steps from each cell to the nearest goal, -1 if none
+        self.nextSteps = None # direction of the first step from each cell
+
+    def get_came_from(self,cell):
+        '''MazeSolver.get_came_from(cell) -> list
+        returns (cell,direction) for each cell next to cell that can step
+        onto it in direction
+        cell: int'''
+        cameFrom = []
+        for direction,offset in enumerate(self.offsets):
+            before = cell - offset
+            # the moves table already leaves out steps that wrap rows
+            if 0 <= before < len(self.moves) and self.moves[before] & 1 << direction:
+                cameFrom.append((before,direction))
+        return cameFrom
+
+    def find_distances(self):
+        '''MazeSolver.find_distances()
+        works out the distance to the nearest goal and the first step
+        toward it from every cell with one breadth first search backwards
+        from the goals'''
+        self.distances = array("i",[-1]) * len(self.moves)
+        self.nextSteps = bytearray([NO_STEP]) * len(self.moves)
+        queue = list(self.goals)
+        for cell in queue:
+            self.distances[cell] = 0
+        # the queue is never shortened, the search just walks along it
+        for cell in queue:
+            distance = self.distances[cell] + 1
+            for before,direction in self.get_came_from(cell):
+                if self.distances[before] == -1:
+                    self.distances[before] = distance
+                    self.nextSteps[before] = direction
+                    queue.append(before)
+
+    def get_distance(self,cell):
+        '''MazeSolver.get_distance(cell) -> int
+        returns the num steps from cell to the nearest goal, or -1 if no
+        goal can be reached. Good for scoring how hard a maze is
+        only means something for cells the player can be on
+        cell: int'''
+        if self.distances == None:
+            self.find_distances()
+        return self.distances[cell]
+
+    def get_next_step(self,cell):
+        '''MazeSolver.get_next_step(cell) -> int
+        returns the direction of the first step on a shortest path from
+        cell to a goal, or None if cell is a goal or can't reach one
+        cell: int'''
+        if self.nextSteps == None:
+            self.find_distances()
+        direction = self.nextSteps[cell]
+        if direction == NO_STEP:
+            return None
+        return direction
+
+    def get_steps(self,cell,numSteps=None):
+        '''MazeSolver.get_steps(cell,[numSteps]) -> list
+        returns the directions of the first numSteps steps on a shortest
+        path from cell to a goal, or all of them if numSteps is None
+        cell: int
+        numSteps: int or None (default None)'''
+        steps = []
+        direction = self.get_next_step(cell)
+        while direction != None and (numSteps == None or len(steps) < numSteps):
+            steps.append(direction)
+            cell += self.offsets[direction]
+            direction = self.get_next_step(cell)
+        return steps
+
+    def find_path(self,start,end):
+        '''MazeSolver.find_path(start,end) -> list
+        returns the cells of a shortest path from start to end, both
+        included, or None if there isn't one
+        searches forward from start and backward from end a layer at a
+        time, smaller side first, until they meet
+        start,end: int cells'''
+        if start == end:
+            return [start]
+        forward = {start: None}  # cell each cell was reached from
+        backward = {end: None}
+        forwardLayer = [start]
+        backwardLayer = [end]
+        while len(forwardLayer) > 0 and len(backwardLayer) > 0:
+            if len(forwardLayer) <= len(backwardLayer):
+                nextLayer = []
+                for cell in forwardLayer:
+                    for direction,offset in enumerate(self.offsets):
+                        if self.moves[cell] & 1 << direction and cell + offset not in forward:
+                            forward[cell + offset] = cell
+                            if cell + offset in backward:
+                                return self.join_path(forward,backward,cell + offset)
+                            nextLayer.append(cell + offset)
+                forwardLayer = nextLayer
+            else:
+                nextLayer = []
+                for cell in backwardLayer:
+                    for before,direction in self.get_came_from(cell):
+                        if before not in backward:
+                            backward[before] = cell
+                            if before in forward:
+                                return self.join_path(forward,backward,before)
+                            nextLayer.append(before)
+                backwardLayer = nextLayer
+        return None
+
+    def join_path(self,forward,backward,meeting):
+        '''MazeSolver.join_path(forward,backward,meeting) -> list
+        returns the path through meeting from the cells each search
+        was reached from
+        forward,backward: dict of cell to the cell it was reached from
+        meeting: int cell both searches reached'''
+        path = []
+        cell = meeting
+        while cell != None:
+            path.append(cell)
+            cell = forward[cell]
+        path.reverse()
+        cell = backward[meeting]
+        while cell != None:
+            path.append(cell)
+            cell = backward[cell]
+        return path
+
+    def find_path_astar(self,start,end):
+        '''MazeSolver.find_path_astar(start,end) -> list
+        returns the cells of a shortest path from start to end, both
+        included, or None if there isn't one
+        A* search guided by the row and column distance to end, which
+        looks at fewer cells than find_path in open ground
+        start,end: int cells'''
+        endRow,endCol = divmod(end,self.width)
+        cameFrom = {start: None}
+        steps = {start: 0}
+        frontier = [(0,start)]
+        while len(frontier) > 0:
+            estimate,cell = heapq.heappop(frontier)
+            if cell == end:
+                path = []
+                while cell != None:
+                    path.append(cell)
+                    cell = cameFrom[cell]
+                path.reverse()
+                return path
+            for direction,offset in enumerate(self.offsets):
+                after = cell + offset
+                if self.moves[cell] & 1 << direction and steps[cell] + 1 < steps.get(after,len(self.moves)):
+                    steps[after] = steps[cell] + 1
+                    cameFrom[after] = cell
+                    row,col = divmod(after,self.width)
+                    heapq.heappush(frontier,(steps[after] + abs(row - endRow) + abs(col - endCol),after))
+        return None
@@ -0,0 +1,272 @@
+# Test Mazes
+# checks the parts of the maze programs that don't need turtle or Tk:
+# every generator makes a perfect maze and the same maze for a seed, maze
+# files load as they were saved, the solver finds shortest paths, endless
+# chunks join up, and the cache and parallel generator give what
+# generate would
+# run with python -m unittest test_mazes
+
+import os
+import shutil
+import tempfile
+import unittest
+from collections import deque
+from maze_engine import ENGINE_VERSION, GENERATORS, PASSAGE, OUTSIDE, check_size, generate
+from maze_layout import LAYOUT_VERSION
+from maze_format import MazeFile, load_maze, save_maze, save_rows
+from maze_solver import MazeSolver
+from maze_chunks import ChunkWorld
+from maze_cache import MazeCache
+from maze_parallel import generate_parallel
+
+def get_open_cells(grid,openStates=(PASSAGE,)):
+    '''get_open_cells(grid,[openStates]) -> set
+    returns the indexes of the cells with a state in openStates
+    grid: MazeGrid
+    openStates: collection of int cell states'''
+    return set(index for index,state in enumerate(grid.cells) if state in openStates)
+
+def get_bfs_distances(grid,start,openStates=(PASSAGE,)):
+    '''get_bfs_distances(grid,start,[openStates]) -> dict
+    returns the num steps from start to each cell it can reach, found
+    the plain way, to check the faster code against
+    grid: MazeGrid
+    start: int cell
+    openStates: collection of int cell states'''
+    width = grid.get_width()
+    distances = {start: 0}
+    queue = deque([start])
+    while len(queue) > 0:
+        cell = queue.popleft()
+        row,col = divmod(cell,width)
+        for rowStep,colStep in ((-1,0),(0,1),(1,0),(0,-1)):
+            nextRow,nextCol = row + rowStep,col + colStep
+            if not grid.in_grid(nextRow,nextCol):
+                continue
+            nextCell = nextRow * width + nextCol
+            if nextCell not in distances and grid.cells[nextCell] in openStates:
+                distances[nextCell] = distances[cell] + 1
+                queue.append(nextCell)
+    return distances
+
+class PerfectMazeTestCase(unittest.TestCase):
+    '''Adds a check that a grid holds a perfect maze'''
+
+    def assertPerfectMaze(self,grid):
+        '''PerfectMazeTestCase.assertPerfectMaze(grid)
+        fails unless the outside of grid is wall, every cell with odd row
+        and column is a passage, and every passage can be reached from
+        every other in exactly one way
+        grid: MazeGrid'''
+        width,height = grid.get_width(),grid.get_height()
+        self.assertEqual((width % 2,height % 2),(1,1))
+        passages = get_open_cells(grid)
+        for cell in passages:
+            row,col = divmod(cell,width)
+            self.assertTrue(0 < row < height - 1 and 0 < col < width - 1,"passage on the outside wall")
+        for row in range(1,height,2):
+            for col in range(1,width,2):
+                self.assertIn(row * width + col,passages)
+        # connected with one less join than cells is a tree
+        self.assertEqual(len(get_bfs_distances(grid,width + 1)),len(passages))
+        joins = sum(1 for cell in passages for offset in (1,width) if cell + offset in passages)
+        self.assertEqual(joins,len(passages) - 1)
+
+class TestGenerators(PerfectMazeTestCase):
+
+    def test_perfect(self):
+        for algorithm in GENERATORS:
+            for width,height in ((3,3),(4,7),(31,21)):
+                with self.subTest(algorithm=algorithm,width=width,height=height):
+                    self.assertPerfectMaze(generate(algorithm,width,height,7))
+
+    def test_same_seed(self):
+        for algorithm in GENERATORS:
+            with self.subTest(algorithm=algorithm):
+                first = generate(algorithm,41,25,12345)
+                self.assertEqual(first.cells,generate(algorithm,41,25,12345).cells)
+                self.assertNotEqual(first.cells,generate(algorithm,41,25,54321).cells)
+
+    def test_bad_size(self):
+        for width,height in ((2,3),(3,2),(0,0),(-5,9)):
+            with self.subTest(width=width,height=height):
+                self.assertRaises(ValueError,check_size,width,height)
+                self.assertRaises(ValueError,generate,"kruskal",width,height,1)
+        self.assertRaises(ValueError,generate,"no-such-algorithm",9,9,1)
+
+class TestFormat(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory,"test.maze")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_round_trip(self):
+        for seed in (None,0,2 ** 63 - 1,-2 ** 63):
+            with self.subTest(seed=seed):
+                grid = generate("eller",23,15,5)
+                save_maze(self.filename,grid,"eller",seed)
+                self.assertEqual(load_maze(self.filename).cells,grid.cells)
+                with MazeFile(self.filename) as mazeFile:
+                    self.assertEqual((mazeFile.get_width(),mazeFile.get_height()),(23,15))
+                    self.assertEqual(mazeFile.get_algorithm(),"eller")
+                    self.assertEqual(mazeFile.get_seed(),seed)
+                    self.assertEqual(mazeFile.get_cell(1,1),grid.get_cell(1,1))
+
+    def test_bad_save(self):
+        grid = generate("kruskal",9,9,1)
+        rows = [grid.cells[row * 9:(row + 1) * 9] for row in range(9)]
+        badSaves = (
+            ("kruskal",2 ** 63,rows),     # seed too big
+            ("x" * 17,1,rows),            # name too long
+            ("kruskal",1,rows[:-1]),      # too few rows
+            ("kruskal",1,rows[:-1] + [b"\x01" * 8]) # short row
+        )
+        for algorithm,seed,saveRows in badSaves:
+            with self.subTest(algorithm=algorithm,seed=seed,numRows=len(saveRows)):
+                self.assertRaises(ValueError,save_rows,self.filename,iter(saveRows),9,9,algorithm,seed)
+                self.assertEqual(os.listdir(self.directory),[])
+
+    def test_bad_file(self):
+        with open(self.filename,"wb") as mazeFile:
+            mazeFile.write(b"not a maze file at all")
+        self.assertRaises(ValueError,load_maze,self.filename)
+
+class TestSolver(unittest.TestCase):
+
+    def setUp(self):
+        self.grid = generate("backtracker",31,31,3)
+        self.width = self.grid.get_width()
+        self.goal = 29 * self.width + 29
+        self.solver = MazeSolver(self.grid.get_moves((PASSAGE,)),self.grid.get_offsets(),[self.goal])
+        self.distances = get_bfs_distances(self.grid,self.goal)
+
+    def test_distances(self):
+        for cell in get_open_cells(self.grid):
+            self.assertEqual(self.solver.get_distance(cell),self.distances[cell])
+        self.assertEqual(self.solver.get_distance(0),-1) # outside wall
+
+    def test_steps(self):
+        start = self.width + 1
+        cell = start
+        for direction in self.solver.get_steps(start):
+            cell += self.grid.get_offsets()[direction]
+            self.assertIn(cell,self.distances)
+        self.assertEqual(cell,self.goal)
+        self.assertEqual(len(self.solver.get_steps(start)),self.distances[start])
+
+    def test_find_path(self):
+        passages = sorted(get_open_cells(self.grid))
+        for start in passages[::37]:
+            startDistances = get_bfs_distances(self.grid,start)
+            for end in passages[::53]:
+                for path in (self.solver.find_path(start,end),self.solver.find_path_astar(start,end)):
+                    self.assertEqual((path[0],path[-1]),(start,end))
+                    self.assertEqual(len(path) - 1,startDistances[end])
+                    for before,after in zip(path,path[1:]):
+                        self.assertIn(after - before,self.grid.get_offsets())
+
+    def test_no_path(self):
+        self.assertEqual(self.solver.find_path(self.width + 1,0),None)
+
+class TestChunks(unittest.TestCase):
+
+    def get_window(self,world,size):
+        '''TestChunks.get_window(world,size) -> dict
+        returns the state of each (row,col) in a size x size window of
+        world, read column by column so chunks are thrown away and made
+        again on the way
+        world: ChunkWorld
+        size: int'''
+        return dict(((row,col),world.get_state(row,col)) for col in range(-size,size)
+            for row in range(-size,size))
+
+    def test_connected(self):
+        world = ChunkWorld(99,8)
+        size = 4 * world.get_chunk_size() # 8 x 8 chunks
+        states = self.get_window(world,size)
+        openCells = set(cell for cell,state in states.items() if state in (PASSAGE,OUTSIDE))
+        # everything inside the window but the last chunk row and column
+        # joins up, since those are only joined through the next chunks
+        inner = set((row,col) for row,col in openCells if row < size - world.get_chunk_size()
+            and col < size - world.get_chunk_size())
+        start = min(inner)
+        found = {start}
+        queue = deque([start])
+        while len(queue) > 0:
+            row,col = queue.popleft()
+            for nextCell in ((row - 1,col),(row,col + 1),(row + 1,col),(row,col - 1)):
+                if nextCell in openCells and nextCell not in found:
+                    found.add(nextCell)
+                    queue.append(nextCell)
+        self.assertTrue(inner <= found)
+
+    def test_same_after_eviction(self):
+        world = ChunkWorld(4,8,maxChunks=4)
+        states = self.get_window(world,24)
+        self.assertGreater(world.numMade,36) # chunks were made again
+        self.assertEqual(self.get_window(ChunkWorld(4,8),24),states)
+        self.assertNotEqual(self.get_window(ChunkWorld(5,8),24),states)
+
+    def test_directions(self):
+        world = ChunkWorld(7,8)
+        for row in range(-8,8):
+            for col in range(-8,8):
+                for direction in world.get_directions(row,col):
+                    rowStep,colStep = ((-1,0),(0,1),(1,0),(0,-1))[direction]
+                    self.assertIn(world.get_state(row + rowStep,col + colStep),(PASSAGE,OUTSIDE))
+
+class TestCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache = MazeCache(self.directory)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_generate(self):
+        grid = self.cache.generate("prim",25,25,8)
+        self.assertEqual(grid.cells,generate("prim",25,25,8).cells)
+        self.assertEqual(len(os.listdir(self.directory)),1)
+        self.assertEqual(self.cache.generate("prim",25,25,8).cells,grid.cells)
+
+    def test_bad_seed(self):
+        grid = self.cache.generate("prim",9,9,2 ** 70) # too big for a maze file
+        self.assertEqual(grid.cells,generate("prim",9,9,2 ** 70).cells)
+        self.assertEqual(os.listdir(self.directory),[])
+
+    def test_world(self):
+        layout = {"ground": [1,2,3],"colors": {1: (0,0,0)}}
+        self.cache.save_world(layout,"a",1)
+        self.assertEqual(self.cache.load_world("a",1),layout)
+        self.assertEqual(self.cache.load_world("a",2),None)
+
+    def test_broken_world(self):
+        self.cache.save_world({"ground": [1]},"a")
+        path = self.cache.get_path("world",LAYOUT_VERSION,ENGINE_VERSION,"a")
+        with open(path,"rb") as worldFile:
+            data = bytearray(worldFile.read())
+        data[-1] ^= 0xff
+        with open(path,"wb") as worldFile:
+            worldFile.write(data)
+        self.assertEqual(self.cache.load_world("a"),None)
+
+class TestParallel(PerfectMazeTestCase):
+
+    def test_perfect(self):
+        for tileSize in (5,8,101):
+            with self.subTest(tileSize=tileSize):
+                self.assertPerfectMaze(generate_parallel("kruskal",41,31,6,tileSize,1))
+
+    def test_same_for_any_processes(self):
+        grid = generate_parallel("growing-tree",41,41,10,11,1)
+        self.assertEqual(generate_parallel("growing-tree",41,41,10,11,2).cells,grid.cells)
+
+    def test_bad_size(self):
+        self.assertRaises(ValueError,generate_parallel,"kruskal",2,9,1)
+
+if __name__ == "__main__":
+    unittest.main()